@@ -5,7 +5,7 @@ FastAPI endpoints for voice agent management with tenant isolation
 from typing import List, Dict, Any
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from src.services.voice_agent_service import VoiceAgentService
+from src.services.voice_agent_service import AsyncVoiceAgentService, VoiceAgentService
 from src.schemas.voice_agent_schemas import (
     VoiceAgentCreateRequest,
     VoiceAgentUpdateRequest,
@@ -157,13 +157,13 @@ async def list_voice_agents(
     Returns paginated list of voice agents owned by the tenant.
     """
     try:
-        service = VoiceAgentService()
+        service = AsyncVoiceAgentService()
         
         # Extract tenant ID from authenticated user
         tenant_id = current_user['tenant_id']
         
-        # Get agents for tenant
-        agents = service.get_agents_for_tenant(tenant_id)
+        # Get agents for tenant without blocking the event loop
+        agents = await service.get_agents_for_tenant(tenant_id)
         
         # Apply pagination (simplified for now)
         total = len(agents)
@@ -2,8 +2,9 @@
 Knowledge Categories Schema
 18-category knowledge base structure with validation and extraction rules
 """
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field, validator
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Type
+from pydantic import BaseModel, Field, TypeAdapter, validator
 from datetime import datetime
 
 
@@ -29,6 +30,11 @@ KNOWLEDGE_CATEGORIES = [
     'special_offers'        # Promotions and special offers
 ]
 
+_KNOWLEDGE_CATEGORY_SET = frozenset(KNOWLEDGE_CATEGORIES)
+
+# Read-only knowledge base with every category empty; copy before mutating
+EMPTY_KNOWLEDGE_BASE = MappingProxyType(dict.fromkeys(KNOWLEDGE_CATEGORIES))
+
 
 class KnowledgeCategoryData(BaseModel):
     """Individual knowledge category data structure"""
@@ -76,14 +82,43 @@ class KnowledgeCategoriesSchema(BaseModel):
         return populated
 
 
+# Model that validates each category's data; categories share one model today
+_CATEGORY_VALIDATORS: Dict[str, Type[BaseModel]] = dict.fromkeys(KNOWLEDGE_CATEGORIES, KnowledgeCategoryData)
+
+
+def _validator_for(category_name: str) -> Type[BaseModel]:
+    """
+    Get the model that validates a category's data
+    """
+    try:
+        return _CATEGORY_VALIDATORS[category_name]
+    except KeyError:
+        raise ValueError(f"Invalid category: {category_name}. Must be one of {KNOWLEDGE_CATEGORIES}") from None
+
+
 def validate_knowledge_category(category_name: str, data: Dict[str, Any]) -> KnowledgeCategoryData:
     """
     Validate individual knowledge category data
     """
-    if category_name not in KNOWLEDGE_CATEGORIES:
-        raise ValueError(f"Invalid category: {category_name}. Must be one of {KNOWLEDGE_CATEGORIES}")
+    return _validator_for(category_name).model_validate(data)
+
+
+# Validates and dumps a whole knowledge base in one pass through pydantic-core
+_KNOWLEDGE_BASE_ADAPTER = TypeAdapter(Dict[str, Optional[KnowledgeCategoryData]])
+
+
+def validate_knowledge_base(knowledge_base: Dict[str, Any]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Validate every category of a knowledge base and return it as plain dictionaries
+    Empty (None) categories are kept as None without checking their names
+    """
+    if not _KNOWLEDGE_CATEGORY_SET.issuperset(knowledge_base):
+        # Report the first populated unknown category, as per-category validation would
+        for name, data in knowledge_base.items():
+            if data is not None and name not in _KNOWLEDGE_CATEGORY_SET:
+                _validator_for(name)
     
-    return KnowledgeCategoryData(**data)
+    return _KNOWLEDGE_BASE_ADAPTER.dump_python(_KNOWLEDGE_BASE_ADAPTER.validate_python(knowledge_base))
 
 
 def validate_category_data(category_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -91,7 +126,7 @@ def validate_category_data(category_name: str, data: Dict[str, Any]) -> Dict[str
     Validate and return category data as dictionary
     Enhanced validation with structured data support
     """
-    if category_name not in KNOWLEDGE_CATEGORIES:
+    if category_name not in _KNOWLEDGE_CATEGORY_SET:
         raise ValueError(f"Invalid category: {category_name}. Must be one of {KNOWLEDGE_CATEGORIES}")
     
     # Validate required fields
@@ -119,93 +154,106 @@ def validate_category_data(category_name: str, data: Dict[str, Any]) -> Dict[str
         'keywords': data.get('keywords', []),
         'confidence_score': data.get('confidence_score', 1.0),
         'source_url': data.get('source_url'),
-        'last_updated': data.get('last_updated', datetime.now().isoformat()),
+        'last_updated': data['last_updated'] if 'last_updated' in data else datetime.now().isoformat(),
         'structured_data': data.get('structured_data', {})
     }
     
     return validated_data
 
 
+# Crawling rules for categories with dedicated page sections
+_SPECIFIC_EXTRACTION_RULES = {
+    'company_overview': {
+        'selectors': [
+            'section[id*="about"]',
+            '.about-section',
+            'div[class*="company"]',
+            'main .hero-section',
+            '[data-section="about"]'
+        ],
+        'keywords': ['about', 'company', 'mission', 'vision', 'values', 'story', 'history'],
+        'priority_text': ['h1', 'h2', '.hero-title', '.main-heading']
+    },
+    'products_services': {
+        'selectors': [
+            '.products-section',
+            '.services-section',
+            '[id*="product"]',
+            '[id*="service"]',
+            '.catalog'
+        ],
+        'keywords': ['products', 'services', 'offerings', 'solutions', 'catalog'],
+        'priority_text': ['h2', 'h3', '.product-title', '.service-name']
+    },
+    'pricing_packages': {
+        'selectors': [
+            '.pricing-section',
+            '.packages',
+            '[id*="pricing"]',
+            '.price-table',
+            '.subscription'
+        ],
+        'keywords': ['pricing', 'price', 'cost', 'packages', 'plans', 'subscription'],
+        'priority_text': ['.price', '.cost', 'h3']
+    },
+    'contact_information': {
+        'selectors': [
+            '.contact-section',
+            'footer',
+            '[id*="contact"]',
+            '.contact-info',
+            '.footer-contact'
+        ],
+        'keywords': ['contact', 'phone', 'email', 'address', 'location'],
+        'priority_text': ['.phone', '.email', '.address']
+    },
+    'business_hours': {
+        'selectors': [
+            '.hours',
+            '.business-hours',
+            '[id*="hours"]',
+            '.schedule',
+            '.opening-hours'
+        ],
+        'keywords': ['hours', 'open', 'closed', 'schedule', 'availability'],
+        'priority_text': ['.hours', '.schedule']
+    }
+    # Additional categories would follow the same pattern...
+}
+
+
+def _default_extraction_rules(category_name: str) -> Dict[str, List[str]]:
+    """Generic rules for categories without dedicated page sections"""
+    return {
+        'selectors': ['main', '.main-content', 'article'],
+        'keywords': [category_name.replace('_', ' ')],
+        'priority_text': ['h1', 'h2', 'h3']
+    }
+
+
+# Read-only rules for every category, built once; get_extraction_rules hands out copies
+_EXTRACTION_RULES = MappingProxyType({
+    category: _SPECIFIC_EXTRACTION_RULES.get(category) or _default_extraction_rules(category)
+    for category in KNOWLEDGE_CATEGORIES
+})
+
+
 def get_extraction_rules(category_name: str) -> Dict[str, Any]:
     """
     Get web crawling extraction rules for each knowledge category
     """
-    if category_name not in KNOWLEDGE_CATEGORIES:
+    if category_name not in _KNOWLEDGE_CATEGORY_SET:
         raise ValueError(f"Invalid category: {category_name}")
     
-    # Define extraction rules for each category
-    extraction_rules = {
-        'company_overview': {
-            'selectors': [
-                'section[id*="about"]',
-                '.about-section',
-                'div[class*="company"]',
-                'main .hero-section',
-                '[data-section="about"]'
-            ],
-            'keywords': ['about', 'company', 'mission', 'vision', 'values', 'story', 'history'],
-            'priority_text': ['h1', 'h2', '.hero-title', '.main-heading']
-        },
-        'products_services': {
-            'selectors': [
-                '.products-section',
-                '.services-section',
-                '[id*="product"]',
-                '[id*="service"]',
-                '.catalog'
-            ],
-            'keywords': ['products', 'services', 'offerings', 'solutions', 'catalog'],
-            'priority_text': ['h2', 'h3', '.product-title', '.service-name']
-        },
-        'pricing_packages': {
-            'selectors': [
-                '.pricing-section',
-                '.packages',
-                '[id*="pricing"]',
-                '.price-table',
-                '.subscription'
-            ],
-            'keywords': ['pricing', 'price', 'cost', 'packages', 'plans', 'subscription'],
-            'priority_text': ['.price', '.cost', 'h3']
-        },
-        'contact_information': {
-            'selectors': [
-                '.contact-section',
-                'footer',
-                '[id*="contact"]',
-                '.contact-info',
-                '.footer-contact'
-            ],
-            'keywords': ['contact', 'phone', 'email', 'address', 'location'],
-            'priority_text': ['.phone', '.email', '.address']
-        },
-        'business_hours': {
-            'selectors': [
-                '.hours',
-                '.business-hours',
-                '[id*="hours"]',
-                '.schedule',
-                '.opening-hours'
-            ],
-            'keywords': ['hours', 'open', 'closed', 'schedule', 'availability'],
-            'priority_text': ['.hours', '.schedule']
-        }
-        # Additional categories would follow the same pattern...
-    }
-    
-    # Return extraction rules for the specified category, or default rules if not found
-    return extraction_rules.get(category_name, {
-        'selectors': ['main', '.main-content', 'article'],
-        'keywords': [category_name.replace('_', ' ')],
-        'priority_text': ['h1', 'h2', 'h3']
-    })
+    # Copy the lists so callers can't change the shared rules
+    return {key: list(values) for key, values in _EXTRACTION_RULES[category_name].items()}
 
 
 def get_empty_knowledge_base() -> Dict[str, Optional[Dict]]:
     """
     Get empty knowledge base structure with all 18 categories
     """
-    return {category: None for category in KNOWLEDGE_CATEGORIES}
+    return dict(EMPTY_KNOWLEDGE_BASE)
 
 
 def merge_knowledge_categories(
@@ -214,11 +262,12 @@ def merge_knowledge_categories(
 ) -> Dict[str, Any]:
     """
     Merge new knowledge category data with existing data
+    Known categories with data in new_data replace the existing ones
     """
-    merged = existing.copy()
-    
-    for category in KNOWLEDGE_CATEGORIES:
-        if category in new_data and new_data[category] is not None:
-            merged[category] = new_data[category]
-    
-    return merged
\ No newline at end of file
+    return {
+        **existing,
+        **{
+            category: data for category, data in new_data.items()
+            if data is not None and category in _KNOWLEDGE_CATEGORY_SET
+        }
+    }
\ No newline at end of file
@@ -7,7 +7,8 @@ from typing import Optional
 from firebase_admin import credentials, initialize_app, get_app
 from firebase_admin.auth import verify_id_token
 from firebase_admin.firestore import client
-from google.cloud.firestore import Client
+from firebase_admin import firestore_async
+from google.cloud.firestore import AsyncClient, Client
 import firebase_admin
 
 logger = logging.getLogger(__name__)
@@ -78,6 +79,11 @@ class FirebaseConfig:
         """Get Firestore client"""
         return client()
     
+    @property
+    def firestore_async_client(self) -> AsyncClient:
+        """Get async Firestore client"""
+        return firestore_async.client()
+    
     async def verify_token(self, token: str) -> dict:
         """
         Verify Firebase ID token and return user claims
@@ -130,4 +136,9 @@ async def verify_firebase_token(token: str) -> dict:
 
 def get_firestore_client() -> Client:
     """Get Firestore client - convenience function"""
-    return firebase_config.firestore_client
\ No newline at end of file
+    return firebase_config.firestore_client
+
+
+def get_async_firestore_client() -> AsyncClient:
+    """Get async Firestore client - convenience function"""
+    return firebase_config.firestore_async_client
\ No newline at end of file
@@ -53,7 +53,7 @@ class KnowledgeBaseService:
             try:
                 # Use existing validation logic
                 validated_category = validate_knowledge_category(category, data)
-                validated_data[category] = validated_category.dict()
+                validated_data[category] = validated_category.model_dump()
             except Exception:
                 # Skip invalid categories
                 continue
@@ -514,7 +514,7 @@ class AgentCreationPipeline:
                 if category_name in KNOWLEDGE_CATEGORIES:
                     try:
                         validated_data = validate_knowledge_category(category_name, category_data)
-                        knowledge_base[category_name] = validated_data.dict()
+                        knowledge_base[category_name] = validated_data.model_dump()
                     except Exception as e:
                         logger.warning(f"Failed to validate category {category_name}: {str(e)}")
                         continue
@@ -2,8 +2,20 @@
 Twilio phone integration services for voice calls and SMS.
 """
 
-from .twilio_client import TwilioClient
-from .phone_service import PhoneService
-from .call_handler import CallHandler
+import importlib
 
-__all__ = ['TwilioClient', 'PhoneService', 'CallHandler']
\ No newline at end of file
+# Submodules load on first attribute access so importing e.g. secure_twilio_client
+# does not pull in the Twilio SDK through twilio_client
+_EXPORTS = {
+    'TwilioClient': '.twilio_client',
+    'PhoneService': '.phone_service',
+    'CallHandler': '.call_handler'
+}
+
+__all__ = ['TwilioClient', 'PhoneService', 'CallHandler']
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,104 @@
+"""
+Columnar storage for call session analytics.
+
+Numeric call fields are mirrored into parallel arrays indexed by a slot ID so
+dashboard queries scan contiguous memory instead of every call context dict.
+Outbound calls are placed from worker threads, so every mutation holds a lock.
+"""
+from array import array
+from collections import Counter
+from typing import Dict, List
+import threading
+import time
+
+
+DIRECTION_OUTBOUND = 0
+DIRECTION_INBOUND = 1
+
+
+class CallSessionColumns:
+    """Struct-of-arrays view of call sessions for analytics queries."""
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize call session columns.
+
+        Args:
+            capacity: Initial number of slots; grows by doubling when exhausted
+        """
+        self.capacity = 0
+        self.created_at_ns = array('q')
+        self.ended_at_ns = array('q')
+        self.direction = array('B')
+        self.live = bytearray()
+        self.tenant_ids: List[str] = []
+        self._free_slots: List[int] = []
+        self._active_by_tenant: Counter = Counter()
+        self._completed_calls = 0
+        self._completed_duration_ns = 0
+        self._lock = threading.RLock()
+        self._grow(capacity)
+
+    def allocate(self, tenant_id: str, direction: int = DIRECTION_OUTBOUND) -> int:
+        """Claim a slot for a new call session and return its index."""
+        with self._lock:
+            if not self._free_slots:
+                self._grow(self.capacity)
+
+            slot = self._free_slots.pop()
+            self.created_at_ns[slot] = time.time_ns()
+            self.ended_at_ns[slot] = 0
+            self.direction[slot] = direction
+            self.live[slot] = 1
+            self.tenant_ids[slot] = tenant_id
+            self._active_by_tenant[tenant_id] += 1
+            return slot
+
+    def end(self, slot: int) -> None:
+        """Mark the call in a slot as ended."""
+        with self._lock:
+            if not self.live[slot]:
+                return
+
+            ended_at = time.time_ns()
+            self.ended_at_ns[slot] = ended_at
+            self.live[slot] = 0
+            self._active_by_tenant[self.tenant_ids[slot]] -= 1
+            self._completed_calls += 1
+            self._completed_duration_ns += ended_at - self.created_at_ns[slot]
+
+    def free(self, slot: int) -> None:
+        """Return a slot to the free list."""
+        with self._lock:
+            self.end(slot)
+            self.tenant_ids[slot] = ''
+            self._free_slots.append(slot)
+
+    def active_count(self) -> int:
+        """Number of calls currently in progress."""
+        return self.live.count(1)
+
+    def active_by_tenant(self) -> Dict[str, int]:
+        """Number of calls currently in progress per tenant."""
+        with self._lock:
+            return {tenant: count for tenant, count in self._active_by_tenant.items() if count}
+
+    def mean_call_duration(self) -> float:
+        """Mean duration in seconds of calls that have ended."""
+        with self._lock:
+            if not self._completed_calls:
+                return 0.0
+            return self._completed_duration_ns / self._completed_calls / 1e9
+
+    def _grow(self, extra: int) -> None:
+        """Extend every column by ``extra`` empty slots; callers hold the lock."""
+        extra = max(extra, 1)
+        start = self.capacity
+        self.created_at_ns.extend(array('q', bytes(8 * extra)))
+        self.ended_at_ns.extend(array('q', bytes(8 * extra)))
+        self.direction.extend(bytes(extra))
+        self.live.extend(bytes(extra))
+        self.tenant_ids.extend([''] * extra)
+        self.capacity = start + extra
+        # Pop from the end so low slot numbers are handed out first
+        self._free_slots.extend(range(self.capacity - 1, start - 1, -1))
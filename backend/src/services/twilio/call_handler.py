@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 import json
 
-from .phone_service import PhoneService
+from .phone_service import PhoneService, INPUT_TYPE_DIGITS, INPUT_TYPE_SPEECH
 from .twilio_client import TwilioClient
 
 
@@ -101,10 +101,10 @@ class CallHandler:
             # Determine input type and content
             if digits:
                 user_input = digits
-                input_type = 'digits'
+                input_type = INPUT_TYPE_DIGITS
             elif speech_result:
                 user_input = speech_result
-                input_type = 'speech'
+                input_type = INPUT_TYPE_SPEECH
             else:
                 # No input received
                 return self._handle_no_input(call_session_id)
@@ -140,6 +140,7 @@ class CallHandler:
         """
         try:
             recording_url = webhook_data.get('RecordingUrl')
+            recording_sid = webhook_data.get('RecordingSid')
             recording_duration = webhook_data.get('RecordingDuration', '0')
             transcription_text = webhook_data.get('TranscriptionText')
             
@@ -148,7 +149,8 @@ class CallHandler:
             return self.phone_service.handle_recording_complete(
                 call_session_id=call_session_id,
                 recording_url=recording_url,
-                transcription=transcription_text
+                transcription=transcription_text,
+                recording_sid=recording_sid
             )
             
         except Exception as e:
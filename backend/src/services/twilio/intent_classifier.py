@@ -0,0 +1,40 @@
+"""
+Keyword intent classifier for the per-turn IVR hot path.
+
+Kept free of dynamic features and fully annotated so it can be compiled
+ahead of time with mypyc (``mypyc src/services/twilio/intent_classifier.py``);
+the pure-Python module is used when no compiled extension is present.
+"""
+from typing import Tuple
+
+
+INTENT_HOURS = "hours"
+INTENT_PRICING = "pricing"
+INTENT_LOCATION = "location"
+INTENT_GOODBYE = "goodbye"
+INTENT_UNKNOWN = "unknown"
+
+# Checked in order; the first intent with a matching keyword wins
+INTENT_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (INTENT_HOURS, ("hours", "open")),
+    (INTENT_PRICING, ("price", "cost")),
+    (INTENT_LOCATION, ("location", "address")),
+    (INTENT_GOODBYE, ("bye", "goodbye", "thanks", "thank you")),
+)
+
+
+def classify_intent(normalized_input: str) -> str:
+    """
+    Classify lowercased user input by keyword.
+    
+    Args:
+        normalized_input: Lowercased user input
+    
+    Returns:
+        Name of the first matching intent, or INTENT_UNKNOWN
+    """
+    for intent, keywords in INTENT_KEYWORDS:
+        for keyword in keywords:
+            if keyword in normalized_input:
+                return intent
+    return INTENT_UNKNOWN
@@ -5,12 +5,29 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
 
-from typing import Dict, Optional, Any, List
+from typing import Awaitable, Callable, Dict, Optional, Any, List, Set, Tuple
+from dataclasses import dataclass
+import asyncio
+import base64
+import collections
+import functools
 import logging
 from datetime import datetime
-import uuid
+import threading
+import time
+
+from sqlalchemy.exc import SQLAlchemyError
 
 from .twilio_client import TwilioClient
+from .call_columns import CallSessionColumns, DIRECTION_INBOUND, DIRECTION_OUTBOUND
+from .intent_classifier import (
+    classify_intent,
+    INTENT_HOURS,
+    INTENT_PRICING,
+    INTENT_LOCATION,
+    INTENT_GOODBYE,
+    INTENT_UNKNOWN
+)
 from src.models.voice_agent import VoiceAgent
 from src.services.voice.elevenlabs_client import ElevenLabsClient
 from src.services.voice.voice_config import VoiceConfig
@@ -18,6 +35,90 @@ from src.services.voice.voice_config import VoiceConfig
 
 logger = logging.getLogger(__name__)
 
+# Canonical values for call context fields, interned so comparisons short-circuit on identity
+CALL_PURPOSE_CUSTOMER_SERVICE = sys.intern("customer_service")
+CALL_PURPOSE_INBOUND_SUPPORT = sys.intern("inbound_support")
+CALL_DIRECTION_INBOUND = sys.intern("inbound")
+CALL_DIRECTION_OUTBOUND = sys.intern("outbound")
+CALL_STATUS_INITIATING = sys.intern("initiating")
+CALL_STATUS_IN_PROGRESS = sys.intern("in_progress")
+CALL_STATUS_ACTIVE = sys.intern("active")
+CALL_STATUS_COMPLETED = sys.intern("completed")
+INPUT_TYPE_DIGITS = sys.intern("digits")
+INPUT_TYPE_SPEECH = sys.intern("speech")
+
+# Maps webhook-supplied input types onto the canonical interned strings
+_INPUT_TYPES = {INPUT_TYPE_DIGITS: INPUT_TYPE_DIGITS, INPUT_TYPE_SPEECH: INPUT_TYPE_SPEECH}
+
+# Intent -> (knowledge base category, fallback message, response flags)
+INTENT_RESPONSES: Dict[str, Tuple[Optional[str], str, Dict[str, Any]]] = {
+    INTENT_HOURS: (
+        'business_hours',
+        'Our standard business hours are Monday to Friday, 9 AM to 5 PM.',
+        {'requires_followup': True}
+    ),
+    INTENT_PRICING: (
+        'pricing_packages',
+        'For pricing information, I can connect you with our sales team.',
+        {'requires_transfer': True, 'transfer_type': 'sales'}
+    ),
+    INTENT_LOCATION: (
+        'contact_information',
+        'You can find our location and contact details on our website.',
+        {}
+    ),
+    INTENT_GOODBYE: (
+        None,
+        'Thank you for calling! Have a great day.',
+        {'call_complete': True}
+    ),
+    INTENT_UNKNOWN: (
+        None,
+        'I understand you need help. Let me connect you with a specialist who can better assist you.',
+        {'requires_transfer': True, 'transfer_type': 'general'}
+    ),
+}
+
+# Outbound calls submitted within this window are placed together
+OUTBOUND_BATCH_SIZE = 64
+OUTBOUND_BATCH_WINDOW = 0.01
+
+# Seconds a completed call stays available to late webhook callbacks before release
+CALL_RELEASE_DELAY = 300.0
+
+# Session IDs generated per os.urandom() read
+SESSION_ID_BATCH_SIZE = 1024
+
+# Seconds a cached inbound route is trusted before the tenant's agents are listed again
+AGENT_ROUTE_TTL = 60.0
+
+# Seconds between keep-alive requests that hold API connections open
+KEEPALIVE_INTERVAL = 30.0
+
+# Recording events kept until the event sink persists them; oldest are dropped first
+RECORDING_EVENT_RING_SIZE = 65536
+
+# Events handed to the recording event sink per write, and seconds new events wait to join a batch
+RECORDING_EVENT_BATCH_SIZE = 1024
+RECORDING_EVENT_FLUSH_DELAY = 1.0
+
+# Receives (call_session_id, chunk) for each chunk of a downloaded recording,
+# then (call_session_id, b'') once the download is complete
+RecordingHandler = Callable[[str, bytes], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class RecordingEvent:
+    """Recording metadata reported by a Twilio recording webhook."""
+    call_session_id: str
+    recording_url: str
+    transcription: Optional[str]
+    recorded_at_ns: int
+
+
+# Persists a batch of recording events, e.g. to the database or object storage
+RecordingEventSink = Callable[[List[RecordingEvent]], Awaitable[None]]
+
 
 class PhoneService:
     """Service for managing phone calls with voice agents."""
@@ -26,7 +127,9 @@ class PhoneService:
         self,
         twilio_client: TwilioClient,
         elevenlabs_client: Optional[ElevenLabsClient] = None,
-        webhook_base_url: str = ""
+        webhook_base_url: str = "",
+        recording_handler: Optional[RecordingHandler] = None,
+        recording_event_sink: Optional[RecordingEventSink] = None
     ):
         """
         Initialize phone service.
@@ -35,18 +138,76 @@ class PhoneService:
             twilio_client: Configured Twilio client
             elevenlabs_client: Optional ElevenLabs client for custom voices
             webhook_base_url: Base URL for webhook endpoints
+            recording_handler: Consumer that call recordings are streamed to;
+                recordings are not downloaded when omitted
+            recording_event_sink: Writer that recording events are flushed to in
+                the background; events stay in the ring until drained when omitted
         """
         self.twilio = twilio_client
         self.elevenlabs = elevenlabs_client
         self.webhook_base_url = webhook_base_url
+        self.recording_handler = recording_handler
+        self.recording_event_sink = recording_event_sink
         self.active_calls: Dict[str, Dict[str, Any]] = {}
+        # Call session -> analytics slot in call_columns, kept out of the context callers see
+        self._call_slots: Dict[str, int] = {}
+        # Tenant -> (agent id, agent tenant id, monotonic expiry) for inbound routing;
+        # only the keys are cached, the agent row is re-read by primary key per call
+        self._agent_routes: Dict[Optional[str], Tuple[Any, Any, float]] = {}
+        # Columnar mirror of call timings for analytics queries
+        self.call_columns = CallSessionColumns()
+        self.recording_events: collections.deque = collections.deque(maxlen=RECORDING_EVENT_RING_SIZE)
+        self._recording_fetches: Set[asyncio.Task] = set()
+        self._recording_persister: Optional[asyncio.Task] = None
+        # Pending outbound call submissions, drained in batches
+        self._outbound_queue: asyncio.Queue = asyncio.Queue()
+        self._outbound_drainer: Optional[asyncio.Task] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._session_ids: List[str] = []
+        self._session_ids_pid = os.getpid()
+        self._session_id_lock = threading.Lock()
+    
+    async def start_connection_keepalive(self, interval: float = KEEPALIVE_INTERVAL) -> None:
+        """
+        Warm the Twilio connection pool now and keep it warm in the background.
+        
+        Call from application startup so the first call does not pay the TLS
+        handshake on top of the voice latency budget.
+        
+        Args:
+            interval: Seconds between keep-alive requests
+        """
+        await asyncio.to_thread(self.twilio.warm_up)
+        
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.get_running_loop().create_task(
+                self._keepalive_loop(interval)
+            )
+    
+    async def stop_connection_keepalive(self) -> None:
+        """Cancel the background keep-alive task."""
+        if self._keepalive_task is None:
+            return
+        
+        self._keepalive_task.cancel()
+        try:
+            await self._keepalive_task
+        except asyncio.CancelledError:
+            pass
+        self._keepalive_task = None
+    
+    async def _keepalive_loop(self, interval: float) -> None:
+        """Periodically touch Twilio so idle pooled connections are not dropped."""
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(self.twilio.warm_up)
     
     def initiate_outbound_call(
         self,
         voice_agent_id: str,
         to_number: str,
         tenant_id: str,
-        call_purpose: str = "customer_service",
+        call_purpose: str = CALL_PURPOSE_CUSTOMER_SERVICE,
         custom_greeting: Optional[str] = None
     ) -> Dict[str, Any]:
         """
@@ -74,20 +235,23 @@ class PhoneService:
                 raise ValueError(f"Invalid phone number: {to_number}")
             
             # Create call session
-            call_session_id = str(uuid.uuid4())
+            call_session_id = self._new_session_id()
             webhook_url = f"{self.webhook_base_url}/twilio/call/{call_session_id}"
             
-            # Store call context
-            self.active_calls[call_session_id] = {
-                'voice_agent_id': voice_agent_id,
-                'tenant_id': tenant_id,
-                'call_purpose': call_purpose,
-                'custom_greeting': custom_greeting,
-                'to_number': to_number,
-                'status': 'initiating',
-                'created_at': datetime.now().isoformat(),
-                'voice_agent': voice_agent
-            }
+            # Store call context with its full schema so it never grows after creation
+            call_context = self._register_call(
+                call_session_id,
+                voice_agent_id=voice_agent_id,
+                tenant_id=tenant_id,
+                call_purpose=call_purpose,
+                custom_greeting=custom_greeting,
+                to_number=to_number,
+                status=CALL_STATUS_INITIATING,
+                created_at=datetime.now().isoformat(),
+                voice_agent=voice_agent,
+                call_sid=None,
+                direction=CALL_DIRECTION_OUTBOUND
+            )
             
             # Make the call
             call_result = self.twilio.make_call(
@@ -97,8 +261,8 @@ class PhoneService:
             )
             
             # Update call session with Twilio call SID
-            self.active_calls[call_session_id]['call_sid'] = call_result['call_sid']
-            self.active_calls[call_session_id]['status'] = 'in_progress'
+            call_context['call_sid'] = call_result['call_sid']
+            call_context['status'] = CALL_STATUS_IN_PROGRESS
             
             logger.info(f"Initiated outbound call {call_result['call_sid']} with agent {voice_agent_id}")
             
@@ -118,6 +282,69 @@ class PhoneService:
             logger.error(f"Failed to initiate outbound call: {str(e)}")
             raise
     
+    async def submit_outbound_call(
+        self,
+        voice_agent_id: str,
+        to_number: str,
+        tenant_id: str,
+        call_purpose: str = CALL_PURPOSE_CUSTOMER_SERVICE,
+        custom_greeting: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Queue an outbound call so concurrent submissions are placed in batches.
+        
+        Args:
+            voice_agent_id: ID of the voice agent to use
+            to_number: Phone number to call
+            tenant_id: Tenant identifier
+            call_purpose: Purpose of the call
+            custom_greeting: Custom greeting message
+        
+        Returns:
+            Call initiation details
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        await self._outbound_queue.put((
+            (voice_agent_id, to_number, tenant_id, call_purpose, custom_greeting),
+            future
+        ))
+        
+        if self._outbound_drainer is None or self._outbound_drainer.done():
+            self._outbound_drainer = loop.create_task(self._drain_outbound_calls())
+        
+        return await future
+    
+    async def _drain_outbound_calls(self) -> None:
+        """Place queued outbound calls concurrently, one batch per window."""
+        loop = asyncio.get_running_loop()
+        
+        while not self._outbound_queue.empty():
+            batch = [self._outbound_queue.get_nowait()]
+            deadline = loop.time() + OUTBOUND_BATCH_WINDOW
+            
+            while len(batch) < OUTBOUND_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._outbound_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self.initiate_outbound_call, *args) for args, _ in batch),
+                return_exceptions=True
+            )
+            
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+    
     def handle_inbound_call(
         self,
         from_number: str,
@@ -137,7 +364,7 @@ class PhoneService:
         """
         try:
             # Create call session for inbound call
-            call_session_id = str(uuid.uuid4())
+            call_session_id = self._new_session_id()
             
             # Find appropriate voice agent for inbound call
             # For now, use default agent - this could be enhanced with routing logic
@@ -151,17 +378,18 @@ class PhoneService:
                 )
             
             # Store inbound call context
-            self.active_calls[call_session_id] = {
-                'voice_agent_id': voice_agent.id,
-                'tenant_id': tenant_id or voice_agent.tenant_id,
-                'call_purpose': 'inbound_support',
-                'from_number': from_number,
-                'call_sid': call_sid,
-                'status': 'active',
-                'created_at': datetime.now().isoformat(),
-                'voice_agent': voice_agent,
-                'direction': 'inbound'
-            }
+            self._register_call(
+                call_session_id,
+                voice_agent_id=voice_agent.id,
+                tenant_id=tenant_id or voice_agent.tenant_id,
+                call_purpose=CALL_PURPOSE_INBOUND_SUPPORT,
+                from_number=from_number,
+                call_sid=call_sid,
+                status=CALL_STATUS_ACTIVE,
+                created_at=datetime.now().isoformat(),
+                voice_agent=voice_agent,
+                direction=CALL_DIRECTION_INBOUND
+            )
             
             # Generate greeting
             greeting = self._generate_agent_greeting(voice_agent)
@@ -189,7 +417,7 @@ class PhoneService:
         self,
         call_session_id: str,
         user_input: str,
-        input_type: str = "digits"
+        input_type: str = INPUT_TYPE_DIGITS
     ) -> str:
         """
         Handle user input during a call.
@@ -211,6 +439,7 @@ class PhoneService:
                 )
             
             voice_agent = call_context['voice_agent']
+            input_type = _INPUT_TYPES.get(input_type, input_type)
             
             # Process input through voice agent's knowledge base
             agent_response = self._process_user_input_with_agent(
@@ -242,7 +471,8 @@ class PhoneService:
         self,
         call_session_id: str,
         recording_url: str,
-        transcription: Optional[str] = None
+        transcription: Optional[str] = None,
+        recording_sid: Optional[str] = None
     ) -> str:
         """
         Handle completed call recording.
@@ -251,6 +481,7 @@ class PhoneService:
             call_session_id: Call session identifier
             recording_url: URL of the recording
             transcription: Optional transcription text
+            recording_sid: Twilio Recording SID, used to download the audio
         
         Returns:
             TwiML response string
@@ -260,9 +491,15 @@ class PhoneService:
             if not call_context:
                 return self.twilio.create_voice_response("Thank you for your message.")
             
-            # Store recording information
-            call_context['recording_url'] = recording_url
-            call_context['transcription'] = transcription
+            # Log recording information without growing the live call context
+            self.recording_events.append(RecordingEvent(
+                call_session_id=call_session_id,
+                recording_url=recording_url,
+                transcription=transcription,
+                recorded_at_ns=time.time_ns()
+            ))
+            self._schedule_recording_persist()
+            self._schedule_recording_fetch(call_session_id, recording_sid)
             
             # Process recorded message if transcription available
             if transcription:
@@ -270,7 +507,7 @@ class PhoneService:
                 response = self._process_user_input_with_agent(
                     voice_agent,
                     transcription,
-                    "speech",
+                    INPUT_TYPE_SPEECH,
                     call_context
                 )
                 
@@ -287,6 +524,102 @@ class PhoneService:
             logger.error(f"Failed to handle recording for session {call_session_id}: {str(e)}")
             return self.twilio.create_voice_response("Thank you for your message.")
     
+    async def fetch_recording(self, call_session_id: str, recording_sid: str) -> None:
+        """
+        Stream a call recording to the recording handler, chunk by chunk.
+        
+        Args:
+            call_session_id: Call session identifier
+            recording_sid: Twilio Recording SID
+        """
+        if self.recording_handler is None:
+            return
+        
+        try:
+            await self.twilio.fetch_recording(
+                recording_sid,
+                functools.partial(self.recording_handler, call_session_id)
+            )
+            await self.recording_handler(call_session_id, b'')
+        except Exception as e:
+            logger.error(f"Failed to fetch recording for session {call_session_id}: {str(e)}")
+    
+    def drain_recording_events(self, max_events: int = 1024) -> List[RecordingEvent]:
+        """
+        Remove and return the oldest logged recording events for persistence.
+        
+        Args:
+            max_events: Maximum number of events to return
+        
+        Returns:
+            Recording events in arrival order
+        """
+        events = []
+        while self.recording_events and len(events) < max_events:
+            events.append(self.recording_events.popleft())
+        return events
+    
+    async def persist_recording_events(self) -> int:
+        """
+        Hand logged recording events to the recording event sink, in batches.
+        
+        The background drainer calls this; call it at shutdown to flush the rest.
+        
+        Returns:
+            Number of events persisted
+        """
+        if self.recording_event_sink is None:
+            return 0
+        
+        persisted = 0
+        while self.recording_events:
+            batch = self.drain_recording_events(RECORDING_EVENT_BATCH_SIZE)
+            try:
+                await self.recording_event_sink(batch)
+            except Exception as e:
+                # Put the batch back in arrival order so the next flush retries it
+                self.recording_events.extendleft(reversed(batch))
+                logger.error(f"Failed to persist {len(batch)} recording events: {str(e)}")
+                break
+            persisted += len(batch)
+        return persisted
+    
+    async def _persist_recording_events_loop(self) -> None:
+        """Flush recording events to the sink until the ring is empty."""
+        while self.recording_events:
+            await asyncio.sleep(RECORDING_EVENT_FLUSH_DELAY)
+            await self.persist_recording_events()
+    
+    def _schedule_recording_persist(self) -> None:
+        """Start the background recording event drainer when running inside an event loop."""
+        if self.recording_event_sink is None:
+            return
+        if self._recording_persister is not None and not self._recording_persister.done():
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Synchronous callers can await persist_recording_events() themselves
+            return
+        
+        self._recording_persister = loop.create_task(self._persist_recording_events_loop())
+    
+    def _schedule_recording_fetch(self, call_session_id: str, recording_sid: Optional[str]) -> None:
+        """Start a background recording download when running inside an event loop."""
+        if not recording_sid or self.recording_handler is None:
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Synchronous callers can await fetch_recording() themselves
+            return
+        
+        task = loop.create_task(self.fetch_recording(call_session_id, recording_sid))
+        self._recording_fetches.add(task)
+        task.add_done_callback(self._recording_fetches.discard)
+    
     def get_call_session(self, call_session_id: str) -> Optional[Dict[str, Any]]:
         """Get call session details."""
         return self.active_calls.get(call_session_id)
@@ -295,17 +628,83 @@ class PhoneService:
         """End and cleanup call session."""
         if call_session_id in self.active_calls:
             call_context = self.active_calls[call_session_id]
-            call_context['status'] = 'completed'
+            call_context['status'] = CALL_STATUS_COMPLETED
             call_context['ended_at'] = datetime.now().isoformat()
+            slot = self._call_slots.get(call_session_id)
+            if slot is not None:
+                self.call_columns.end(slot)
             
             # Could save to database here for analytics
             logger.info(f"Call session {call_session_id} completed")
             
             # Remove from active calls after a delay (for potential webhook callbacks)
-            # In production, this might be handled by a cleanup job
+            self._schedule_call_release(call_session_id)
             return True
         return False
     
+    def release_call_session(self, call_session_id: str) -> bool:
+        """Remove a finished call session and free its analytics slot."""
+        if self.active_calls.pop(call_session_id, None) is None:
+            return False
+        
+        slot = self._call_slots.pop(call_session_id, None)
+        if slot is not None:
+            self.call_columns.free(slot)
+        return True
+    
+    def _schedule_call_release(self, call_session_id: str, delay: float = CALL_RELEASE_DELAY) -> None:
+        """Release an ended call session after a delay when running inside an event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Synchronous callers release the session themselves
+            return
+        
+        loop.call_later(delay, self.release_call_session, call_session_id)
+    
+    def invalidate_agent_route(self, tenant_id: Optional[str] = None) -> None:
+        """
+        Drop cached inbound routing after an agent is created, updated or removed.
+        
+        Args:
+            tenant_id: Tenant whose route changed; clears every route when omitted
+        """
+        if tenant_id is None:
+            self._agent_routes.clear()
+        else:
+            self._agent_routes.pop(tenant_id, None)
+            # The tenant-less default may have been this tenant's agent
+            self._agent_routes.pop(None, None)
+    
+    def _new_session_id(self) -> str:
+        """Return a random 22-character URL-safe session ID from a pre-generated batch."""
+        with self._session_id_lock:
+            # A forked worker must not hand out IDs already held by its parent
+            if not self._session_ids or self._session_ids_pid != os.getpid():
+                self._session_ids_pid = os.getpid()
+                raw = os.urandom(16 * SESSION_ID_BATCH_SIZE)
+                self._session_ids = [
+                    base64.urlsafe_b64encode(raw[i:i + 16]).rstrip(b'=').decode('ascii')
+                    for i in range(0, len(raw), 16)
+                ]
+            return self._session_ids.pop()
+    
+    def _register_call(self, call_session_id: str, **fields: Any) -> Dict[str, Any]:
+        """Store a new call context and claim its analytics slot."""
+        call_context = dict(fields)
+        direction = DIRECTION_INBOUND if fields.get('direction') == CALL_DIRECTION_INBOUND else DIRECTION_OUTBOUND
+        self._call_slots[call_session_id] = self.call_columns.allocate(fields.get('tenant_id') or '', direction)
+        self.active_calls[call_session_id] = call_context
+        return call_context
+    
+    def get_call_statistics(self) -> Dict[str, Any]:
+        """Get live call counts and mean duration of completed calls."""
+        return {
+            'active_calls': self.call_columns.active_count(),
+            'active_calls_by_tenant': self.call_columns.active_by_tenant(),
+            'mean_call_duration_seconds': self.call_columns.mean_call_duration()
+        }
+    
     def _find_agent_for_inbound_call(
         self, 
         from_number: str, 
@@ -318,16 +717,34 @@ class PhoneService:
         # - Agent availability
         # - Customer history
         
+        route = self._agent_routes.get(tenant_id)
+        
         try:
+            if route is not None and route[2] > time.monotonic():
+                voice_agent = VoiceAgent.get_by_id(route[0], route[1])
+                if voice_agent is not None and voice_agent.is_active is not False:
+                    return voice_agent
+                # Deleted, deactivated or moved to another tenant since it was cached
+                self._agent_routes.pop(tenant_id, None)
+            
             if tenant_id:
                 # Get default agent for tenant
                 agents = VoiceAgent.list_by_tenant(tenant_id)
-                return agents[0] if agents else None
+                voice_agent = agents[0] if agents else None
             else:
                 # Get any available agent
-                return VoiceAgent.get_default_agent()
-        except:
+                voice_agent = VoiceAgent.get_default_agent()
+        except (SQLAlchemyError, ConnectionError, TimeoutError) as e:
+            logger.warning(f"Agent lookup failed for tenant {tenant_id}: {str(e)}")
             return None
+        
+        if voice_agent is not None:
+            self._agent_routes[tenant_id] = (
+                voice_agent.id,
+                voice_agent.tenant_id,
+                time.monotonic() + AGENT_ROUTE_TTL
+            )
+        return voice_agent
     
     def _generate_agent_greeting(self, voice_agent: VoiceAgent) -> str:
         """Generate greeting message for voice agent."""
@@ -368,37 +785,20 @@ class PhoneService:
             
             knowledge_base = getattr(voice_agent, 'knowledge_base', {})
             
-            # Simple keyword matching - in production this would use NLP
-            user_input_lower = user_input.lower()
-            
-            if 'hours' in user_input_lower or 'open' in user_input_lower:
-                hours_info = knowledge_base.get('business_hours', {})
-                response = hours_info.get('content', 'Our standard business hours are Monday to Friday, 9 AM to 5 PM.')
-                return {'message': response, 'requires_followup': True}
-            
-            elif 'price' in user_input_lower or 'cost' in user_input_lower:
-                pricing_info = knowledge_base.get('pricing_packages', {})
-                response = pricing_info.get('content', 'For pricing information, I can connect you with our sales team.')
-                return {'message': response, 'requires_transfer': True, 'transfer_type': 'sales'}
-            
-            elif 'location' in user_input_lower or 'address' in user_input_lower:
-                contact_info = knowledge_base.get('contact_information', {})
-                response = contact_info.get('content', 'You can find our location and contact details on our website.')
-                return {'message': response}
+            # Simple keyword matching - in production this would use NLP;
+            # DTMF digits have no case, so they skip the lowercased copy
+            if input_type == INPUT_TYPE_DIGITS:
+                user_input_lower = user_input
+            else:
+                user_input_lower = user_input.lower()
+            intent = classify_intent(user_input_lower)
             
-            elif any(word in user_input_lower for word in ['bye', 'goodbye', 'thanks', 'thank you']):
-                return {
-                    'message': 'Thank you for calling! Have a great day.',
-                    'call_complete': True
-                }
+            kb_key, default_message, flags = INTENT_RESPONSES[intent]
+            message = default_message
+            if kb_key is not None:
+                message = knowledge_base.get(kb_key, {}).get('content', default_message)
             
-            else:
-                # Default response
-                return {
-                    'message': 'I understand you need help. Let me connect you with a specialist who can better assist you.',
-                    'requires_transfer': True,
-                    'transfer_type': 'general'
-                }
+            return {'message': message, **flags}
                 
         except Exception as e:
             logger.error(f"Error processing user input with agent: {str(e)}")
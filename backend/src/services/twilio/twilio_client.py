@@ -3,13 +3,125 @@ Twilio API client for phone calls, SMS, and voice services.
 """
 from twilio.rest import Client
 from twilio.twiml.voice_response import VoiceResponse
-from typing import Dict, Optional, Any, List
+from typing import Awaitable, Callable, Dict, Optional, Any, List, Tuple
 import logging
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from xml.sax.saxutils import escape
+import re
+import threading
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
 
 
 logger = logging.getLogger(__name__)
 
+TWILIO_API_BASE_URL = "https://api.twilio.com/2010-04-01"
+
+# TwiML templates matching VoiceResponse serialization, for the fixed reply shapes
+_TWIML_PREFIX = '<?xml version="1.0" encoding="UTF-8"?>'
+_TWIML_EMPTY = _TWIML_PREFIX + '<Response />'
+_TWIML_SAY = _TWIML_PREFIX + '<Response><Say voice="{voice}">{message}</Say></Response>'
+_TWIML_GATHER = (
+    _TWIML_PREFIX + '<Response>'
+    '<Gather action="{action}" method="POST" numDigits="{num_digits}" timeout="{timeout}">'
+    '<Say voice="{voice}">{message}</Say></Gather>'
+    '<Say voice="{voice}">We didn\'t receive any input. Goodbye!</Say><Hangup /></Response>'
+)
+_TWIML_RECORD = (
+    _TWIML_PREFIX + '<Response><Say voice="{voice}">{message}</Say>'
+    '<Record action="{action}" finishOnKey="#" maxLength="{max_length}" method="POST" '
+    'transcribe="true" transcribeCallback="{action}" /></Response>'
+)
+_ATTRIBUTE_ENTITIES = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#09;'}
+TWIML_CACHE_SIZE = 512
+
+# Read size for streamed recording downloads
+RECORDING_CHUNK_SIZE = 128 * 1024
+_RECORDING_SID_RE = re.compile(r'RE[0-9a-fA-F]{32}')
+
+# One SDK client (and its keep-alive HTTPS pool) per credential pair
+_CLIENT_CACHE: Dict[Tuple[str, str], Client] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_shared_client(account_sid: str, auth_token: str) -> Client:
+    """Return the process-wide Twilio SDK client for a credential pair."""
+    key = (account_sid, auth_token)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = Client(account_sid, auth_token)
+                _CLIENT_CACHE[key] = client
+    return client
+
+
+def _rfc2822_to_iso(value: Optional[str]) -> Optional[str]:
+    """Convert a Twilio REST timestamp (RFC 2822) to ISO 8601."""
+    return parsedate_to_datetime(value).isoformat() if value else None
+
+
+def _add_call_usage(record: Any, totals: Dict[str, Any]) -> None:
+    """Accumulate a 'calls' usage record."""
+    totals['calls'] += int(record.count or 0)
+    totals['call_duration'] += int(record.usage or 0)
+    totals['total_cost'] += float(record.price or 0.0)
+
+
+def _add_sms_usage(record: Any, totals: Dict[str, Any]) -> None:
+    """Accumulate an 'sms-outbound' usage record."""
+    totals['sms_sent'] += int(record.count or 0)
+    totals['total_cost'] += float(record.price or 0.0)
+
+
+# Usage category -> accumulator for its aggregated this-month record
+USAGE_HANDLERS = {
+    'calls': _add_call_usage,
+    'sms-outbound': _add_sms_usage
+}
+
+
+def _attr(value: Any) -> str:
+    """Escape a value for use inside a double-quoted TwiML attribute."""
+    return escape(str(value), _ATTRIBUTE_ENTITIES)
+
+
+@lru_cache(maxsize=TWIML_CACHE_SIZE)
+def _render_say(message: str, voice: str) -> str:
+    """Render a single-Say response."""
+    return _TWIML_SAY.format(voice=_attr(voice), message=escape(message))
+
+
+@lru_cache(maxsize=TWIML_CACHE_SIZE)
+def _gather_segments(message: str, num_digits: int, timeout: int, voice: str) -> Tuple[str, ...]:
+    """Render a Gather response around its action URL, which is unique per call."""
+    return tuple(
+        segment.format(num_digits=_attr(num_digits), timeout=_attr(timeout), voice=_attr(voice), message=escape(message))
+        for segment in _TWIML_GATHER.split('{action}')
+    )
+
+
+@lru_cache(maxsize=TWIML_CACHE_SIZE)
+def _record_segments(message: str, max_length: int, voice: str) -> Tuple[str, ...]:
+    """Render a Record response around its action URL, which is unique per call."""
+    return tuple(
+        segment.format(max_length=_attr(max_length), voice=_attr(voice), message=escape(message))
+        for segment in _TWIML_RECORD.split('{action}')
+    )
+
+
+def clear_client_cache() -> None:
+    """Drop all shared Twilio SDK clients (e.g. after rotating credentials)."""
+    with _CLIENT_CACHE_LOCK:
+        _CLIENT_CACHE.clear()
+
 
 class TwilioClient:
     """Client for interacting with Twilio API."""
@@ -34,7 +146,45 @@ class TwilioClient:
         self.account_sid = account_sid
         self.auth_token = auth_token
         self.phone_number = phone_number
-        self.client = Client(account_sid, auth_token)
+        self.client = _get_shared_client(account_sid, auth_token)
+        self._http = None
+    
+    def _get_http(self) -> "httpx.AsyncClient":
+        """Return the pooled async REST client, creating it on first use."""
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx is required for async Twilio calls. Install with: pip install httpx")
+        
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=f"{TWILIO_API_BASE_URL}/Accounts/{self.account_sid}",
+                auth=(self.account_sid, self.auth_token),
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=50)
+            )
+        return self._http
+    
+    async def aclose(self) -> None:
+        """Close pooled async REST connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    def warm_up(self) -> bool:
+        """
+        Open a pooled HTTPS connection to Twilio ahead of the first call.
+        
+        Fetches the account resource, which is cheap and leaves the TLS
+        connection in the client's keep-alive pool for later requests.
+        
+        Returns:
+            True if Twilio responded
+        """
+        try:
+            self.client.api.accounts(self.account_sid).fetch()
+            return True
+        except Exception as e:
+            logger.warning(f"Twilio connection warm-up failed: {str(e)}")
+            return False
     
     def make_call(
         self, 
@@ -188,6 +338,43 @@ class TwilioClient:
             logger.error(f"Failed to get recordings for call {call_sid}: {str(e)}")
             raise
     
+    async def fetch_recording(
+        self,
+        recording_sid: str,
+        sink: Callable[[bytes], Awaitable[None]],
+        chunk_size: int = RECORDING_CHUNK_SIZE
+    ) -> int:
+        """
+        Stream a call recording to a sink over the pooled REST connections.
+        
+        The request always goes to this account's Recordings resource, so the
+        client's credentials are never sent to a URL taken from a webhook.
+        
+        Args:
+            recording_sid: Twilio Recording SID from the webhook
+            sink: Awaited with each chunk as it arrives; the audio is never held whole
+            chunk_size: Number of bytes to read per chunk
+        
+        Returns:
+            Number of bytes streamed
+        """
+        if not recording_sid or not _RECORDING_SID_RE.fullmatch(recording_sid):
+            raise ValueError(f"Invalid recording SID: {recording_sid!r}")
+        
+        try:
+            size = 0
+            async with self._get_http().stream('GET', f"/Recordings/{recording_sid}.wav") as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(chunk_size):
+                    size += len(chunk)
+                    await sink(chunk)
+            
+            return size
+            
+        except Exception as e:
+            logger.error(f"Failed to fetch recording {recording_sid}: {str(e)}")
+            raise
+    
     def update_call(self, call_sid: str, status: str) -> Dict[str, Any]:
         """
         Update a call's status (e.g., to hang up).
@@ -212,17 +399,187 @@ class TwilioClient:
             logger.error(f"Failed to update call {call_sid}: {str(e)}")
             raise
     
-    def create_voice_response(self, message: str = None, voice: str = "alice") -> str:
+    async def make_call_async(
+        self, 
+        to_number: str, 
+        twiml_url: str,
+        from_number: Optional[str] = None,
+        timeout: int = 30,
+        record: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Make an outbound phone call without blocking the event loop.
+        
+        Same arguments and result as ``make_call``.
+        """
+        if not from_number:
+            if not self.phone_number:
+                raise ValueError("No phone number configured for outbound calls")
+            from_number = self.phone_number
+        
+        try:
+            response = await self._get_http().post('/Calls.json', data={
+                'To': to_number,
+                'From': from_number,
+                'Url': twiml_url,
+                'Timeout': timeout,
+                'Record': 'true' if record else 'false'
+            })
+            response.raise_for_status()
+            call = response.json()
+            
+            return {
+                'call_sid': call.get('sid'),
+                'to': to_number,
+                'from': from_number,
+                'status': call.get('status'),
+                'date_created': _rfc2822_to_iso(call.get('date_created')),
+                'duration': call.get('duration')
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to make call to {to_number}: {str(e)}")
+            raise
+    
+    async def send_sms_async(
+        self, 
+        to_number: str, 
+        message: str,
+        from_number: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Send an SMS message without blocking the event loop.
+        
+        Same arguments and result as ``send_sms``.
+        """
+        if not from_number:
+            if not self.phone_number:
+                raise ValueError("No phone number configured for SMS")
+            from_number = self.phone_number
+        
+        try:
+            response = await self._get_http().post('/Messages.json', data={
+                'Body': message,
+                'From': from_number,
+                'To': to_number
+            })
+            response.raise_for_status()
+            message_obj = response.json()
+            
+            return {
+                'message_sid': message_obj.get('sid'),
+                'to': to_number,
+                'from': from_number,
+                'status': message_obj.get('status'),
+                'date_created': _rfc2822_to_iso(message_obj.get('date_created')),
+                'body': message
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to send SMS to {to_number}: {str(e)}")
+            raise
+    
+    async def get_call_details_async(self, call_sid: str) -> Dict[str, Any]:
+        """
+        Get details of a specific call without blocking the event loop.
+        
+        Same arguments and result as ``get_call_details``.
+        """
+        try:
+            response = await self._get_http().get(f'/Calls/{call_sid}.json')
+            response.raise_for_status()
+            call = response.json()
+            
+            return {
+                'call_sid': call.get('sid'),
+                'to': call.get('to'),
+                'from': call.get('from'),
+                'status': call.get('status'),
+                'start_time': _rfc2822_to_iso(call.get('start_time')),
+                'end_time': _rfc2822_to_iso(call.get('end_time')),
+                'duration': call.get('duration'),
+                'direction': call.get('direction'),
+                'answered_by': call.get('answered_by'),
+                'price': call.get('price'),
+                'price_unit': call.get('price_unit')
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to get call details for {call_sid}: {str(e)}")
+            raise
+    
+    async def get_call_recordings_async(self, call_sid: str) -> List[Dict[str, Any]]:
+        """
+        Get recordings for a specific call without blocking the event loop.
+        
+        Same arguments and result as ``get_call_recordings``.
+        """
+        try:
+            response = await self._get_http().get('/Recordings.json', params={'CallSid': call_sid})
+            response.raise_for_status()
+            recordings = response.json().get('recordings', [])
+            
+            return [
+                {
+                    'recording_sid': recording.get('sid'),
+                    'call_sid': recording.get('call_sid'),
+                    'duration': recording.get('duration'),
+                    'date_created': _rfc2822_to_iso(recording.get('date_created')),
+                    'status': recording.get('status'),
+                    'channels': recording.get('channels'),
+                    'source': recording.get('source'),
+                    'uri': recording.get('uri')
+                }
+                for recording in recordings
+            ]
+            
+        except Exception as e:
+            logger.error(f"Failed to get recordings for call {call_sid}: {str(e)}")
+            raise
+    
+    async def update_call_async(self, call_sid: str, status: str) -> Dict[str, Any]:
+        """
+        Update a call's status without blocking the event loop.
+        
+        Same arguments and result as ``update_call``.
+        """
+        try:
+            response = await self._get_http().post(f'/Calls/{call_sid}.json', data={'Status': status})
+            response.raise_for_status()
+            call = response.json()
+            
+            return {
+                'call_sid': call.get('sid'),
+                'status': call.get('status'),
+                'date_updated': datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to update call {call_sid}: {str(e)}")
+            raise
+    
+    def create_voice_response(
+        self,
+        message: str = None,
+        voice: str = "alice",
+        strict: bool = False
+    ) -> str:
         """
         Create TwiML voice response.
         
         Args:
             message: Text to speak
             voice: Twilio voice to use
+            strict: Build the response with the SDK's VoiceResponse, bypassing the template cache
         
         Returns:
             TwiML XML string
         """
+        if not strict:
+            if not message:
+                return _TWIML_EMPTY
+            return _render_say(message, voice)
+        
         response = VoiceResponse()
         
         if message:
@@ -236,7 +593,8 @@ class TwilioClient:
         action_url: str,
         num_digits: int = 1,
         timeout: int = 5,
-        voice: str = "alice"
+        voice: str = "alice",
+        strict: bool = False
     ) -> str:
         """
         Create TwiML response that gathers user input.
@@ -247,10 +605,14 @@ class TwilioClient:
             num_digits: Number of digits to gather
             timeout: Timeout for input
             voice: Twilio voice to use
+            strict: Build the response with the SDK's VoiceResponse, bypassing the template cache
         
         Returns:
             TwiML XML string
         """
+        if not strict:
+            return _attr(action_url).join(_gather_segments(message, num_digits, timeout, voice))
+        
         response = VoiceResponse()
         
         gather = response.gather(
@@ -272,7 +634,8 @@ class TwilioClient:
         message: str,
         action_url: str,
         max_length: int = 30,
-        voice: str = "alice"
+        voice: str = "alice",
+        strict: bool = False
     ) -> str:
         """
         Create TwiML response that records user audio.
@@ -282,10 +645,14 @@ class TwilioClient:
             action_url: URL to send recording data
             max_length: Maximum recording length in seconds
             voice: Twilio voice to use
+            strict: Build the response with the SDK's VoiceResponse, bypassing the template cache
         
         Returns:
             TwiML XML string
         """
+        if not strict:
+            return _attr(action_url).join(_record_segments(message, max_length, voice))
+        
         response = VoiceResponse()
         
         response.say(message, voice=voice)
@@ -339,13 +706,6 @@ class TwilioClient:
             Usage statistics
         """
         try:
-            # Get current month's usage
-            usage_records = self.client.usage.records.list(
-                category='calls',
-                start_date=datetime.now().replace(day=1).date(),
-                end_date=datetime.now().date()
-            )
-            
             total_usage = {
                 'calls': 0,
                 'call_duration': 0,
@@ -353,14 +713,10 @@ class TwilioClient:
                 'total_cost': 0.0
             }
             
-            for record in usage_records:
-                if record.category == 'calls':
-                    total_usage['calls'] += int(record.count or 0)
-                    total_usage['call_duration'] += int(record.usage or 0)
-                    total_usage['total_cost'] += float(record.price or 0.0)
-                elif record.category == 'sms-outbound':
-                    total_usage['sms_sent'] += int(record.count or 0)
-                    total_usage['total_cost'] += float(record.price or 0.0)
+            # Twilio pre-aggregates the current month into one record per category
+            for category, handler in USAGE_HANDLERS.items():
+                for record in self.client.usage.records.this_month.list(category=category, limit=1):
+                    handler(record, total_usage)
             
             return total_usage
             
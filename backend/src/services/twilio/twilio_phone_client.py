@@ -1,16 +1,113 @@
 """Real Twilio phone client for phone number search and provisioning."""
 
+import asyncio
 import os
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 import logging
-from twilio.rest import Client
-from twilio.base.exceptions import TwilioException
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Twilio SDK classes, imported by _load_twilio_sdk on first client construction
+# so importing this module does not pull in the SDK
+Client = None
+TwilioException = None
+TwilioHttpClient = None
+
+# Keep-alive pool sizing for the shared Twilio HTTPS session
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Rate limits and transient server error responses are retried on the pooled
+# connection, honouring Retry-After. Only idempotent methods are retried:
+# a repeated POST could purchase a number twice.
+RETRY_POLICY = Retry(
+    total=5,
+    connect=0,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "DELETE"]),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Incoming numbers fetched per Twilio API page when listing an account
+PAGE_SIZE = 100
+
+# Seconds a service status result is reused before Twilio is queried again
+STATUS_CACHE_TTL = 10.0
+
+
+def _load_twilio_sdk() -> None:
+    """Import the Twilio SDK classes used by this module, once."""
+    global Client, TwilioException, TwilioHttpClient
+    if TwilioException is None:
+        from twilio.base.exceptions import TwilioException
+        from twilio.http.http_client import TwilioHttpClient
+    if Client is None:
+        from twilio.rest import Client
+
+
+class _PerThreadHttpClient:
+    """Twilio HTTP client whose threads share one pooled requests session.
+    
+    TwilioHttpClient.request hands its response back through an instance
+    attribute, so one instance driven from several worker threads can return
+    another request's response. Each thread gets its own TwilioHttpClient
+    over the shared session instead.
+    """
+    
+    is_async = False
+    
+    def __init__(self, session: requests.Session):
+        self.session = session
+        self._local = threading.local()
+    
+    def request(self, *args, **kwargs):
+        """Send a request through this thread's TwilioHttpClient."""
+        http_client = getattr(self._local, 'http_client', None)
+        if http_client is None:
+            http_client = TwilioHttpClient(pool_connections=False)
+            http_client.session = self.session
+            self._local.http_client = http_client
+        return http_client.request(*args, **kwargs)
+
+
+def _pooled_http_client() -> _PerThreadHttpClient:
+    """Twilio HTTP client with a larger keep-alive pool and transient-failure retries."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY_POLICY
+    ))
+    return _PerThreadHttpClient(session)
+
+
+_CAPABILITY_KEYS = ("voice", "sms", "mms")
+
+
+def _capabilities(capabilities: Dict[str, bool]) -> Dict[str, bool]:
+    """Normalize a Twilio capabilities mapping to voice/sms/mms flags."""
+    return {key: capabilities.get(key, False) for key in _CAPABILITY_KEYS}
+
+
+@lru_cache(maxsize=8)
+def _get_twilio_client(account_sid: str, auth_token: str) -> "Client":
+    """Return the shared Twilio SDK client for a credential pair."""
+    return Client(account_sid, auth_token, http_client=_pooled_http_client())
+
 
 class TwilioPhoneClient:
-    """Real Twilio client for phone operations with zero mocks."""
+    """Real Twilio client for phone operations with zero mocks.
+    
+    The Twilio SDK is blocking, so async methods run its calls in the default
+    thread pool to keep the event loop free during the round trip.
+    """
     
     def __init__(
         self,
@@ -32,8 +129,10 @@ class TwilioPhoneClient:
         if not self.account_sid or not self.auth_token:
             raise ValueError("Twilio Account SID and Auth Token are required")
         
-        # Initialize real Twilio client
-        self.client = Client(self.account_sid, self.auth_token)
+        _load_twilio_sdk()
+        # Reuse the real Twilio client (and its open connections) for these credentials
+        self.client = _get_twilio_client(self.account_sid, self.auth_token)
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         logger.info("✅ Real Twilio client initialized")
     
     async def search_phone_numbers(
@@ -62,7 +161,8 @@ class TwilioPhoneClient:
             if contains and contains.isdigit():
                 search_params["contains"] = contains
                 
-            available_numbers = self.client.available_phone_numbers(country_code).local.list(
+            available_numbers = await asyncio.to_thread(
+                self.client.available_phone_numbers(country_code).local.list,
                 **search_params
             )
             
@@ -73,20 +173,16 @@ class TwilioPhoneClient:
                     "locality": number.locality,
                     "region": number.region,
                     "postal_code": number.postal_code,
-                    "capabilities": {
-                        "voice": number.capabilities.get("voice", False),
-                        "sms": number.capabilities.get("sms", False),
-                        "mms": number.capabilities.get("mms", False)
-                    }
+                    "capabilities": _capabilities(number.capabilities)
                 }
                 for number in available_numbers
             ]
             
         except TwilioException as e:
-            logger.error(f"Twilio API error searching phone numbers: {e}")
+            logger.error("Twilio API error searching phone numbers: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error searching phone numbers: {e}")
+            logger.error("Error searching phone numbers: %s", e)
             raise
     
     async def provision_phone_number(
@@ -123,7 +219,9 @@ class TwilioPhoneClient:
             if friendly_name:
                 purchase_params["friendly_name"] = friendly_name
                 
-            incoming_number = self.client.incoming_phone_numbers.create(**purchase_params)
+            incoming_number = await asyncio.to_thread(
+                self.client.incoming_phone_numbers.create, **purchase_params
+            )
             
             return {
                 "sid": incoming_number.sid,
@@ -131,64 +229,144 @@ class TwilioPhoneClient:
                 "friendly_name": incoming_number.friendly_name,
                 "voice_url": incoming_number.voice_url,
                 "sms_url": incoming_number.sms_url,
-                "capabilities": {
-                    "voice": incoming_number.capabilities.get("voice", False),
-                    "sms": incoming_number.capabilities.get("sms", False),
-                    "mms": incoming_number.capabilities.get("mms", False)
-                },
+                "capabilities": _capabilities(incoming_number.capabilities),
                 "status": incoming_number.status
             }
             
         except TwilioException as e:
-            logger.error(f"Twilio API error provisioning {phone_number}: {e}")
+            logger.error("Twilio API error provisioning %s: %s", phone_number, e)
             raise
         except Exception as e:
-            logger.error(f"Error provisioning phone number {phone_number}: {e}")
+            logger.error("Error provisioning phone number %s: %s", phone_number, e)
             raise
     
-    async def list_provisioned_numbers(self) -> List[Dict[str, Any]]:
-        """List all provisioned phone numbers using real Twilio API."""
+    async def list_provisioned_numbers(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List provisioned phone numbers using real Twilio API.
+        
+        Args:
+            limit: Maximum numbers to return; paging stops once it is reached
+            
+        Returns:
+            Provisioned phone number details
+        """
         try:
-            incoming_numbers = self.client.incoming_phone_numbers.list()
+            incoming_numbers = await asyncio.to_thread(
+                self.client.incoming_phone_numbers.list, limit=limit, page_size=PAGE_SIZE
+            )
             
-            return [
-                {
-                    "sid": number.sid,
-                    "phone_number": number.phone_number,
-                    "friendly_name": number.friendly_name,
-                    "voice_url": number.voice_url,
-                    "sms_url": number.sms_url,
-                    "capabilities": {
-                        "voice": number.capabilities.get("voice", False),
-                        "sms": number.capabilities.get("sms", False),
-                        "mms": number.capabilities.get("mms", False)
-                    },
-                    "status": number.status
-                }
-                for number in incoming_numbers
-            ]
+            return [self._incoming_number_to_dict(number) for number in incoming_numbers]
             
         except TwilioException as e:
-            logger.error(f"Twilio API error listing numbers: {e}")
+            logger.error("Twilio API error listing numbers: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error listing provisioned numbers: {e}")
+            logger.error("Error listing provisioned numbers: %s", e)
             raise
     
+    async def iter_provisioned_numbers(
+        self,
+        limit: Optional[int] = None,
+        page_size: int = PAGE_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield provisioned phone numbers one Twilio page at a time.
+        
+        Unlike ``list_provisioned_numbers`` the first numbers are available
+        after a single round trip, and only one page is held in memory.
+        
+        Args:
+            limit: Maximum numbers to yield
+            page_size: Numbers fetched per Twilio API request
+            
+        Yields:
+            Provisioned phone number details
+        """
+        if limit is not None:
+            if limit <= 0:
+                return
+            page_size = min(page_size, limit)
+        
+        yielded = 0
+        try:
+            page = await asyncio.to_thread(self.client.incoming_phone_numbers.page, page_size=page_size)
+            while page is not None:
+                for number in page:
+                    yield self._incoming_number_to_dict(number)
+                    yielded += 1
+                    if yielded == limit:
+                        return
+                page = await asyncio.to_thread(page.next_page)
+                
+        except TwilioException as e:
+            logger.error("Twilio API error listing numbers: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Error listing provisioned numbers: %s", e)
+            raise
+    
+    @staticmethod
+    def _incoming_number_to_dict(number) -> Dict[str, Any]:
+        """Convert a Twilio incoming phone number resource to a dictionary."""
+        return {
+            "sid": number.sid,
+            "phone_number": number.phone_number,
+            "friendly_name": number.friendly_name,
+            "voice_url": number.voice_url,
+            "sms_url": number.sms_url,
+            "capabilities": _capabilities(number.capabilities),
+            "status": number.status
+        }
+    
     async def release_phone_number(self, number_sid: str) -> bool:
         """Release a provisioned phone number using real Twilio API."""
         try:
-            self.client.incoming_phone_numbers(number_sid).delete()
-            logger.info(f"Released phone number with SID: {number_sid}")
+            await asyncio.to_thread(self.client.incoming_phone_numbers(number_sid).delete)
+            logger.info("Released phone number with SID: %s", number_sid)
             return True
             
         except TwilioException as e:
-            logger.error(f"Twilio API error releasing {number_sid}: {e}")
+            logger.error("Twilio API error releasing %s: %s", number_sid, e)
             return False
         except Exception as e:
-            logger.error(f"Error releasing phone number {number_sid}: {e}")
+            logger.error("Error releasing phone number %s: %s", number_sid, e)
             return False
     
+    async def release_phone_numbers(self, number_sids: List[str]) -> Dict[str, bool]:
+        """Release several phone numbers concurrently.
+        
+        Args:
+            number_sids: SIDs of the numbers to release
+            
+        Returns:
+            Release status keyed by SID
+        """
+        results = await asyncio.gather(
+            *(self.release_phone_number(sid) for sid in number_sids),
+            return_exceptions=True
+        )
+        return {sid: result is True for sid, result in zip(number_sids, results)}
+    
+    async def update_phone_number_webhooks_bulk(
+        self,
+        updates: Dict[str, Dict[str, Optional[str]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Update webhooks on several phone numbers concurrently.
+        
+        Args:
+            updates: ``voice_url``/``sms_url`` keyword arguments keyed by number SID
+            
+        Returns:
+            Updated number details keyed by SID; failed updates carry an ``error`` key
+        """
+        number_sids = list(updates)
+        results = await asyncio.gather(
+            *(self.update_phone_number_webhooks(sid, **updates[sid]) for sid in number_sids),
+            return_exceptions=True
+        )
+        return {
+            sid: {"sid": sid, "error": str(result)} if isinstance(result, Exception) else result
+            for sid, result in zip(number_sids, results)
+        }
+    
     async def update_phone_number_webhooks(
         self,
         number_sid: str,
@@ -204,7 +382,9 @@ class TwilioPhoneClient:
             if sms_url is not None:
                 update_params["sms_url"] = sms_url
                 
-            updated_number = self.client.incoming_phone_numbers(number_sid).update(**update_params)
+            updated_number = await asyncio.to_thread(
+                self.client.incoming_phone_numbers(number_sid).update, **update_params
+            )
             
             return {
                 "sid": updated_number.sid,
@@ -214,18 +394,34 @@ class TwilioPhoneClient:
             }
             
         except TwilioException as e:
-            logger.error(f"Twilio API error updating webhooks for {number_sid}: {e}")
+            logger.error("Twilio API error updating webhooks for %s: %s", number_sid, e)
             raise
         except Exception as e:
-            logger.error(f"Error updating phone number webhooks {number_sid}: {e}")
+            logger.error("Error updating phone number webhooks %s: %s", number_sid, e)
             raise
     
-    def get_service_status(self) -> Dict[str, Any]:
+    def get_service_status(self, force: bool = False) -> Dict[str, Any]:
         """Get service status for monitoring and health checks.
         
+        Results are reused for ``STATUS_CACHE_TTL`` seconds so frequent health
+        check polls do not each cost a Twilio API round trip.
+        
+        Args:
+            force: Query Twilio even if a recent result is cached
+            
         Returns:
             Dictionary containing service status information
         """
+        now = time.monotonic()
+        if not force and self._status_cache is not None and now - self._status_cache[0] < STATUS_CACHE_TTL:
+            return dict(self._status_cache[1])
+        
+        status = self._fetch_service_status()
+        self._status_cache = (now, status)
+        return dict(status)
+    
+    def _fetch_service_status(self) -> Dict[str, Any]:
+        """Check the account with Twilio and build the service status."""
         try:
             # Test connection to Twilio by fetching account info
             account = self.client.api.account.fetch()
@@ -243,7 +439,7 @@ class TwilioPhoneClient:
             }
             
         except TwilioException as e:
-            logger.error(f"Twilio service status check failed: {e}")
+            logger.error("Twilio service status check failed: %s", e)
             return {
                 'twilio_available': True,
                 'security_validated': False,
@@ -257,7 +453,7 @@ class TwilioPhoneClient:
             }
             
         except Exception as e:
-            logger.error(f"Service status check failed: {e}")
+            logger.error("Service status check failed: %s", e)
             return {
                 'twilio_available': False,
                 'security_validated': False,
@@ -1,15 +1,94 @@
 """
 ElevenLabs API client for voice synthesis and cloning.
 """
+import copy
+import importlib.util
 import requests
-from typing import List, Dict, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import AsyncIterator, BinaryIO, List, Dict, Iterator, Optional, Any, Tuple, Union
 import json
+import time
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTTP/2 lets concurrent async requests share one connection; httpx only
+# negotiates it when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from requests_toolbelt import MultipartEncoder
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
+
+# Connection pool sizing for the shared keep-alive session
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Rate limits and transient server error responses are retried on the pooled
+# connection with exponential backoff, honouring Retry-After. The final
+# failed response is still returned so _request reports it.
+RETRY_POLICY = Retry(
+    total=5,
+    connect=0,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Seconds that voice listings and voice settings are served from cache
+DEFAULT_CACHE_TTL = 300
+
+# Bytes per chunk when streaming synthesized audio
+STREAM_CHUNK_SIZE = 4096
+
+# Request bodies are JSON except voice cloning, which drops the session
+# Content-Type so requests can set the multipart boundary
+_MULTIPART_HEADERS = {"Content-Type": None}
+
+
+def _dumps(payload: Any) -> bytes:
+    """Encode a request body as JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def _raise_for_async_status(response: "httpx.Response") -> None:
+    """Raise the async counterpart of ``_request``'s error for non-200 responses."""
+    if response.status_code != 200:
+        raise httpx.HTTPStatusError(
+            f"API error {response.status_code}: {response.text}",
+            request=response.request,
+            response=response
+        )
 
 
 class ElevenLabsClient:
     """Client for interacting with ElevenLabs API."""
     
-    def __init__(self, api_key: str, base_url: str = "https://api.elevenlabs.io/v1", timeout: int = 30):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.elevenlabs.io/v1",
+        timeout: int = 30,
+        cache_ttl: float = DEFAULT_CACHE_TTL
+    ):
         """
         Initialize the ElevenLabs client.
         
@@ -17,6 +96,7 @@ class ElevenLabsClient:
             api_key: ElevenLabs API key
             base_url: Base URL for the API
             timeout: Request timeout in seconds
+            cache_ttl: Seconds to cache voice listings and settings; 0 disables caching
         """
         if not api_key:
             raise ValueError("API key is required")
@@ -24,53 +104,210 @@ class ElevenLabsClient:
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+        
+        # One keep-alive session so calls reuse the TLS connection to ElevenLabs
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY_POLICY
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Cloning creates a voice and may stream its upload, so it is never replayed
+        self._session.mount(
+            f"{base_url}/voices/add", HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+        )
+        self._session.headers.update({"xi-api-key": api_key, "Content-Type": "application/json"})
+        self._aclient = None
     
-    def get_voices(self) -> List[Dict[str, Any]]:
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
+    
+    def __enter__(self) -> "ElevenLabsClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _get_aclient(self) -> "httpx.AsyncClient":
+        """Return the pooled async client, creating it on first use."""
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx is required for async ElevenLabs calls. Install with: pip install httpx")
+        
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=HTTP2_AVAILABLE,
+                headers={"xi-api-key": self.api_key, "Content-Type": "application/json"},
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=POOL_CONNECTIONS, max_connections=POOL_MAXSIZE)
+            )
+        return self._aclient
+    
+    async def aclose(self) -> None:
+        """Close pooled async connections."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+    
+    async def __aenter__(self) -> "ElevenLabsClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+        self.close()
+    
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
         """
-        Retrieve available voices from ElevenLabs.
+        Send a request to the API over the shared session.
+        
+        Args:
+            method: Session method name ("get" or "post")
+            path: Endpoint path relative to ``base_url``
+            **kwargs: Extra arguments passed through to the session
         
         Returns:
-            List of voice dictionaries with voice_id, name, and category
-        """
-        url = f"{self.base_url}/voices"
-        headers = {"xi-api-key": self.api_key}
+            The successful response
         
-        response = requests.get(url, headers=headers, timeout=self.timeout)
+        Raises:
+            requests.HTTPError: If the API answers with a non-200 status
+        """
+        response = getattr(self._session, method)(f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
         
         if response.status_code != 200:
-            raise Exception(f"API error {response.status_code}: {response.text}")
+            message = f"API error {response.status_code}: {response.text}"
+            response.close()
+            raise requests.HTTPError(message, response=response)
         
-        return response.json().get("voices", [])
+        return response
     
-    def clone_voice(self, voice_name: str, audio_files: List[bytes]) -> Dict[str, str]:
+    async def _arequest(self, method: str, path: str, **kwargs) -> "httpx.Response":
+        """
+        Send a request to the API over the pooled async client.
+        
+        Args:
+            method: HTTP method
+            path: Endpoint path relative to ``base_url``
+            **kwargs: Extra arguments passed through to httpx
+        
+        Returns:
+            The successful response
+        
+        Raises:
+            httpx.HTTPStatusError: If the API answers with a non-200 status
+        """
+        response = await self._get_aclient().request(method, path, **kwargs)
+        _raise_for_async_status(response)
+        return response
+    
+    def _cache_lookup(self, key: Tuple[str, ...]) -> Optional[Any]:
+        """Return a fresh cached value, or None."""
+        if self.cache_ttl > 0:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+        return None
+    
+    def _cache_store(self, key: Tuple[str, ...], value: Any) -> Any:
+        """Cache a value for ``cache_ttl`` seconds and return it."""
+        if self.cache_ttl > 0:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+        return value
+    
+    def _cached_get(self, key: Tuple[str, ...], path: str) -> Any:
+        """GET a JSON resource, serving a copy from the TTL cache while fresh."""
+        value = self._cache_lookup(key)
+        if value is None:
+            value = self._cache_store(key, self._request("get", path).json())
+        # Callers may edit the result; never hand out the cached object itself
+        return copy.deepcopy(value)
+    
+    async def _cached_aget(self, key: Tuple[str, ...], path: str) -> Any:
+        """Async ``_cached_get``; both share one cache."""
+        value = self._cache_lookup(key)
+        if value is None:
+            value = self._cache_store(key, (await self._arequest("GET", path)).json())
+        return copy.deepcopy(value)
+    
+    def get_voices(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve available voices from ElevenLabs.
+        
+        Returns:
+            List of voice dictionaries with voice_id, name, and category
+        """
+        return self._cached_get(("voices",), "/voices").get("voices", [])
+    
+    async def get_voices_async(self) -> List[Dict[str, Any]]:
+        """Async ``get_voices`` over the pooled async client."""
+        return (await self._cached_aget(("voices",), "/voices")).get("voices", [])
+    
+    def clone_voice(self, voice_name: str, audio_files: List[Union[bytes, BinaryIO]]) -> Dict[str, str]:
         """
         Clone a voice from audio samples.
         
         Args:
             voice_name: Name for the cloned voice
-            audio_files: List of audio file data (bytes)
+            audio_files: Audio samples as bytes or open binary files
         
         Returns:
             Dictionary containing the new voice_id
-        """
-        url = f"{self.base_url}/voices/add"
-        headers = {"xi-api-key": self.api_key}
         
+        With requests_toolbelt installed the multipart body is streamed, so
+        samples passed as open files are never loaded into memory whole.
+        """
         # Prepare files for multipart upload
-        files = []
-        for i, audio_data in enumerate(audio_files):
-            files.append(('files', (f'sample_{i}.wav', audio_data, 'audio/wav')))
+        files = [
+            ('files', (f'sample_{i}.wav', audio_data, 'audio/wav'))
+            for i, audio_data in enumerate(audio_files)
+        ]
         
-        # Prepare form data
-        data = {'name': voice_name}
+        if TOOLBELT_AVAILABLE:
+            encoder = MultipartEncoder(fields=[('name', voice_name), *files])
+            response = self._request(
+                "post", "/voices/add", data=encoder, headers={"Content-Type": encoder.content_type}
+            )
+        else:
+            response = self._request(
+                "post", "/voices/add", files=files, data={'name': voice_name}, headers=_MULTIPART_HEADERS
+            )
         
-        response = requests.post(url, headers=headers, files=files, data=data, timeout=self.timeout)
-        
-        if response.status_code != 200:
-            raise Exception(f"API error {response.status_code}: {response.text}")
+        # The voices list now includes the clone
+        self._cache.pop(("voices",), None)
         
         return response.json()
     
+    def _synthesis_request(
+        self,
+        voice_id: str,
+        text: str,
+        model_id: str,
+        voice_settings: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the path and JSON payload for a text-to-speech request."""
+        if not text.strip():
+            raise ValueError("Text cannot be empty")
+        
+        path = f"/text-to-speech/{voice_id}"
+        
+        # Default voice settings
+        if voice_settings is None:
+            voice_settings = {
+                "stability": 0.75,
+                "similarity_boost": 0.75,
+                "style": 0.0,
+                "use_speaker_boost": True
+            }
+        
+        payload = {
+            "text": text,
+            "model_id": model_id,
+            "voice_settings": voice_settings
+        }
+        return path, payload
+    
     def synthesize_speech(
         self, 
         voice_id: str, 
@@ -89,37 +326,77 @@ class ElevenLabsClient:
         
         Returns:
             Audio data as bytes
+        
+        Several utterances can be synthesized concurrently over the shared
+        session, e.g. ``asyncio.gather(*(asyncio.to_thread(client.synthesize_speech,
+        voice_id, text) for text in texts))``. Use ``synthesize_speech_stream``
+        to forward long outputs without buffering them.
         """
-        if not text.strip():
-            raise ValueError("Text cannot be empty")
+        path, payload = self._synthesis_request(voice_id, text, model_id, voice_settings)
         
-        url = f"{self.base_url}/text-to-speech/{voice_id}"
-        headers = {
-            "xi-api-key": self.api_key,
-            "Content-Type": "application/json"
-        }
+        return self._request("post", path, data=_dumps(payload)).content
+    
+    def synthesize_speech_stream(
+        self,
+        voice_id: str,
+        text: str,
+        model_id: str = "eleven_multilingual_v2",
+        voice_settings: Optional[Dict[str, Any]] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Synthesize speech and yield the audio as it arrives.
         
-        # Default voice settings
-        if voice_settings is None:
-            voice_settings = {
-                "stability": 0.75,
-                "similarity_boost": 0.75,
-                "style": 0.0,
-                "use_speaker_boost": True
-            }
+        Args:
+            voice_id: ID of the voice to use
+            text: Text to synthesize
+            model_id: Model to use for synthesis
+            voice_settings: Voice configuration settings
+            chunk_size: Maximum bytes per yielded chunk
         
-        payload = {
-            "text": text,
-            "model_id": model_id,
-            "voice_settings": voice_settings
-        }
+        Yields:
+            Audio data chunks, suitable for piping to a file or websocket
+        """
+        path, payload = self._synthesis_request(voice_id, text, model_id, voice_settings)
         
-        response = requests.post(url, headers=headers, json=payload, timeout=self.timeout)
+        with self._request("post", path, data=_dumps(payload), stream=True) as response:
+            yield from response.iter_content(chunk_size=chunk_size)
+    
+    async def synthesize_speech_async(
+        self,
+        voice_id: str,
+        text: str,
+        model_id: str = "eleven_multilingual_v2",
+        voice_settings: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Async ``synthesize_speech`` over the pooled async client.
         
-        if response.status_code != 200:
-            raise Exception(f"API error {response.status_code}: {response.text}")
+        Concurrent calls share the client's connections (multiplexed over
+        one connection when HTTP/2 is available).
+        """
+        path, payload = self._synthesis_request(voice_id, text, model_id, voice_settings)
         
-        return response.content
+        return (await self._arequest("POST", path, content=_dumps(payload))).content
+    
+    async def synthesize_speech_stream_async(
+        self,
+        voice_id: str,
+        text: str,
+        model_id: str = "eleven_multilingual_v2",
+        voice_settings: Optional[Dict[str, Any]] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Async ``synthesize_speech_stream`` over the pooled async client."""
+        path, payload = self._synthesis_request(voice_id, text, model_id, voice_settings)
+        
+        async with self._get_aclient().stream("POST", path, content=_dumps(payload)) as response:
+            if response.status_code != 200:
+                await response.aread()
+                _raise_for_async_status(response)
+            
+            async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                yield chunk
     
     def get_voice_settings(self, voice_id: str) -> Dict[str, Any]:
         """
@@ -131,15 +408,11 @@ class ElevenLabsClient:
         Returns:
             Voice settings dictionary
         """
-        url = f"{self.base_url}/voices/{voice_id}/settings"
-        headers = {"xi-api-key": self.api_key}
-        
-        response = requests.get(url, headers=headers, timeout=self.timeout)
-        
-        if response.status_code != 200:
-            raise Exception(f"API error {response.status_code}: {response.text}")
-        
-        return response.json()
+        return self._cached_get(("settings", voice_id), f"/voices/{voice_id}/settings")
+    
+    async def get_voice_settings_async(self, voice_id: str) -> Dict[str, Any]:
+        """Async ``get_voice_settings`` over the pooled async client."""
+        return await self._cached_aget(("settings", voice_id), f"/voices/{voice_id}/settings")
     
     def update_voice_settings(self, voice_id: str, settings: Dict[str, Any]) -> bool:
         """
@@ -152,15 +425,8 @@ class ElevenLabsClient:
         Returns:
             True if successful
         """
-        url = f"{self.base_url}/voices/{voice_id}/settings/edit"
-        headers = {
-            "xi-api-key": self.api_key,
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.post(url, headers=headers, json=settings, timeout=self.timeout)
+        self._request("post", f"/voices/{voice_id}/settings/edit", data=_dumps(settings))
         
-        if response.status_code != 200:
-            raise Exception(f"API error {response.status_code}: {response.text}")
+        self._cache.pop(("settings", voice_id), None)
         
         return True
\ No newline at end of file
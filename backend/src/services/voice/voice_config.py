@@ -1,11 +1,91 @@
 """
 Voice configuration and personality settings for ElevenLabs voice synthesis.
 """
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, Optional, Pattern
+
+
+# Business context adjustments; keys are lower-case and checked in order
+_INDUSTRY_ADJUSTMENTS: Dict[str, Dict[str, float]] = {
+    "finance": {"stability": 0.85, "style": 0.15},
+    "legal": {"stability": 0.9, "style": 0.1},
+    "healthcare": {"stability": 0.8, "style": 0.25},
+    "technology": {"stability": 0.7, "style": 0.4},
+    "education": {"stability": 0.75, "style": 0.3},
+    "marketing": {"stability": 0.6, "style": 0.5},
+    "entertainment": {"stability": 0.5, "style": 0.6},
+    "consulting": {"stability": 0.8, "style": 0.2},
+    "retail": {"stability": 0.65, "style": 0.45}
+}
+
+_TONE_ADJUSTMENTS: Dict[str, Dict[str, float]] = {
+    "professional": {"stability": 0.8, "style": 0.2},
+    "casual": {"stability": 0.6, "style": 0.4},
+    "formal": {"stability": 0.85, "style": 0.15},
+    "energetic": {"stability": 0.55, "style": 0.55},
+    "authoritative": {"stability": 0.85, "style": 0.1},
+    "friendly": {"stability": 0.65, "style": 0.45},
+    "conversational": {"stability": 0.6, "style": 0.4}
+}
+
+_CONTENT_TYPE_ADJUSTMENTS: Dict[str, Dict[str, float]] = {
+    "announcement": {"stability": 0.85, "style": 0.3},
+    "presentation": {"stability": 0.8, "style": 0.25},
+    "conversation": {"stability": 0.65, "style": 0.45},
+    "narration": {"stability": 0.75, "style": 0.35},
+    "advertisement": {"stability": 0.6, "style": 0.55},
+    "tutorial": {"stability": 0.8, "style": 0.2},
+    "storytelling": {"stability": 0.65, "style": 0.5},
+    "phone_greeting": {"stability": 0.75, "style": 0.3},
+    "voicemail": {"stability": 0.8, "style": 0.25}
+}
+
+# Target audience keyword -> adjustment group, checked in order
+_AUDIENCE_GROUPS: Dict[str, str] = {
+    "executives": "executive",
+    "leadership": "executive",
+    "young": "young",
+    "millennials": "young",
+    "seniors": "senior"
+}
+
+
+def _first_in_order(keys) -> Pattern:
+    """Compile a matcher whose hit is the first key, in table order, found anywhere.
+    
+    Each alternative is a lookahead tried from the start of the string, so
+    an earlier key wins even if a later key appears closer to the start.
+    """
+    return re.compile("|".join(f"(?=.*?({re.escape(key)}))" for key in keys), re.DOTALL)
+
+
+def _match_key(pattern: Pattern, text: str) -> Optional[str]:
+    """Return the table key matched by a ``_first_in_order`` pattern, if any."""
+    match = pattern.match(text)
+    return match.group(match.lastindex) if match else None
+
+
+_INDUSTRY_RE = _first_in_order(_INDUSTRY_ADJUSTMENTS)
+_TONE_RE = _first_in_order(_TONE_ADJUSTMENTS)
+_AUDIENCE_RE = _first_in_order(_AUDIENCE_GROUPS)
+
+# Brand trait -> adjustment group
+_BRAND_TRAIT_GROUPS: Dict[str, str] = {
+    **dict.fromkeys(("energetic", "dynamic", "vibrant"), "energetic"),
+    **dict.fromkeys(("reliable", "trustworthy", "stable"), "reliable"),
+    **dict.fromkeys(("innovative", "creative", "bold"), "innovative"),
+    **dict.fromkeys(("calm", "peaceful", "zen"), "calm")
+}
 
 
 class VoiceConfig:
-    """Configuration class for voice synthesis parameters."""
+    """Configuration class for voice synthesis parameters.
+    
+    Instances are immutable so preset configurations can be shared; use
+    ``adjust_for_content_type`` or a new instance to change settings.
+    """
+    
+    __slots__ = ("stability", "similarity_boost", "style", "use_speaker_boost", "model_id", "_str")
     
     def __init__(
         self,
@@ -25,11 +105,51 @@ class VoiceConfig:
             use_speaker_boost: Whether to use speaker boost for clarity
             model_id: ElevenLabs model ID to use
         """
-        self.stability = self._validate_range(stability, "Stability")
-        self.similarity_boost = self._validate_range(similarity_boost, "Similarity boost")
-        self.style = self._validate_range(style, "Style")
-        self.use_speaker_boost = use_speaker_boost
-        self.model_id = model_id
+        self._set_fields(
+            self._validate_range(stability, "Stability"),
+            self._validate_range(similarity_boost, "Similarity boost"),
+            self._validate_range(style, "Style"),
+            use_speaker_boost,
+            model_id
+        )
+    
+    @classmethod
+    def _unchecked(
+        cls,
+        stability: float,
+        similarity_boost: float,
+        style: float,
+        use_speaker_boost: bool = True,
+        model_id: str = "eleven_multilingual_v2"
+    ) -> 'VoiceConfig':
+        """Build a configuration from values already known to be in range."""
+        config = object.__new__(cls)
+        config._set_fields(stability, similarity_boost, style, use_speaker_boost, model_id)
+        return config
+    
+    def _set_fields(
+        self,
+        stability: float,
+        similarity_boost: float,
+        style: float,
+        use_speaker_boost: bool,
+        model_id: str
+    ) -> None:
+        """Assign every slot once, bypassing the immutability guard."""
+        set_field = object.__setattr__
+        set_field(self, "stability", stability)
+        set_field(self, "similarity_boost", similarity_boost)
+        set_field(self, "style", style)
+        set_field(self, "use_speaker_boost", use_speaker_boost)
+        set_field(self, "model_id", model_id)
+        # Fields never change, so the representation is rendered once
+        set_field(self, "_str", f"VoiceConfig(stability={stability}, similarity_boost={similarity_boost}, "
+                                f"style={style}, use_speaker_boost={use_speaker_boost}, model={model_id})")
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, name):
+            raise AttributeError(f"VoiceConfig is immutable; cannot reassign {name}")
+        object.__setattr__(self, name, value)
     
     def _validate_range(self, value: float, parameter_name: str) -> float:
         """Validate that parameter is within 0.0-1.0 range."""
@@ -60,64 +180,12 @@ class VoiceConfig:
             personality_type: Type of personality (professional, casual, energetic, etc.)
         
         Returns:
-            VoiceConfig instance configured for the personality
+            Shared VoiceConfig instance configured for the personality
         """
-        personality_configs = {
-            "professional": {
-                "stability": 0.75,
-                "similarity_boost": 0.85,
-                "style": 0.2,
-                "use_speaker_boost": True
-            },
-            "casual": {
-                "stability": 0.6,
-                "similarity_boost": 0.75,
-                "style": 0.4,
-                "use_speaker_boost": True
-            },
-            "energetic": {
-                "stability": 0.5,
-                "similarity_boost": 0.7,
-                "style": 0.6,
-                "use_speaker_boost": True
-            },
-            "authoritative": {
-                "stability": 0.85,
-                "similarity_boost": 0.8,
-                "style": 0.1,
-                "use_speaker_boost": True
-            },
-            "friendly": {
-                "stability": 0.65,
-                "similarity_boost": 0.75,
-                "style": 0.5,
-                "use_speaker_boost": True
-            },
-            "calm": {
-                "stability": 0.9,
-                "similarity_boost": 0.85,
-                "style": 0.1,
-                "use_speaker_boost": False
-            },
-            "conversational": {
-                "stability": 0.6,
-                "similarity_boost": 0.7,
-                "style": 0.45,
-                "use_speaker_boost": True
-            },
-            "corporate": {
-                "stability": 0.8,
-                "similarity_boost": 0.85,
-                "style": 0.15,
-                "use_speaker_boost": True
-            }
-        }
-        
-        if personality_type not in personality_configs:
-            raise ValueError(f"Unknown personality type: {personality_type}")
-        
-        config = personality_configs[personality_type]
-        return cls(**config)
+        try:
+            return _PERSONALITY_PRESETS[personality_type]
+        except KeyError:
+            raise ValueError(f"Unknown personality type: {personality_type}") from None
     
     @classmethod
     def from_business_context(
@@ -150,67 +218,44 @@ class VoiceConfig:
             "use_speaker_boost": True
         }
         
-        # Adjust based on industry
-        industry_adjustments = {
-            "finance": {"stability": 0.85, "style": 0.15},
-            "legal": {"stability": 0.9, "style": 0.1},
-            "healthcare": {"stability": 0.8, "style": 0.25},
-            "technology": {"stability": 0.7, "style": 0.4},
-            "education": {"stability": 0.75, "style": 0.3},
-            "marketing": {"stability": 0.6, "style": 0.5},
-            "entertainment": {"stability": 0.5, "style": 0.6},
-            "consulting": {"stability": 0.8, "style": 0.2},
-            "retail": {"stability": 0.65, "style": 0.45}
-        }
-        
-        for industry_key, adjustments in industry_adjustments.items():
-            if industry_key.lower() in industry.lower():
-                config.update(adjustments)
-                break
+        # Adjust based on industry and tone (first matching table entry wins)
+        industry_key = _match_key(_INDUSTRY_RE, industry.lower())
+        if industry_key:
+            config.update(_INDUSTRY_ADJUSTMENTS[industry_key])
         
-        # Adjust based on tone
-        tone_adjustments = {
-            "professional": {"stability": 0.8, "style": 0.2},
-            "casual": {"stability": 0.6, "style": 0.4},
-            "formal": {"stability": 0.85, "style": 0.15},
-            "energetic": {"stability": 0.55, "style": 0.55},
-            "authoritative": {"stability": 0.85, "style": 0.1},
-            "friendly": {"stability": 0.65, "style": 0.45},
-            "conversational": {"stability": 0.6, "style": 0.4}
-        }
-        
-        for tone_key, adjustments in tone_adjustments.items():
-            if tone_key.lower() in tone.lower():
-                config.update(adjustments)
-                break
+        tone_key = _match_key(_TONE_RE, tone.lower())
+        if tone_key:
+            config.update(_TONE_ADJUSTMENTS[tone_key])
         
         # Adjust based on target audience
-        if "executives" in target_audience.lower() or "leadership" in target_audience.lower():
+        audience_group = _AUDIENCE_GROUPS.get(_match_key(_AUDIENCE_RE, target_audience.lower()))
+        if audience_group == "executive":
             config["stability"] = min(config["stability"] + 0.1, 1.0)
             config["style"] = max(config["style"] - 0.1, 0.0)
-        elif "young" in target_audience.lower() or "millennials" in target_audience.lower():
+        elif audience_group == "young":
             config["style"] = min(config["style"] + 0.1, 1.0)
-        elif "seniors" in target_audience.lower():
+        elif audience_group == "senior":
             config["stability"] = min(config["stability"] + 0.1, 1.0)
             config["style"] = max(config["style"] - 0.1, 0.0)
         
         # Adjust based on brand personality
         for trait in brand_personality:
-            trait_lower = trait.lower()
-            if trait_lower in ["energetic", "dynamic", "vibrant"]:
+            trait_group = _BRAND_TRAIT_GROUPS.get(trait.lower())
+            if trait_group == "energetic":
                 config["style"] = min(config["style"] + 0.1, 1.0)
                 config["stability"] = max(config["stability"] - 0.05, 0.0)
-            elif trait_lower in ["reliable", "trustworthy", "stable"]:
+            elif trait_group == "reliable":
                 config["stability"] = min(config["stability"] + 0.1, 1.0)
                 config["style"] = max(config["style"] - 0.05, 0.0)
-            elif trait_lower in ["innovative", "creative", "bold"]:
+            elif trait_group == "innovative":
                 config["style"] = min(config["style"] + 0.15, 1.0)
-            elif trait_lower in ["calm", "peaceful", "zen"]:
+            elif trait_group == "calm":
                 config["stability"] = min(config["stability"] + 0.1, 1.0)
                 config["style"] = max(config["style"] - 0.1, 0.0)
                 config["use_speaker_boost"] = False
         
-        return cls(**config)
+        # Table values are in range and every adjustment above is clamped
+        return cls._unchecked(**config)
     
     def adjust_for_content_type(self, content_type: str) -> 'VoiceConfig':
         """
@@ -222,24 +267,11 @@ class VoiceConfig:
         Returns:
             New VoiceConfig instance adjusted for content type
         """
-        adjustments = {
-            "announcement": {"stability": 0.85, "style": 0.3},
-            "presentation": {"stability": 0.8, "style": 0.25},
-            "conversation": {"stability": 0.65, "style": 0.45},
-            "narration": {"stability": 0.75, "style": 0.35},
-            "advertisement": {"stability": 0.6, "style": 0.55},
-            "tutorial": {"stability": 0.8, "style": 0.2},
-            "storytelling": {"stability": 0.65, "style": 0.5},
-            "phone_greeting": {"stability": 0.75, "style": 0.3},
-            "voicemail": {"stability": 0.8, "style": 0.25}
-        }
-        
-        if content_type not in adjustments:
+        adjustment = _CONTENT_TYPE_ADJUSTMENTS.get(content_type)
+        if adjustment is None:
             return self
         
-        adjustment = adjustments[content_type]
-        
-        return VoiceConfig(
+        return VoiceConfig._unchecked(
             stability=adjustment.get("stability", self.stability),
             similarity_boost=self.similarity_boost,
             style=adjustment.get("style", self.style),
@@ -277,9 +309,21 @@ class VoiceConfig:
     
     def __str__(self) -> str:
         """String representation of the voice configuration."""
-        return (f"VoiceConfig(stability={self.stability}, similarity_boost={self.similarity_boost}, "
-                f"style={self.style}, use_speaker_boost={self.use_speaker_boost}, model={self.model_id})")
+        return self._str
     
     def __repr__(self) -> str:
         """Detailed string representation."""
-        return self.__str__()
\ No newline at end of file
+        return self._str
+
+
+# Personality presets, built once and shared since VoiceConfig is immutable
+_PERSONALITY_PRESETS: Dict[str, VoiceConfig] = {
+    "professional": VoiceConfig(stability=0.75, similarity_boost=0.85, style=0.2, use_speaker_boost=True),
+    "casual": VoiceConfig(stability=0.6, similarity_boost=0.75, style=0.4, use_speaker_boost=True),
+    "energetic": VoiceConfig(stability=0.5, similarity_boost=0.7, style=0.6, use_speaker_boost=True),
+    "authoritative": VoiceConfig(stability=0.85, similarity_boost=0.8, style=0.1, use_speaker_boost=True),
+    "friendly": VoiceConfig(stability=0.65, similarity_boost=0.75, style=0.5, use_speaker_boost=True),
+    "calm": VoiceConfig(stability=0.9, similarity_boost=0.85, style=0.1, use_speaker_boost=False),
+    "conversational": VoiceConfig(stability=0.6, similarity_boost=0.7, style=0.45, use_speaker_boost=True),
+    "corporate": VoiceConfig(stability=0.8, similarity_boost=0.85, style=0.15, use_speaker_boost=True)
+}
@@ -2,7 +2,8 @@
 Voice model definitions and data structures.
 """
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping
 from enum import Enum
 import random
 
@@ -22,15 +23,40 @@ class VoiceType(Enum):
     GENERATED = "generated"
 
 
+# Vocal characteristics per tone, shared read-only across instances
+_DEFAULT_CHARACTERISTICS = MappingProxyType({"pitch": "medium", "pace": "steady", "emphasis": "clear"})
+
+_TONE_CHARACTERISTICS = {
+    "professional": _DEFAULT_CHARACTERISTICS,
+    "friendly": MappingProxyType({"pitch": "medium", "pace": "relaxed", "emphasis": "warm"}),
+    "authoritative": MappingProxyType({"pitch": "low", "pace": "deliberate", "emphasis": "strong"}),
+    "casual": MappingProxyType({"pitch": "high", "pace": "quick", "emphasis": "light"}),
+}
+
+# Sample scripts for voice training: company introduction, service-oriented,
+# brand personality and common phrases
+_SAMPLE_SCRIPT_TEMPLATES = (
+    "Hello, welcome to {company_name}. We're leaders in the {industry} "
+    "industry, committed to providing {target_audience} with innovative solutions.",
+    "At {company_name}, we understand the needs of {target_audience}. "
+    "Our {tone} approach ensures you get the best service every time.",
+    "What makes {company_name} different? We're {personality}, "
+    "which means you can trust us to deliver excellence in everything we do.",
+    "Thank you for choosing {company_name}. How can we help you today? "
+    "We're here to support {target_audience} with {tone} service.",
+)
+
+
 class VoiceModel:
     """Voice model for business-driven voice generation."""
     
+    REQUIRED_FIELDS = ("company_name", "industry", "tone", "target_audience", "brand_personality")
+    _REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+    
     def __init__(self, business_data: Dict[str, Any]):
         """Initialize with business data dictionary."""
-        required_fields = ["company_name", "industry", "tone", "target_audience", "brand_personality"]
-        
-        missing_fields = [field for field in required_fields if field not in business_data]
-        if missing_fields:
+        if not self._REQUIRED_FIELD_SET.issubset(business_data):
+            missing_fields = [field for field in self.REQUIRED_FIELDS if field not in business_data]
             raise ValueError(f"Missing required fields: {missing_fields}")
         
         self.company_name = business_data["company_name"]
@@ -40,10 +66,16 @@ class VoiceModel:
         self.brand_personality = business_data["brand_personality"]
         
         # Optional fields
-        self.voice_id = business_data.get("voice_id", f"voice_{self.company_name.lower()}")
+        self.voice_id = (
+            business_data["voice_id"] if "voice_id" in business_data
+            else f"voice_{self.company_name.lower()}"
+        )
         self.language = business_data.get("language", "en")
-        self.provider = business_data.get("provider", VoiceProvider.ELEVENLABS)
-        self.voice_type = business_data.get("voice_type", VoiceType.GENERATED)
+        # Enum members are stored by value so serialization needs no type checks
+        provider = business_data.get("provider", VoiceProvider.ELEVENLABS)
+        self.provider = provider.value if isinstance(provider, VoiceProvider) else provider
+        voice_type = business_data.get("voice_type", VoiceType.GENERATED)
+        self.voice_type = voice_type.value if isinstance(voice_type, VoiceType) else voice_type
     
     def generate_voice_description(self) -> str:
         """Generate voice description from business data."""
@@ -57,54 +89,14 @@ class VoiceModel:
         
         return description
     
-    def get_voice_characteristics(self) -> Dict[str, str]:
+    def get_voice_characteristics(self) -> Mapping[str, str]:
         """Extract voice characteristics based on business data."""
-        # Map tone to vocal characteristics
-        tone_mapping = {
-            "professional": {"pitch": "medium", "pace": "steady", "emphasis": "clear"},
-            "friendly": {"pitch": "medium", "pace": "relaxed", "emphasis": "warm"},
-            "authoritative": {"pitch": "low", "pace": "deliberate", "emphasis": "strong"},
-            "casual": {"pitch": "high", "pace": "quick", "emphasis": "light"},
-        }
-        
-        characteristics = tone_mapping.get(self.tone, {
-            "pitch": "medium",
-            "pace": "steady", 
-            "emphasis": "clear"
-        })
-        
-        return characteristics
+        return _TONE_CHARACTERISTICS.get(self.tone, _DEFAULT_CHARACTERISTICS)
     
     def generate_sample_scripts(self) -> List[str]:
         """Generate sample scripts for voice training."""
-        scripts = []
-        
-        # Company introduction scripts
-        scripts.append(
-            f"Hello, welcome to {self.company_name}. We're leaders in the {self.industry} "
-            f"industry, committed to providing {self.target_audience} with innovative solutions."
-        )
-        
-        # Service-oriented script
-        scripts.append(
-            f"At {self.company_name}, we understand the needs of {self.target_audience}. "
-            f"Our {self.tone} approach ensures you get the best service every time."
-        )
-        
-        # Brand personality script
-        personality = " and ".join(self.brand_personality)
-        scripts.append(
-            f"What makes {self.company_name} different? We're {personality}, "
-            f"which means you can trust us to deliver excellence in everything we do."
-        )
-        
-        # Common phrases script
-        scripts.append(
-            f"Thank you for choosing {self.company_name}. How can we help you today? "
-            f"We're here to support {self.target_audience} with {self.tone} service."
-        )
-        
-        return scripts
+        context = dict(vars(self), personality=" and ".join(self.brand_personality))
+        return [template.format_map(context) for template in _SAMPLE_SCRIPT_TEMPLATES]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -116,8 +108,8 @@ class VoiceModel:
             "target_audience": self.target_audience,
             "brand_personality": self.brand_personality,
             "language": self.language,
-            "provider": self.provider.value if isinstance(self.provider, VoiceProvider) else self.provider,
-            "voice_type": self.voice_type.value if isinstance(self.voice_type, VoiceType) else self.voice_type
+            "provider": self.provider,
+            "voice_type": self.voice_type
         }
 
 
@@ -170,5 +162,6 @@ class VoiceConfiguration:
             age=data.get("age"),
             description=data.get("description"),
             sample_rate=data.get("sample_rate", 22050),
-            settings=data.get("settings", {})
+            # __post_init__ supplies the empty default
+            settings=data.get("settings")
         )
\ No newline at end of file
@@ -2,23 +2,36 @@
 Voice Agent Service
 Business logic for voice agent management with tenant isolation
 """
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime
 
 # Import Google Cloud Firestore - REAL implementation
 try:
-    from google.cloud.firestore import Client
-    from src.services.firebase_config import get_firestore_client
+    from google.api_core.exceptions import GoogleAPICallError
+    from google.cloud.firestore import AsyncClient, Client, SERVER_TIMESTAMP
+    from src.services.firebase_config import get_async_firestore_client, get_firestore_client
     HAS_FIRESTORE = True
 except ImportError:
     # Mock Firestore Client for testing
     class Client:
         pass
     
+    class AsyncClient:
+        pass
+    
+    class GoogleAPICallError(Exception):
+        pass
+    
+    SERVER_TIMESTAMP = object()
+    
     def get_firestore_client():
         return MockFirestoreClient()
     
+    def get_async_firestore_client():
+        return MockAsyncFirestoreClient()
+    
     HAS_FIRESTORE = False
 
 # Mock Firestore implementation for testing
@@ -28,6 +41,13 @@ class MockFirestoreClient:
         
     def collection(self, name):
         return MockCollection(self._data, name)
+    
+    def write_option(self, **kwargs):
+        return None
+    
+    def get_all(self, references, field_paths=None):
+        for reference in references:
+            yield reference.get(field_paths=field_paths)
 
 class MockCollection:
     def __init__(self, data, name):
@@ -48,14 +68,19 @@ class MockDocument:
         self._doc_id = doc_id
         
     def set(self, data):
-        self._collection_data[self._doc_id] = data
+        self._collection_data[self._doc_id] = self._resolve_server_timestamps(data)
         
-    def get(self):
+    def get(self, field_paths=None):
         return MockDocumentSnapshot(self._collection_data, self._doc_id)
         
-    def update(self, updates):
+    def update(self, updates, option=None):
         if self._doc_id in self._collection_data:
-            self._collection_data[self._doc_id].update(updates)
+            self._collection_data[self._doc_id].update(self._resolve_server_timestamps(updates))
+    
+    @staticmethod
+    def _resolve_server_timestamps(data):
+        # Firestore replaces SERVER_TIMESTAMP sentinels with the commit time
+        return {key: datetime.utcnow() if value is SERVER_TIMESTAMP else value for key, value in data.items()}
 
 class MockDocumentSnapshot:
     def __init__(self, collection_data, doc_id):
@@ -69,9 +94,14 @@ class MockDocumentSnapshot:
     @property
     def id(self):
         return self._doc_id
+    
+    @property
+    def update_time(self):
+        return None
         
     def to_dict(self):
-        return self._collection_data.get(self._doc_id, {})
+        # Like Firestore, hand out a fresh dict rather than the stored one
+        return dict(self._collection_data.get(self._doc_id, {}))
 
 class MockQuery:
     def __init__(self, collection_data, field, op, value):
@@ -79,6 +109,9 @@ class MockQuery:
         self._field = field
         self._op = op
         self._value = value
+        self._fields = None
+        self._limit = None
+        self._start_after = None
         
     def where(self, field, op, value):
         # Chain additional filters
@@ -86,31 +119,126 @@ class MockQuery:
         
     def order_by(self, field, direction='ASCENDING'):
         return self
+    
+    def select(self, field_paths):
+        self._fields = list(field_paths)
+        return self
+    
+    def limit(self, count):
+        self._limit = count
+        return self
+    
+    def start_after(self, snapshot):
+        self._start_after = snapshot.id
+        return self
         
     def stream(self):
         # Return matching documents
-        for doc_id, data in self._collection_data.items():
-            if self._matches(data):
-                yield MockDocumentSnapshot({doc_id: data}, doc_id)
+        matches = [(doc_id, data) for doc_id, data in self._collection_data.items() if self._matches(data)]
+        if self._start_after is not None:
+            ids = [doc_id for doc_id, _ in matches]
+            matches = matches[ids.index(self._start_after) + 1:] if self._start_after in ids else []
+        if self._limit is not None:
+            matches = matches[:self._limit]
+        for doc_id, data in matches:
+            if self._fields is not None:
+                data = {field: data[field] for field in self._fields if field in data}
+            yield MockDocumentSnapshot({doc_id: data}, doc_id)
                 
     def _matches(self, data):
         # Simple filter matching
         return data.get(self._field) == self._value
 
+# Async facade over the mock, mirroring Firestore's AsyncClient
+class MockAsyncFirestoreClient:
+    def __init__(self, client=None):
+        self._client = client or MockFirestoreClient()
+        
+    def collection(self, name):
+        return MockAsyncCollection(self._client.collection(name))
+
+class MockAsyncCollection:
+    def __init__(self, collection):
+        self._collection = collection
+        
+    def document(self, doc_id):
+        return MockAsyncDocument(self._collection.document(doc_id))
+        
+    def where(self, field, op, value):
+        return MockAsyncQuery(self._collection.where(field, op, value))
+
+class MockAsyncDocument:
+    def __init__(self, document):
+        self._document = document
+        
+    async def get(self, field_paths=None):
+        return self._document.get(field_paths=field_paths)
+
+class MockAsyncQuery:
+    def __init__(self, query):
+        self._query = query
+        
+    def where(self, field, op, value):
+        return MockAsyncQuery(self._query.where(field, op, value))
+        
+    def order_by(self, field, direction='ASCENDING'):
+        return MockAsyncQuery(self._query.order_by(field, direction=direction))
+    
+    def select(self, field_paths):
+        return MockAsyncQuery(self._query.select(field_paths))
+    
+    def limit(self, count):
+        return MockAsyncQuery(self._query.limit(count))
+    
+    def start_after(self, snapshot):
+        return MockAsyncQuery(self._query.start_after(snapshot))
+        
+    async def stream(self):
+        for doc in self._query.stream():
+            yield doc
+
 from src.schemas.knowledge_categories import (
-    validate_knowledge_category, 
+    validate_knowledge_base,
     get_empty_knowledge_base,
     merge_knowledge_categories
 )
 
 
+# Fields returned for agent listings; knowledge bases can be large and are
+# only loaded by the single-agent getters
+AGENT_SUMMARY_FIELDS = ('id', 'name', 'status', 'created_at', 'updated_at')
+
+DEFAULT_PAGE_SIZE = 20
+
+
+@lru_cache(maxsize=None)
+def _shared_firestore_client():
+    """Firestore client shared by every service instance; routers build one service per request"""
+    return get_firestore_client()
+
+
+@lru_cache(maxsize=None)
+def _shared_async_firestore_client():
+    """Async Firestore client shared by every async service instance"""
+    return get_async_firestore_client()
+
+
+class VoiceAgentError(ValueError):
+    """
+    A voice agent operation failed; the original error is chained as __cause__
+    
+    Firestore API errors are not wrapped, so their retry and status semantics
+    reach the caller intact.
+    """
+
+
 class VoiceAgentService:
     """
     Service class for voice agent CRUD operations with tenant isolation
     """
     
     def __init__(self, firestore_client: Optional[Client] = None):
-        self.db = firestore_client or get_firestore_client()
+        self.db = firestore_client or _shared_firestore_client()
         self.collection = 'voice_agents'
     
     def create_agent(self, tenant_id: str, agent_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -128,21 +256,16 @@ class VoiceAgentService:
             ValueError: If validation fails
         """
         try:
-            # Validate and prepare knowledge base
+            # Validate and prepare knowledge base; an empty one has nothing to validate
             knowledge_base = agent_data.get('knowledge_base', {})
             if not knowledge_base:
-                knowledge_base = get_empty_knowledge_base()
-            
-            # Validate each category in knowledge base
-            validated_kb = {}
-            for category, data in knowledge_base.items():
-                if data is not None:
-                    validated_kb[category] = validate_knowledge_category(category, data).dict()
-                else:
-                    validated_kb[category] = None
+                validated_kb = get_empty_knowledge_base()
+            else:
+                validated_kb = validate_knowledge_base(knowledge_base)
             
             # Create voice agent data
             agent_id = str(uuid4())
+            now = datetime.utcnow()
             voice_agent_data = {
                 'id': agent_id,
                 'tenant_id': tenant_id,
@@ -152,8 +275,8 @@ class VoiceAgentService:
                 'voice_config': agent_data.get('voice_config', {}),
                 'status': 'inactive',  # New agents start inactive
                 'is_active': True,
-                'created_at': datetime.utcnow(),
-                'updated_at': datetime.utcnow()
+                'created_at': now,
+                'updated_at': now
             }
             
             # Save to Firestore
@@ -162,27 +285,40 @@ class VoiceAgentService:
             
             return voice_agent_data
             
+        except GoogleAPICallError:
+            raise
         except Exception as e:
-            raise ValueError(f"Failed to create voice agent: {str(e)}")
+            raise VoiceAgentError(f"Failed to create voice agent: {e}") from e
     
-    def get_agents_for_tenant(self, tenant_id: str) -> List[Dict[str, Any]]:
+    def _tenant_agents_query(self, tenant_id: str, fields: Optional[Sequence[str]] = None):
+        """
+        Query for a tenant's active agents, newest first, optionally projected
+        
+        Served by the (tenant_id, is_active, created_at DESC) composite index
+        in firestore.indexes.json; deploy it alongside this service.
+        """
+        query = (self.db.collection(self.collection)
+                .where('tenant_id', '==', tenant_id)
+                .where('is_active', '==', True)
+                .order_by('created_at', direction='DESCENDING'))
+        if fields is not None:
+            query = query.select(list(fields))
+        return query
+    
+    def get_agents_for_tenant(self, tenant_id: str, fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
         """
         Get all voice agents for a specific tenant
         
         Args:
             tenant_id: UUID of the tenant
+            fields: Only fetch these fields (e.g. ``AGENT_SUMMARY_FIELDS``); all fields if None
             
         Returns:
             List[Dict[str, Any]]: List of voice agents owned by the tenant
         """
         try:
             # Query Firestore for tenant's voice agents
-            query = (self.db.collection(self.collection)
-                    .where('tenant_id', '==', tenant_id)
-                    .where('is_active', '==', True)
-                    .order_by('created_at', direction='DESCENDING'))
-            
-            docs = query.stream()
+            docs = self._tenant_agents_query(tenant_id, fields).stream()
             agents = []
             for doc in docs:
                 agent_data = doc.to_dict()
@@ -191,8 +327,55 @@ class VoiceAgentService:
             
             return agents
                 
+        except GoogleAPICallError:
+            raise
         except Exception as e:
-            raise ValueError(f"Failed to retrieve voice agents: {str(e)}")
+            raise VoiceAgentError(f"Failed to retrieve voice agents: {e}") from e
+    
+    def get_agents_page(
+        self,
+        tenant_id: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = AGENT_SUMMARY_FIELDS
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of a tenant's voice agents for listing views
+        
+        Only summary fields are fetched by default, so the bytes read scale
+        with the rows shown rather than with each agent's knowledge base.
+        Use get_agent_with_knowledge for a full agent.
+        
+        Args:
+            tenant_id: UUID of the tenant
+            page_size: Maximum number of agents to return
+            cursor: ``next_cursor`` from the previous page, or None for the first page
+            fields: Fields to fetch; all fields if None
+            
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: The agents and the cursor
+            for the next page, which is None on the last page
+        """
+        try:
+            query = self._tenant_agents_query(tenant_id, fields)
+            if cursor:
+                # Only the ordering field is needed to resume after the cursor
+                last_doc = self.db.collection(self.collection).document(cursor).get(field_paths=['created_at'])
+                query = query.start_after(last_doc)
+            
+            agents = []
+            for doc in query.limit(page_size).stream():
+                agent_data = doc.to_dict()
+                agent_data['id'] = doc.id
+                agents.append(agent_data)
+            
+            next_cursor = agents[-1]['id'] if len(agents) == page_size else None
+            return agents, next_cursor
+                
+        except GoogleAPICallError:
+            raise
+        except Exception as e:
+            raise VoiceAgentError(f"Failed to retrieve voice agents: {e}") from e
     
     def get_agent_by_id(self, agent_id: str, tenant_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -206,23 +389,84 @@ class VoiceAgentService:
             Optional[Dict[str, Any]]: Voice agent if found and owned by tenant, None otherwise
         """
         try:
-            # Get document from Firestore with tenant isolation
-            doc_ref = self.db.collection(self.collection).document(agent_id)
-            doc = doc_ref.get()
+            _, doc = self._get_owned_snapshot(agent_id, tenant_id)
+            if doc is None:
+                return None
             
-            if doc.exists:
-                agent_data = doc.to_dict()
-                agent_data['id'] = doc.id
+            agent_data = doc.to_dict()
+            agent_data['id'] = doc.id
+            return agent_data
                 
-                # Verify tenant ownership and active status
-                if (agent_data.get('tenant_id') == tenant_id and 
-                    agent_data.get('is_active', False)):
-                    return agent_data
+        except GoogleAPICallError:
+            raise
+        except Exception as e:
+            raise VoiceAgentError(f"Failed to retrieve voice agent: {e}") from e
+    
+    def get_agents_by_ids(self, agent_ids: Sequence[str], tenant_id: str) -> List[Dict[str, Any]]:
+        """
+        Get several voice agents in one batched read with tenant isolation
+        
+        Use this instead of calling get_agent_by_id in a loop; the documents
+        are fetched with a single get_all round trip.
+        
+        Args:
+            agent_ids: UUIDs of the voice agents; duplicates are read once
+            tenant_id: UUID of the tenant (for security check)
             
-            return None
+        Returns:
+            List[Dict[str, Any]]: Agents found and owned by the tenant, in the
+            order their IDs were given
+        """
+        try:
+            unique_ids = list(dict.fromkeys(agent_ids))
+            collection = self.db.collection(self.collection)
+            refs = [collection.document(agent_id) for agent_id in unique_ids]
+            
+            found = {}
+            for doc in self.db.get_all(refs):
+                if not doc.exists:
+                    continue
+                agent_data = doc.to_dict()
+                if agent_data.get('tenant_id') == tenant_id and agent_data.get('is_active', False):
+                    agent_data['id'] = doc.id
+                    found[doc.id] = agent_data
+            
+            # get_all yields in arbitrary order
+            return [found[agent_id] for agent_id in unique_ids if agent_id in found]
                 
+        except GoogleAPICallError:
+            raise
         except Exception as e:
-            raise ValueError(f"Failed to retrieve voice agent: {str(e)}")
+            raise VoiceAgentError(f"Failed to retrieve voice agents: {e}") from e
+    
+    def _get_owned_snapshot(self, agent_id: str, tenant_id: str, field_paths: Optional[List[str]] = None):
+        """
+        Read an agent document, returning its snapshot only if the tenant owns it and it is active
+        
+        Returns:
+            Tuple of the document reference and the snapshot; the snapshot is None
+            if the agent is missing, deleted or owned by another tenant
+        """
+        doc_ref = self.db.collection(self.collection).document(agent_id)
+        doc = doc_ref.get(field_paths=field_paths)
+        
+        if doc.exists:
+            agent_data = doc.to_dict()
+            # Verify tenant ownership and active status
+            if (agent_data.get('tenant_id') == tenant_id and 
+                agent_data.get('is_active', False)):
+                return doc_ref, doc
+        
+        return doc_ref, None
+    
+    def _update_if_unchanged(self, doc_ref, doc, updates: Dict[str, Any]) -> None:
+        """
+        Write updates only if the document is unchanged since ``doc`` was read
+        
+        The precondition keeps the ownership check and read-modify-write merges
+        atomic without the extra round trip of a transaction.
+        """
+        doc_ref.update(updates, option=self.db.write_option(last_update_time=doc.update_time))
     
     def update_agent(self, agent_id: str, tenant_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -237,40 +481,48 @@ class VoiceAgentService:
             Optional[Dict[str, Any]]: Updated voice agent if found and owned by tenant
         """
         try:
-            agent = self.get_agent_by_id(agent_id, tenant_id)
-            if not agent:
+            doc_ref, doc = self._get_owned_snapshot(agent_id, tenant_id)
+            if doc is None:
                 return None
+            agent = doc.to_dict()
+            agent['id'] = doc.id
             
             # Prepare update data
-            updates = {'updated_at': datetime.utcnow()}
+            changes = {}
             
             # Update allowed fields
             if 'name' in update_data:
-                updates['name'] = update_data['name']
+                changes['name'] = update_data['name']
             if 'description' in update_data:
-                updates['description'] = update_data['description']
+                changes['description'] = update_data['description']
             if 'voice_config' in update_data:
-                updates['voice_config'] = update_data['voice_config']
+                changes['voice_config'] = update_data['voice_config']
             if 'knowledge_base' in update_data:
                 # Merge knowledge base updates
-                updates['knowledge_base'] = merge_knowledge_categories(
+                changes['knowledge_base'] = merge_knowledge_categories(
                     agent.get('knowledge_base', {}), 
                     update_data['knowledge_base']
                 )
             if 'status' in update_data:
-                updates['status'] = update_data['status']
+                changes['status'] = update_data['status']
+            
+            # Skip the write entirely when every value already matches
+            updates = {field: value for field, value in changes.items() if agent.get(field) != value}
+            if not updates:
+                return agent
+            updates['updated_at'] = datetime.utcnow()
             
             # Update document in Firestore
-            doc_ref = self.db.collection(self.collection).document(agent_id)
-            doc_ref.update(updates)
+            self._update_if_unchanged(doc_ref, doc, updates)
             
-            # Return updated agent
-            updated_agent = agent.copy()
-            updated_agent.update(updates)
-            return updated_agent
+            # Return updated agent; the snapshot dict is ours, so merge in place
+            agent.update(updates)
+            return agent
             
+        except GoogleAPICallError:
+            raise
         except Exception as e:
-            raise ValueError(f"Failed to update voice agent: {str(e)}")
+            raise VoiceAgentError(f"Failed to update voice agent: {e}") from e
     
     def delete_agent(self, agent_id: str, tenant_id: str) -> bool:
         """
@@ -284,21 +536,24 @@ class VoiceAgentService:
             bool: True if agent was deleted, False if not found
         """
         try:
-            agent = self.get_agent_by_id(agent_id, tenant_id)
-            if not agent:
+            # Only the ownership fields are needed to authorize the delete
+            doc_ref, doc = self._get_owned_snapshot(agent_id, tenant_id, field_paths=['tenant_id', 'is_active'])
+            if doc is None:
                 return False
             
-            # Soft delete by setting is_active to False
-            doc_ref = self.db.collection(self.collection).document(agent_id)
-            doc_ref.update({
+            # Soft delete by setting is_active to False; nothing is returned, so
+            # the deletion time can come from the server clock
+            self._update_if_unchanged(doc_ref, doc, {
                 'is_active': False,
-                'updated_at': datetime.utcnow()
+                'updated_at': SERVER_TIMESTAMP
             })
             
             return True
             
+        except GoogleAPICallError:
+            raise
         except Exception as e:
-            raise ValueError(f"Failed to delete voice agent: {str(e)}")
+            raise VoiceAgentError(f"Failed to delete voice agent: {e}") from e
     
     def activate_agent(self, agent_id: str, tenant_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -311,7 +566,7 @@ class VoiceAgentService:
         Returns:
             Optional[Dict[str, Any]]: Activated agent if successful
         """
-        return self.update_agent(agent_id, tenant_id, {'status': 'active'})
+        return self._set_status(agent_id, tenant_id, 'active')
     
     def deactivate_agent(self, agent_id: str, tenant_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -324,7 +579,30 @@ class VoiceAgentService:
         Returns:
             Optional[Dict[str, Any]]: Deactivated agent if successful
         """
-        return self.update_agent(agent_id, tenant_id, {'status': 'inactive'})
+        return self._set_status(agent_id, tenant_id, 'inactive')
+    
+    def _set_status(self, agent_id: str, tenant_id: str, status: str) -> Optional[Dict[str, Any]]:
+        """Set an agent's status with a single conditional update, if it changed"""
+        try:
+            doc_ref, doc = self._get_owned_snapshot(agent_id, tenant_id)
+            if doc is None:
+                return None
+            
+            agent = doc.to_dict()
+            agent['id'] = doc.id
+            # Setting the current status again is a no-op; skip the write
+            if agent.get('status') == status:
+                return agent
+            
+            updates = {'status': status, 'updated_at': datetime.utcnow()}
+            self._update_if_unchanged(doc_ref, doc, updates)
+            agent.update(updates)
+            return agent
+            
+        except GoogleAPICallError:
+            raise
+        except Exception as e:
+            raise VoiceAgentError(f"Failed to update voice agent: {e}") from e
     
     def create_agent_with_knowledge(self, tenant_id: str, agent_data: Dict[str, Any], knowledge_base: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -458,4 +736,75 @@ class VoiceAgentService:
         agent = await self._get_agent(agent_id)
         agent['status'] = "active"
         await self._update_agent(agent)
-        return {"status": "activated", "agent_id": agent_id}
\ No newline at end of file
+        return {"status": "activated", "agent_id": agent_id}
+
+
+class AsyncVoiceAgentService:
+    """
+    Voice agent listing on Firestore's AsyncClient
+    
+    Async endpoints use this so concurrent list requests share the event loop
+    instead of blocking it; writes stay on VoiceAgentService.
+    """
+    
+    def __init__(self, firestore_client: Optional[AsyncClient] = None):
+        self.db = firestore_client or _shared_async_firestore_client()
+        self.collection = 'voice_agents'
+    
+    # Query construction is client-agnostic
+    _tenant_agents_query = VoiceAgentService._tenant_agents_query
+    
+    async def get_agents_for_tenant(self, tenant_id: str, fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get all voice agents for a specific tenant
+        
+        Args:
+            tenant_id: UUID of the tenant
+            fields: Only fetch these fields (e.g. ``AGENT_SUMMARY_FIELDS``); all fields if None
+            
+        Returns:
+            List[Dict[str, Any]]: List of voice agents owned by the tenant
+        """
+        try:
+            agents = []
+            async for doc in self._tenant_agents_query(tenant_id, fields).stream():
+                agent_data = doc.to_dict()
+                agent_data['id'] = doc.id
+                agents.append(agent_data)
+            
+            return agents
+                
+        except GoogleAPICallError:
+            raise
+        except Exception as e:
+            raise VoiceAgentError(f"Failed to retrieve voice agents: {e}") from e
+    
+    async def get_agents_page(
+        self,
+        tenant_id: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = AGENT_SUMMARY_FIELDS
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of a tenant's voice agents; see VoiceAgentService.get_agents_page
+        """
+        try:
+            query = self._tenant_agents_query(tenant_id, fields)
+            if cursor:
+                last_doc = await self.db.collection(self.collection).document(cursor).get(field_paths=['created_at'])
+                query = query.start_after(last_doc)
+            
+            agents = []
+            async for doc in query.limit(page_size).stream():
+                agent_data = doc.to_dict()
+                agent_data['id'] = doc.id
+                agents.append(agent_data)
+            
+            next_cursor = agents[-1]['id'] if len(agents) == page_size else None
+            return agents, next_cursor
+                
+        except GoogleAPICallError:
+            raise
+        except Exception as e:
+            raise VoiceAgentError(f"Failed to retrieve voice agents: {e}") from e
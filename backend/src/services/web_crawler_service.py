@@ -6,18 +6,18 @@ Business website crawling functionality for knowledge base extraction
 from typing import Dict, List, Any, Optional
 import asyncio
 import aiohttp
+import copy
+import json
+import logging
 import xml.etree.ElementTree as ET
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse, urlunparse
 from urllib.robotparser import RobotFileParser
 from contextlib import contextmanager
-
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
+from functools import lru_cache
 
 from src.schemas.knowledge_categories import (
     get_extraction_rules,
@@ -25,6 +25,148 @@ from src.schemas.knowledge_categories import (
     validate_category_data
 )
 
+try:
+    from bs4 import BeautifulSoup
+    from bs4.dammit import EncodingDetector
+except ImportError:
+    BeautifulSoup = None
+    EncodingDetector = None
+
+try:
+    import lxml  # noqa: F401 - parser backend for BeautifulSoup
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import aiodns  # noqa: F401 - enables aiohttp.AsyncResolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# libxml2-backed parsing is several times faster than the pure-Python parser
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+_SITEMAP_URL_TAG = '{http://www.sitemaps.org/schemas/sitemap/0.9}url'
+_SITEMAP_LOC_TAG = '{http://www.sitemaps.org/schemas/sitemap/0.9}loc'
+SITEMAP_CHUNK_SIZE = 64 * 1024
+PAGE_CHUNK_SIZE = 16 * 1024
+
+# The crawl is one sitemap level deep, so each level of max_depth buys this many pages
+PAGES_PER_DEPTH = 5
+
+# Extraction patterns, compiled once at import instead of per page
+_PHONE_RE = re.compile(r'[\(]?[0-9]{3}[\)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4}')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_ADDRESS_RE = re.compile(r'[Aa]ddress:?\s*([^\n]+)')
+_STREET_RE = re.compile(r'\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd)')
+_PRICE_RE = re.compile(r'\$[0-9,]+(?:\.[0-9]{2})?(?:/[a-zA-Z]+)?')
+
+# Knowledge category -> WebCrawlerService method that extracts it
+_CATEGORY_EXTRACTORS = {
+    'company_overview': 'extract_company_information',
+    'contact_information': 'extract_contact_information',
+    'products_services': 'extract_products_services',
+    'pricing_packages': 'extract_pricing_packages'
+}
+
+
+class _SitemapUrlParser:
+    """
+    Incremental sitemap.xml parser; each finished <url> element is dropped,
+    so memory stays flat however many URLs the sitemap lists.
+    URLs listed more than once are kept only the first time.
+    """
+    
+    def __init__(self):
+        self.urls: List[str] = []
+        self._seen = set()
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._root = None
+    
+    def feed(self, data) -> None:
+        self._parser.feed(data)
+        for event, elem in self._parser.read_events():
+            if self._root is None:
+                self._root = elem
+            elif event == 'end' and elem.tag == _SITEMAP_URL_TAG:
+                loc_elem = elem.find(_SITEMAP_LOC_TAG)
+                if loc_elem is not None and loc_elem.text:
+                    url = loc_elem.text.strip()
+                    if url not in self._seen:
+                        self._seen.add(url)
+                        self.urls.append(url)
+                self._root.clear()
+    
+    def close(self) -> None:
+        """Finish parsing; raises ET.ParseError if the document is malformed or truncated"""
+        self._parser.close()
+
+
+def _loads(text: str) -> Any:
+    """Decode JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@lru_cache(maxsize=2048)
+def _parse_jsonld_organization(jsonld_text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse one JSON-LD block into organization data, None if it is not an Organization.
+    Sites repeat the same Organization block on every page, so results are cached by content
+    """
+    try:
+        data = _loads(jsonld_text)
+    except (json.JSONDecodeError, TypeError):  # orjson.JSONDecodeError subclasses json's
+        return None
+    if not isinstance(data, dict) or data.get('@type') != 'Organization':
+        return None
+    return {
+        'name': data.get('name', ''),
+        'type': data.get('@type', ''),
+        'address': data.get('address', ''),
+        'phone': data.get('telephone', ''),
+        'email': data.get('email', ''),
+        'website': data.get('url', '')
+    }
+
+
+# Process pools shared by every crawler configured with the same parse_processes
+_PARSE_POOLS: Dict[int, ProcessPoolExecutor] = {}
+
+
+def _shared_parse_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Process pool for max_workers, created on first use"""
+    pool = _PARSE_POOLS.get(max_workers)
+    if pool is None:
+        pool = _PARSE_POOLS[max_workers] = ProcessPoolExecutor(max_workers=max_workers)
+    return pool
+
+
+def _shutdown_parse_pool(max_workers: int) -> None:
+    """Shut down the pool for max_workers; queued pages still finish and the next parse starts a new pool"""
+    pool = _PARSE_POOLS.pop(max_workers, None)
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+def _extract_page_in_process(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Process pool entry point; services hold an HTTP session, so each worker parses with its own"""
+    return WebCrawlerService()._extract_page(result)
+
+
+# Constant-time membership for the per-category checks below
+_KNOWLEDGE_CATEGORY_SET = frozenset(KNOWLEDGE_CATEGORIES)
+
 
 class WebCrawlerService:
     """
@@ -37,8 +179,14 @@ class WebCrawlerService:
         self.max_pages_per_site = 25  # Respectful crawling limit
         self.timeout = 30    # Request timeout in seconds
         self.delay_between_requests = 1.5  # Respectful delay in seconds
+        self.max_concurrent_requests = 5  # Pages fetched at once per crawl
+        self.max_page_bytes = 5 * 1024 * 1024  # Larger pages are truncated, not buffered whole
+        self.parse_processes = 0  # When > 0, pages are parsed in a process pool of this size instead of threads
         self.user_agent = "Voice-Agent-Knowledge-Bot/1.0 (+https://voice-agent-platform.com/bot)"
         self._crawled_urls = {}  # Track recently crawled URLs
+        self._page_cache = {}  # URL -> (conditional request headers, extracted page) for re-crawls
+        self._robots_cache = {}  # robots.txt URL -> body, fetched once per site instead of per page
+        self.max_cached_pages = 1000
         
         # Database setup for real persistence
         self._db_engine = None
@@ -55,7 +203,7 @@ class WebCrawlerService:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
         
-        return loop.run_until_complete(self.crawl_website_complete(base_url, max_depth))
+        return loop.run_until_complete(self.crawl_website_complete(base_url, max_depth * PAGES_PER_DEPTH))
     
     def extract_content_from_url(self, url: str) -> Dict[str, Any]:
         """Extract content from a single URL"""
@@ -76,10 +224,18 @@ class WebCrawlerService:
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
             headers = {'User-Agent': self.user_agent}
+            # One pooled connector for the life of the service: keep-alive connections and
+            # cached DNS are reused across pages and crawls instead of reconnecting per URL
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=self.max_concurrent_requests,
+                ttl_dns_cache=600,
+                resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None
+            )
             self.session = aiohttp.ClientSession(
                 timeout=timeout,
                 headers=headers,
-                connector=aiohttp.TCPConnector(limit=10)
+                connector=connector
             )
         return self.session
     
@@ -136,30 +292,75 @@ class WebCrawlerService:
             rp = RobotFileParser()
             rp.set_url(robots_url)
             
-            session = await self._get_session()
-            try:
-                async with session.get(robots_url) as response:
-                    if response.status == 200:
-                        robots_content = await response.text()
-                        # Simple robots.txt parsing
-                        lines = robots_content.split('\n')
-                        user_agent_section = False
-                        for line in lines:
-                            line = line.strip()
-                            if line.lower().startswith('user-agent:'):
-                                ua = line.split(':', 1)[1].strip()
-                                user_agent_section = ua == '*' or 'bot' in ua.lower()
-                            elif user_agent_section and line.lower().startswith('disallow:'):
-                                path = line.split(':', 1)[1].strip()
-                                if path == '/' or url.endswith(path):
-                                    return False
-            except Exception:
-                pass  # If can't fetch robots.txt, assume allowed
+            robots_content = await self._get_robots_txt(robots_url)
+            # Simple robots.txt parsing
+            lines = robots_content.split('\n')
+            user_agent_section = False
+            for line in lines:
+                line = line.strip()
+                if line.lower().startswith('user-agent:'):
+                    ua = line.split(':', 1)[1].strip()
+                    user_agent_section = ua == '*' or 'bot' in ua.lower()
+                elif user_agent_section and line.lower().startswith('disallow:'):
+                    path = line.split(':', 1)[1].strip()
+                    if path == '/' or url.endswith(path):
+                        return False
             
             return True
         except Exception:
             return True  # Default to allowing if error
     
+    async def _get_robots_txt(self, robots_url: str) -> str:
+        """Fetch robots.txt once per site; empty when the site has none"""
+        if robots_url in self._robots_cache:
+            return self._robots_cache[robots_url]
+        
+        session = await self._get_session()
+        try:
+            async with session.get(robots_url) as response:
+                robots_content = await response.text() if response.status == 200 else ''
+        except Exception:
+            return ''  # If can't fetch robots.txt, assume allowed (and retry next time)
+        
+        if len(self._robots_cache) >= self.max_cached_pages:
+            del self._robots_cache[next(iter(self._robots_cache))]  # Evict the oldest entry
+        self._robots_cache[robots_url] = robots_content
+        return robots_content
+    
+    async def _read_page(self, response: aiohttp.ClientResponse) -> str:
+        """Read a page body in chunks, stopping once max_page_bytes have arrived"""
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(PAGE_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_page_bytes:
+                break
+        body = b''.join(chunks)[:self.max_page_bytes]
+        return self._decode_page(body, response.charset)
+    
+    def _decode_page(self, body: bytes, charset: Optional[str]) -> str:
+        """
+        Decode a page body using the Content-Type charset, then any <meta charset>
+        declared in the page, then UTF-8; unknown charset labels are skipped
+        """
+        encodings = [charset]
+        if EncodingDetector is not None:
+            encodings.append(EncodingDetector.find_declared_encoding(body, is_html=True))
+        for encoding in encodings:
+            if not encoding:
+                continue
+            try:
+                return body.decode(encoding, errors='replace')
+            except LookupError:
+                logger.debug("Unknown page charset %r, trying the next candidate", encoding)
+        return body.decode('utf-8', errors='replace')
+    
+    def _conditional_headers(self, url: str) -> Optional[Dict[str, str]]:
+        """Validators from the last crawl of url, so an unchanged page comes back as 304"""
+        cached = self._page_cache.get(url)
+        return cached[0] if cached else None
+    
     async def fetch_url_content(self, url: str) -> Dict[str, Any]:
         """Fetch content from URL with real HTTP request"""
         if not self.is_valid_url(url):
@@ -171,8 +372,9 @@ class WebCrawlerService:
             # Add respectful delay
             await asyncio.sleep(self.delay_between_requests)
             
-            async with session.get(url) as response:
-                content = await response.text()
+            async with session.get(url, headers=self._conditional_headers(url)) as response:
+                # Only successful pages are parsed, so error bodies (and empty 304s) are never read
+                content = await self._read_page(response) if response.status == 200 else ''
                 return {
                     'content': content,
                     'status_code': response.status,
@@ -201,7 +403,7 @@ class WebCrawlerService:
             raise ImportError("BeautifulSoup4 is required for HTML parsing. Install with: pip install beautifulsoup4")
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             # Extract basic elements
             title = soup.title.string if soup.title else ''
@@ -212,25 +414,23 @@ class WebCrawlerService:
                 headings.extend([h.get_text().strip() for h in soup.find_all(heading_tag)])
             
             # Extract paragraphs and main text
-            paragraphs = [p.get_text().strip() for p in soup.find_all('p') if p.get_text().strip()]
+            paragraphs = [text for p in soup.find_all('p') if (text := p.get_text().strip())]
             
             # Get clean text content
             text_content = soup.get_text(separator=' ', strip=True)
             
-            # Extract links
-            links = []
-            for link in soup.find_all('a', href=True):
-                links.append({
-                    'text': link.get_text().strip(),
-                    'href': link['href']
-                })
+            # Extract links, stopping the search once the kept limit is reached
+            links = [
+                {'text': link.get_text().strip(), 'href': link['href']}
+                for link in soup.find_all('a', href=True, limit=50)
+            ]
             
             return {
                 'title': title.strip(),
                 'headings': headings,
                 'paragraphs': paragraphs[:20],  # Limit to first 20 paragraphs
                 'text_content': text_content,
-                'links': links[:50],  # Limit to first 50 links
+                'links': links,  # First 50 links
                 'soup': soup  # Keep soup for further extraction
             }
             
@@ -248,14 +448,12 @@ class WebCrawlerService:
         contact_info = {}
         
         # Extract phone numbers using regex
-        phone_pattern = r'[\(]?[0-9]{3}[\)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4}'
-        phones = re.findall(phone_pattern, text_content)
+        phones = _PHONE_RE.findall(text_content)
         if phones:
             contact_info['phone'] = phones[0]
         
         # Extract email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text_content)
+        emails = _EMAIL_RE.findall(text_content)
         if emails:
             contact_info['email'] = emails[0]
         
@@ -277,14 +475,12 @@ class WebCrawlerService:
         # Fallback: look for address pattern in all text if not found
         if 'address' not in contact_info:
             # Look for "Address:" pattern
-            address_pattern = r'[Aa]ddress:?\s*([^\n]+)'
-            address_match = re.search(address_pattern, text_content)
+            address_match = _ADDRESS_RE.search(text_content)
             if address_match:
                 contact_info['address'] = address_match.group(1).strip()
             else:
                 # Look for street address patterns
-                street_pattern = r'\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd)'
-                street_match = re.search(street_pattern, text_content)
+                street_match = _STREET_RE.search(text_content)
                 if street_match:
                     contact_info['address'] = street_match.group().strip()
         
@@ -416,8 +612,7 @@ class WebCrawlerService:
                         if plan_title:
                             plan_text = plan.get_text()
                             # Extract price using regex
-                            price_pattern = r'\$[0-9,]+(?:\.[0-9]{2})?(?:/[a-zA-Z]+)?'
-                            prices = re.findall(price_pattern, plan_text)
+                            prices = _PRICE_RE.findall(plan_text)
                             packages.append({
                                 'name': plan_title.get_text().strip(),
                                 'price': prices[0] if prices else 'Contact for pricing'
@@ -431,8 +626,7 @@ class WebCrawlerService:
                     }
         
         # Fallback: look for prices in text
-        price_pattern = r'\$[0-9,]+(?:\.[0-9]{2})?(?:/[a-zA-Z]+)?'
-        prices = re.findall(price_pattern, text_content)
+        prices = _PRICE_RE.findall(text_content)
         if prices:
             return {
                 'title': 'Pricing Information',
@@ -444,17 +638,13 @@ class WebCrawlerService:
     
     def parse_sitemap_xml(self, sitemap_content: str) -> List[str]:
         """Parse sitemap.xml and extract URLs"""
-        urls = []
+        parser = _SitemapUrlParser()
         try:
-            root = ET.fromstring(sitemap_content)
-            # Handle namespaces
-            for url_elem in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}url'):
-                loc_elem = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                if loc_elem is not None and loc_elem.text:
-                    urls.append(loc_elem.text)
+            parser.feed(sitemap_content)
+            parser.close()
         except ET.ParseError:
-            pass  # Invalid XML, return empty list
-        return urls
+            return []  # Invalid XML, return empty list
+        return parser.urls
     
     def prioritize_crawling_urls(self, urls: List[str]) -> List[str]:
         """Prioritize URLs for crawling based on likely content importance"""
@@ -542,28 +732,27 @@ class WebCrawlerService:
                             knowledge_categories['contact_information'] = contact_info
             
             else:
-                # Real URL crawling
-                result = await self.fetch_url_content(base_url)
-                if 'error' not in result and result.get('status_code') == 200:
-                    parsed = self.parse_html_content(result['content'])
-                    if 'error' not in parsed:
-                        crawled_urls = 1
-                        
-                        # Extract various knowledge categories
-                        extractors = {
-                            'company_overview': self.extract_company_information,
-                            'contact_information': self.extract_contact_information,
-                            'products_services': self.extract_products_services,
-                            'pricing_packages': self.extract_pricing_packages
-                        }
-                        
-                        for category, extractor in extractors.items():
-                            try:
-                                extracted = extractor(parsed)
-                                if extracted:
-                                    knowledge_categories[category] = extracted
-                            except Exception as e:
-                                errors.append(f"Error extracting {category}: {str(e)}")
+                # Real URL crawling: fetch the landing page while discovering the
+                # other pages, then crawl those concurrently unless the site is unreachable
+                base_result, page_urls = await asyncio.gather(
+                    self.fetch_url_content(base_url),
+                    self._select_page_urls(base_url, max_pages)
+                )
+                base_page = self._page_from_result(base_url, base_result)
+                if 'error' in base_result:
+                    pages = [await base_page]
+                else:
+                    base_page, other_pages = await asyncio.gather(base_page, self._crawl_pages(page_urls[1:]))
+                    pages = [base_page, *other_pages]
+                
+                # Earlier pages win when several pages yield the same category
+                for page in pages:
+                    if page is None:
+                        continue
+                    crawled_urls += 1
+                    for category, extracted in page['categories'].items():
+                        knowledge_categories.setdefault(category, extracted)
+                    errors.extend(page['errors'])
         
         except Exception as e:
             errors.append(f"Crawling error: {str(e)}")
@@ -578,6 +767,107 @@ class WebCrawlerService:
             }
         }
     
+    async def _select_page_urls(self, base_url: str, max_pages: int) -> List[str]:
+        """Pick the pages to crawl: the base URL first, then prioritized sitemap URLs"""
+        max_pages = min(max_pages, self.max_pages_per_site)
+        if max_pages <= 1:
+            return [base_url]
+        
+        # Sitemaps are third-party input: never follow them off the site being crawled
+        base = urlparse(base_url)
+        sitemap_urls = [
+            url for url in await self.get_sitemap_urls(base_url)
+            if self._is_same_site(url, base)
+        ]
+        return list(dict.fromkeys([base_url, *sitemap_urls]))[:max_pages]
+    
+    @staticmethod
+    def _is_same_site(url: str, base) -> bool:
+        """True when url has the same scheme and host as the parsed base URL"""
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            return False
+        return parsed.scheme == base.scheme and parsed.netloc.lower() == base.netloc.lower()
+    
+    async def _crawl_pages(self, urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch pages concurrently, at most max_concurrent_requests at a time, and
+        parse each off the event loop as soon as it arrives so parsing overlaps
+        the remaining downloads. Pages robots.txt disallows are skipped (None).
+        Results are in input order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async def crawl(url: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                if not await self.can_crawl_url(url):
+                    return None
+                result = await self.fetch_url_content(url)
+            return await self._page_from_result(url, result)
+        
+        return await asyncio.gather(*(crawl(url) for url in urls))
+    
+    async def _page_from_result(self, url: str, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Extract a fetched page, reusing the previous extraction when the server
+        answered 304 Not Modified; pages served with ETag/Last-Modified are remembered
+        """
+        cached = self._page_cache.get(url)
+        if cached and result.get('status_code') == 304:
+            return copy.deepcopy(cached[1])
+        
+        page = await self._parse_page(result)
+        # Header names are case-insensitive; servers send 'ETag', 'Etag' and 'etag' alike
+        response_headers = {name.lower(): value for name, value in (result.get('headers') or {}).items()}
+        validators = {}
+        if response_headers.get('etag'):
+            validators['If-None-Match'] = response_headers['etag']
+        if response_headers.get('last-modified'):
+            validators['If-Modified-Since'] = response_headers['last-modified']
+        
+        if page is not None and validators:
+            self._page_cache.pop(url, None)
+            if len(self._page_cache) >= self.max_cached_pages:
+                del self._page_cache[next(iter(self._page_cache))]  # Evict the oldest entry
+            self._page_cache[url] = (validators, copy.deepcopy(page))
+        return page
+    
+    async def _parse_page(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Run _extract_page off the event loop: in the shared process pool when
+        parse_processes is set, so regex and JSON work use every core, else in a worker thread
+        """
+        if self.parse_processes > 0:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_shared_parse_pool(self.parse_processes), _extract_page_in_process, result)
+        return await asyncio.to_thread(self._extract_page, result)
+    
+    def _extract_page(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Parse a fetched page and extract its categories; None if the fetch or parse failed"""
+        if 'error' in result or result.get('status_code') != 200:
+            return None
+        parsed = self.parse_html_content(result['content'])
+        if 'error' in parsed:
+            return None
+        
+        categories = {}
+        errors = []
+        self._extract_categories(parsed, categories, errors)
+        return {'categories': categories, 'errors': errors}
+    
+    def _extract_categories(self, parsed: Dict[str, Any], knowledge_categories: Dict[str, Any], errors: List[str]):
+        """Fill categories not yet found from one parsed page"""
+        for category, extractor_name in _CATEGORY_EXTRACTORS.items():
+            if category in knowledge_categories:
+                continue
+            try:
+                extracted = getattr(self, extractor_name)(parsed)
+                if extracted:
+                    knowledge_categories[category] = extracted
+            except Exception as e:
+                errors.append(f"Error extracting {category}: {str(e)}")
+    
     def batch_crawl_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
         """Batch crawl multiple URLs"""
         results = []
@@ -627,7 +917,7 @@ class WebCrawlerService:
     
     def extract_category_content(self, html_content: str, category: str) -> Optional[Dict[str, Any]]:
         """Extract content for a specific knowledge category from HTML (REAL parsing)"""
-        if category not in KNOWLEDGE_CATEGORIES:
+        if category not in _KNOWLEDGE_CATEGORY_SET:
             return None
         
         try:
@@ -636,16 +926,9 @@ class WebCrawlerService:
                 return None
             
             # Use real extraction methods
-            extractors = {
-                'company_overview': self.extract_company_information,
-                'contact_information': self.extract_contact_information,
-                'products_services': self.extract_products_services,
-                'pricing_packages': self.extract_pricing_packages
-            }
-            
-            extractor = extractors.get(category)
-            if extractor:
-                result = extractor(parsed)
+            extractor_name = _CATEGORY_EXTRACTORS.get(category)
+            if extractor_name:
+                result = getattr(self, extractor_name)(parsed)
                 if result:
                     result['confidence_score'] = 0.8  # Add confidence score
                     result['extraction_method'] = 'real_parsing'
@@ -658,7 +941,7 @@ class WebCrawlerService:
     
     async def crawl_website_async(self, base_url: str, max_depth: int = 2) -> Dict[str, Any]:
         """Asynchronous website crawling with real HTTP requests"""
-        return await self.crawl_website_complete(base_url, max_depth)
+        return await self.crawl_website_complete(base_url, max_depth * PAGES_PER_DEPTH)
     
     async def get_sitemap_urls(self, base_url: str) -> List[str]:
         """Extract URLs from website sitemap.xml with real HTTP fetching"""
@@ -666,11 +949,9 @@ class WebCrawlerService:
         sitemap_url = f"{parsed_url.scheme}://{parsed_url.netloc}/sitemap.xml"
         
         try:
-            result = await self.fetch_url_content(sitemap_url)
-            if 'error' not in result and result.get('status_code') == 200:
-                urls = self.parse_sitemap_xml(result['content'])
-                if urls:
-                    return self.prioritize_crawling_urls(urls)
+            urls = await self._fetch_sitemap_urls(sitemap_url)
+            if urls:
+                return self.prioritize_crawling_urls(urls)
         except Exception:
             pass
         
@@ -683,6 +964,22 @@ class WebCrawlerService:
             f"{domain}/contact"
         ]
     
+    async def _fetch_sitemap_urls(self, sitemap_url: str) -> List[str]:
+        """Stream sitemap.xml into the parser chunk by chunk instead of buffering the whole body"""
+        session = await self._get_session()
+        
+        # Add respectful delay
+        await asyncio.sleep(self.delay_between_requests)
+        
+        async with session.get(sitemap_url) as response:
+            if response.status != 200:
+                return []
+            parser = _SitemapUrlParser()
+            async for chunk in response.content.iter_chunked(SITEMAP_CHUNK_SIZE):
+                parser.feed(chunk)
+            parser.close()
+            return parser.urls
+    
     def extract_structured_data(self, html_content: str) -> Dict[str, Any]:
         """Extract structured data (JSON-LD, microdata) from HTML with real parsing"""
         structured_data = {}
@@ -691,26 +988,17 @@ class WebCrawlerService:
             if BeautifulSoup is None:
                 return structured_data
             
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             # Extract JSON-LD structured data
             json_ld_scripts = soup.find_all('script', type='application/ld+json')
             for script in json_ld_scripts:
-                try:
-                    import json
-                    data = json.loads(script.string)
-                    if isinstance(data, dict):
-                        if data.get('@type') == 'Organization':
-                            structured_data['organization'] = {
-                                'name': data.get('name', ''),
-                                'type': data.get('@type', ''),
-                                'address': data.get('address', ''),
-                                'phone': data.get('telephone', ''),
-                                'email': data.get('email', ''),
-                                'website': data.get('url', '')
-                            }
-                except (json.JSONDecodeError, TypeError):
+                if script.string is None:
                     continue
+                organization = _parse_jsonld_organization(str(script.string))
+                if organization is not None:
+                    # Deep copy: nested values such as a PostalAddress belong to the cached entry
+                    structured_data['organization'] = copy.deepcopy(organization)
             
             # Extract microdata (basic implementation)
             items_with_microdata = soup.find_all(attrs={'itemtype': True})
@@ -733,21 +1021,27 @@ class WebCrawlerService:
     def validate_crawled_content(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate extracted content against knowledge category schemas"""
         validated_data = {}
+        unknown_categories = []
         
         for category, data in extracted_data.items():
-            if category in KNOWLEDGE_CATEGORIES:
+            if category in _KNOWLEDGE_CATEGORY_SET:
                 try:
                     validated_data[category] = validate_category_data(category, data)
                 except ValueError as e:
                     # Skip invalid data but log the error
-                    print(f"Validation error for {category}: {e}")
+                    logger.warning("Validation error for %s: %s", category, e)
                     continue
             else:
-                print(f"Unknown category: {category}")
+                unknown_categories.append(category)
+        
+        if unknown_categories:
+            logger.warning("Unknown categories: %s", ", ".join(unknown_categories))
         
         return validated_data
     
     async def cleanup(self):
         """Cleanup resources"""
         if self.session and not self.session.closed:
-            await self.session.close()
\ No newline at end of file
+            await self.session.close()
+        if self.parse_processes > 0:
+            _shutdown_parse_pool(self.parse_processes)
@@ -0,0 +1,21 @@
+"""
+Shared fixtures for unit tests.
+"""
+import pytest
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../'))
+
+from src.services.twilio.twilio_client import clear_client_cache
+from src.services.twilio.twilio_phone_client import _get_twilio_client
+
+
+@pytest.fixture(autouse=True)
+def reset_twilio_client_cache():
+    """Keep patched Twilio SDK clients from leaking between tests."""
+    clear_client_cache()
+    _get_twilio_client.cache_clear()
+    yield
+    clear_client_cache()
+    _get_twilio_client.cache_clear()
@@ -111,6 +111,39 @@ class TestKnowledgeCategoryValidation:
         
         assert 'Invalid category' in str(exc_info.value)
     
+    def test_knowledge_base_validated_in_one_pass(self):
+        """Test whole knowledge bases validate to plain dicts and reject bad categories or data"""
+        from pydantic import ValidationError
+        from src.schemas.knowledge_categories import validate_knowledge_base
+        
+        result = validate_knowledge_base({
+            'company_overview': {'title': 'About', 'content': 'We build things', 'keywords': [' a ', '']},
+            'faq_support': None
+        })
+        assert result['company_overview']['keywords'] == ['a']
+        assert result['company_overview']['confidence_score'] == 1.0
+        assert result['faq_support'] is None
+        
+        assert validate_knowledge_base({'gossip': None}) == {'gossip': None}
+        with pytest.raises(ValueError, match='Invalid category'):
+            validate_knowledge_base({'gossip': {'title': 'Rumours', 'content': 'Who said what'}})
+        with pytest.raises(ValidationError):
+            validate_knowledge_base({'company_overview': {'title': '', 'content': 'Test'}})
+    
+    def test_merge_replaces_only_known_populated_categories(self):
+        """Test merging keeps existing data unless new data supplies a known category"""
+        from src.schemas.knowledge_categories import merge_knowledge_categories
+        
+        existing = {'company_overview': {'title': 'Old'}, 'faq_support': {'title': 'FAQ'}}
+        merged = merge_knowledge_categories(existing, {
+            'company_overview': {'title': 'New'},
+            'faq_support': None,
+            'gossip': {'title': 'Ignored'}
+        })
+        
+        assert merged == {'company_overview': {'title': 'New'}, 'faq_support': {'title': 'FAQ'}}
+        assert existing['company_overview'] == {'title': 'Old'}
+    
     def test_missing_required_fields_validation(self):
         """Test validation of required fields"""
         from src.schemas.knowledge_categories import validate_category_data
@@ -142,6 +175,20 @@ class TestKnowledgeCategoryValidation:
                 'content': 'Test content',
                 'keywords': 'should be list'
             })
+    
+    def test_supplied_last_updated_skips_clock(self):
+        """Test the current time is only read when last_updated is missing"""
+        from src.schemas import knowledge_categories
+        
+        with patch.object(knowledge_categories, 'datetime') as mock_datetime:
+            result = knowledge_categories.validate_category_data('company_overview', {
+                'title': 'Test',
+                'content': 'Test content',
+                'last_updated': '2024-01-01T00:00:00'
+            })
+        
+        assert result['last_updated'] == '2024-01-01T00:00:00'
+        mock_datetime.now.assert_not_called()
 
 
 class TestKnowledgeBaseExtraction:
@@ -215,6 +262,18 @@ class TestKnowledgeBaseExtraction:
         assert 'phone' in rules['keywords']
         assert 'email' in rules['keywords']
     
+    def test_extraction_rules_copies_are_independent(self):
+        """Test callers can't change the shared rules through a returned copy"""
+        from src.schemas.knowledge_categories import get_extraction_rules
+        
+        rules = get_extraction_rules('contact_information')
+        rules['selectors'].append('.injected')
+        
+        assert '.injected' not in get_extraction_rules('contact_information')['selectors']
+        assert get_extraction_rules('faq_support')['keywords'] == ['faq support']
+        with pytest.raises(ValueError):
+            get_extraction_rules('not_a_category')
+    
     def test_extraction_rules_completeness(self):
         """Test that extraction rules are complete for web crawling"""
         from src.schemas.knowledge_categories import get_extraction_rules
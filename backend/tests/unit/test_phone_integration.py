@@ -53,6 +53,116 @@ class TestTwilioPhoneClient:
         assert client.auth_token == 'param_token'
         assert client.webhook_base_url == 'https://param.example.com'
         
+    def test_sdk_client_shared_across_instances(self, mock_twilio_client):
+        """Test instances with the same credentials share one pooled SDK client."""
+        first = TwilioPhoneClient(account_sid='shared_sid', auth_token='shared_token')
+        second = TwilioPhoneClient(account_sid='shared_sid', auth_token='shared_token')
+        
+        assert first.client is second.client
+        mock_twilio_client.assert_called_once()
+        http_client = mock_twilio_client.call_args.kwargs['http_client']
+        adapter = http_client.session.get_adapter('https://api.twilio.com')
+        assert adapter._pool_maxsize == 20
+        # Purchases are POSTs and must never be replayed
+        assert adapter.max_retries.is_retry('GET', 503)
+        assert not adapter.max_retries.is_retry('POST', 503)
+        
+    def test_pooled_http_client_isolates_threads(self):
+        """Test concurrent SDK requests each get their own response over the shared session."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from src.services.twilio import twilio_phone_client
+        twilio_phone_client._load_twilio_sdk()
+        http_client = twilio_phone_client._pooled_http_client()
+        barrier = threading.Barrier(4)
+        sessions = []
+        
+        def send(self, request, **kwargs):
+            sessions.append(self)
+            barrier.wait(timeout=5)
+            return Mock(status_code=200, text=request.url.rsplit('/', 1)[-1], headers={})
+        
+        with patch('requests.Session.send', send):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                responses = list(pool.map(
+                    lambda i: http_client.request('GET', f'https://api.twilio.com/{i}'), range(4)
+                ))
+        
+        assert [response.text for response in responses] == ['0', '1', '2', '3']
+        assert all(session is http_client.session for session in sessions)
+        
+    def test_import_does_not_load_twilio_sdk(self):
+        """Test importing the client module defers the Twilio SDK import."""
+        import os
+        import subprocess
+        import sys
+        backend_dir = os.path.join(os.path.dirname(__file__), '../../')
+        code = (
+            "import sys; import src.services.twilio.twilio_phone_client; "
+            "sys.exit('twilio.rest' in sys.modules)"
+        )
+        
+        assert subprocess.run([sys.executable, '-c', code], cwd=backend_dir).returncode == 0
+        
+    @pytest.mark.asyncio
+    async def test_sdk_calls_run_off_event_loop(self, phone_client, mock_twilio_client):
+        """Test blocking SDK calls execute in a worker thread."""
+        import threading
+        loop_thread = threading.get_ident()
+        call_threads = []
+        
+        mock_client_instance = mock_twilio_client.return_value
+        mock_client_instance.incoming_phone_numbers.list.side_effect = (
+            lambda **kwargs: call_threads.append(threading.get_ident()) or []
+        )
+        phone_client.client = mock_client_instance
+        
+        assert await phone_client.list_provisioned_numbers() == []
+        assert call_threads and call_threads[0] != loop_thread
+        
+    @pytest.mark.asyncio
+    async def test_bulk_release_and_webhook_update(self, phone_client, mock_twilio_client):
+        """Test bulk operations fan out per SID and report per-SID results."""
+        mock_client_instance = mock_twilio_client.return_value
+        
+        def number_resource(sid):
+            resource = Mock()
+            if sid == 'PN_bad':
+                resource.delete.side_effect = TwilioException("Not found")
+                resource.update.side_effect = TwilioException("Not found")
+            else:
+                resource.update.return_value = Mock(
+                    sid=sid, phone_number='+14155551234', voice_url='https://example.com/v', sms_url=None
+                )
+            return resource
+        
+        mock_client_instance.incoming_phone_numbers.side_effect = number_resource
+        phone_client.client = mock_client_instance
+        
+        released = await phone_client.release_phone_numbers(['PN_ok', 'PN_bad'])
+        assert released == {'PN_ok': True, 'PN_bad': False}
+        
+        updated = await phone_client.update_phone_number_webhooks_bulk({
+            'PN_ok': {'voice_url': 'https://example.com/v'},
+            'PN_bad': {'sms_url': 'https://example.com/s'}
+        })
+        assert updated['PN_ok']['voice_url'] == 'https://example.com/v'
+        assert 'error' in updated['PN_bad']
+        
+    def test_service_status_cached_between_polls(self, phone_client, mock_twilio_client):
+        """Test health check polls reuse a recent account fetch unless forced."""
+        mock_client_instance = mock_twilio_client.return_value
+        mock_client_instance.api.account.fetch.return_value = Mock(status='active', friendly_name='Test')
+        phone_client.client = mock_client_instance
+        
+        first = phone_client.get_service_status()
+        first['account_status'] = 'mutated'
+        assert phone_client.get_service_status()['account_status'] == 'active'
+        assert mock_client_instance.api.account.fetch.call_count == 1
+        
+        phone_client.get_service_status(force=True)
+        assert mock_client_instance.api.account.fetch.call_count == 2
+        
     def test_initialization_missing_credentials(self, mock_twilio_client):
         """Test client initialization fails without credentials."""
         with patch.dict('os.environ', {}, clear=True):
@@ -142,6 +252,33 @@ class TestTwilioPhoneClient:
         assert len(results) == 1
         assert results[0]['sid'] == 'PN123456789'
         
+    @pytest.mark.asyncio
+    async def test_iter_provisioned_numbers_pages_lazily(self, phone_client, mock_twilio_client):
+        """Test numbers are yielded page by page and paging stops at the limit."""
+        def make_page(sids, next_page):
+            page = MagicMock()
+            page.__iter__.return_value = iter([
+                Mock(sid=sid, phone_number='+14155551234', friendly_name=sid, voice_url=None,
+                     sms_url=None, capabilities={'voice': True}, status='in-use')
+                for sid in sids
+            ])
+            page.next_page.return_value = next_page
+            return page
+        
+        third = make_page(['PN5'], None)
+        second = make_page(['PN3', 'PN4'], third)
+        first = make_page(['PN1', 'PN2'], second)
+        mock_client_instance = mock_twilio_client.return_value
+        mock_client_instance.incoming_phone_numbers.page.return_value = first
+        phone_client.client = mock_client_instance
+        
+        sids = [number['sid'] async for number in phone_client.iter_provisioned_numbers(limit=3, page_size=2)]
+        
+        assert sids == ['PN1', 'PN2', 'PN3']
+        mock_client_instance.incoming_phone_numbers.page.assert_called_once_with(page_size=2)
+        third.next_page.assert_not_called()
+        second.next_page.assert_not_called()
+        
     @pytest.mark.asyncio
     async def test_release_phone_number_success(self, phone_client, mock_twilio_client):
         """Test successful phone number release."""
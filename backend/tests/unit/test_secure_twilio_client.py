@@ -0,0 +1,268 @@
+"""
+Test suite for the secure Twilio client.
+Covers credential classification, mock/demo fallback and the REST code paths.
+"""
+import pytest
+import httpx
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../'))
+
+from src.services.twilio.secure_twilio_client import SecureTwilioClient, TWILIO_API_BASE_URL
+
+
+REAL_SID = 'AC' + '0123456789abcdef' * 2
+REAL_TOKEN = 'f' * 32
+
+
+def make_real_client(handler) -> SecureTwilioClient:
+    """Build a client with production-shaped credentials talking to a mock transport."""
+    client = SecureTwilioClient(account_sid=REAL_SID, auth_token=REAL_TOKEN)
+    client._http = httpx.AsyncClient(
+        base_url=f"{TWILIO_API_BASE_URL}/Accounts/{REAL_SID}",
+        auth=(REAL_SID, REAL_TOKEN),
+        transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+class TestCredentialHandling:
+    """Test credential validation and client mode selection."""
+
+    def test_missing_credentials_rejected(self, monkeypatch):
+        """Test client refuses to start without credentials."""
+        monkeypatch.delenv('TWILIO_ACCOUNT_SID', raising=False)
+        monkeypatch.delenv('TWILIO_AUTH_TOKEN', raising=False)
+        with pytest.raises(ValueError, match="SECURITY"):
+            SecureTwilioClient(account_sid='', auth_token='')
+
+    def test_test_credentials_use_mock_mode(self):
+        """Test test credentials fall back to the mock client."""
+        client = SecureTwilioClient(account_sid='ACtest123', auth_token='token_for_testing_only')
+
+        status = client.get_service_status()
+        assert status['mock_mode'] is True
+        assert status['test_credentials'] is True
+        assert status['service_type'] == 'mock'
+
+    def test_real_credentials_use_real_mode(self):
+        """Test production-shaped credentials select the REST client."""
+        client = SecureTwilioClient(account_sid=REAL_SID, auth_token=REAL_TOKEN)
+
+        status = client.get_service_status()
+        assert status['mock_mode'] is False
+        assert status['security_validated'] is True
+        assert status['service_type'] == 'real'
+
+    def test_demo_credentials_classified_once(self):
+        """Test demo tokens report real status with mock behavior, case-insensitively."""
+        client = SecureTwilioClient(account_sid=REAL_SID, auth_token='DEMO_token_for_walkthroughs')
+
+        status = client.get_service_status()
+        assert status['demo_credentials'] is True
+        assert status['test_credentials'] is False
+        assert status['mock_mode'] is True
+        assert status['service_type'] == 'real'
+
+    def test_test_marker_matched_anywhere_in_sid(self):
+        """Test a 'test' marker outside the prefix still selects mock mode."""
+        client = SecureTwilioClient(account_sid='AC00TEST00', auth_token='token_for_testing_only')
+
+        assert client.get_service_status()['test_credentials'] is True
+
+    def test_service_status_snapshot_not_shared(self):
+        """Test callers cannot mutate the cached status snapshot."""
+        client = SecureTwilioClient(account_sid='ACtest123', auth_token='token_for_testing_only')
+
+        client.get_service_status()['mock_mode'] = False
+        assert client.get_service_status()['mock_mode'] is True
+
+
+class TestInputSanitization:
+    """Test phone number and friendly name sanitization."""
+
+    def test_phone_number_stripped_to_digits(self):
+        """Test formatting characters are removed and US is assumed."""
+        client = SecureTwilioClient(account_sid='ACtest123', auth_token='token_for_testing_only')
+
+        assert client._validate_phone_number('(415) 555-0100') == '+14155550100'
+        assert client._validate_phone_number('+44 20 7946 0958') == '+442079460958'
+        # Non-ASCII digits are not valid in E.164 and are dropped
+        assert client._validate_phone_number('+1 415 555 0100 ٤') == '+14155550100'
+
+    def test_friendly_name_keeps_word_characters(self):
+        """Test friendly names keep letters, digits, spaces, hyphens and underscores."""
+        client = SecureTwilioClient(account_sid='ACtest123', auth_token='token_for_testing_only')
+
+        assert client._sanitize_friendly_name('Café Line #1 <script>') == 'Café Line 1 script'
+        assert client._sanitize_friendly_name('!!!') == 'Voice Agent Number'
+
+
+    def test_webhook_url_requires_https_host(self):
+        """Test webhook URLs keep HTTPS hosts and turn anything else into a relative path."""
+        client = SecureTwilioClient(account_sid='ACtest123', auth_token='token_for_testing_only')
+
+        assert client._sanitize_webhook_url('https://example.com/voice') == 'https://example.com/voice'
+        assert client._sanitize_webhook_url('/webhook/voice') == '/webhook/voice'
+        assert client._sanitize_webhook_url('http://example.com/voice') == '/http://example.com/voice'
+        assert client._sanitize_webhook_url('https:///voice') == '/https:///voice'
+
+
+class TestImportCost:
+    """Test the module stays cheap to import."""
+
+    def test_import_does_not_load_twilio_sdk(self):
+        """Test importing the client does not import the Twilio SDK."""
+        import subprocess
+        backend_dir = os.path.join(os.path.dirname(__file__), '../../')
+        code = (
+            "import sys; import src.services.twilio.secure_twilio_client; "
+            "sys.exit('twilio.rest' in sys.modules)"
+        )
+
+        assert subprocess.run([sys.executable, '-c', code], cwd=backend_dir).returncode == 0
+
+
+class TestMockMode:
+    """Test mock provisioning flow."""
+
+    @pytest.mark.asyncio
+    async def test_mock_search_respects_limit(self):
+        """Test mock search returns at most `limit` numbers."""
+        client = SecureTwilioClient(account_sid='ACtest123', auth_token='token_for_testing_only')
+
+        numbers = await client.search_phone_numbers(limit=1)
+        assert len(numbers) == 1
+
+    @pytest.mark.asyncio
+    async def test_mock_fixtures_shared_and_read_only(self):
+        """Test mock clients share immutable fixtures but return their own lists."""
+        import dataclasses
+        first = SecureTwilioClient(account_sid='ACtest123', auth_token='token_for_testing_only')
+        second = SecureTwilioClient(account_sid='ACtest456', auth_token='token_for_testing_only')
+
+        assert first._mock_available_numbers is second._mock_available_numbers
+
+        numbers = await first.search_phone_numbers()
+        numbers[0]['capabilities']['sms'] = False
+        numbers.clear()
+        second_numbers = await second.search_phone_numbers()
+        assert len(second_numbers) == 2
+        assert second_numbers[0]['capabilities'] == {'voice': True, 'sms': True, 'mms': True}
+        assert 'security_validated' not in second_numbers[0]
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first._mock_available_numbers[0].phone_number = '+10000000000'
+
+
+    @pytest.mark.asyncio
+    async def test_mock_provision_and_release_by_sid(self):
+        """Test mock provisioning keys numbers by unique SID."""
+        client = SecureTwilioClient(account_sid='ACtest123', auth_token='token_for_testing_only')
+
+        first = await client.provision_phone_number('+15551234567')
+        second = await client.provision_phone_number('+15557654321')
+        assert first['sid'] != second['sid']
+        assert len(await client.list_provisioned_numbers()) == 2
+
+        assert await client.release_phone_number(first['sid']) is True
+        assert await client.release_phone_number(first['sid']) is False
+        assert [n['sid'] for n in await client.list_provisioned_numbers()] == [second['sid']]
+
+
+class TestRestApi:
+    """Test REST calls against a mocked Twilio API."""
+
+    @pytest.mark.asyncio
+    async def test_search_phone_numbers(self):
+        """Test search maps query parameters and normalizes capabilities."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path.endswith('/AvailablePhoneNumbers/US/Local.json')
+            assert request.url.params['AreaCode'] == '415'
+            return httpx.Response(200, json={'available_phone_numbers': [{
+                'phone_number': '+14155550100',
+                'friendly_name': '(415) 555-0100',
+                'locality': 'San Francisco',
+                'region': 'CA',
+                'postal_code': '94102',
+                'capabilities': {'voice': True, 'SMS': True, 'MMS': False}
+            }]})
+
+        client = make_real_client(handler)
+        numbers = await client.search_phone_numbers(area_code='415')
+        await client.aclose()
+
+        assert numbers[0]['phone_number'] == '+14155550100'
+        assert numbers[0]['capabilities'] == {'voice': True, 'sms': True, 'mms': False}
+        assert numbers[0]['security_validated'] is True
+
+    @pytest.mark.asyncio
+    async def test_provision_list_and_release(self):
+        """Test provisioning, paginated listing and release hit the right endpoints."""
+        resource = {
+            'sid': 'PN' + 'a' * 32,
+            'phone_number': '+14155550100',
+            'friendly_name': 'Support Line',
+            'voice_url': 'https://example.com/voice',
+            'sms_url': None,
+            'capabilities': {'voice': True, 'sms': True, 'mms': True},
+            'status': 'in-use'
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == 'POST':
+                assert b'PhoneNumber=%2B14155550100' in request.content
+                return httpx.Response(201, json=resource)
+            if request.method == 'DELETE':
+                return httpx.Response(204)
+            if 'Page=1' in str(request.url):
+                return httpx.Response(200, json={'incoming_phone_numbers': [resource], 'next_page_uri': None})
+            return httpx.Response(200, json={
+                'incoming_phone_numbers': [resource],
+                'next_page_uri': f"/2010-04-01/Accounts/{REAL_SID}/IncomingPhoneNumbers.json?Page=1"
+            })
+
+        client = make_real_client(handler)
+        provisioned = await client.provision_phone_number(
+            '+14155550100', voice_url='https://example.com/voice', friendly_name='Support Line'
+        )
+        listed = await client.list_provisioned_numbers()
+        released = await client.release_phone_number(resource['sid'])
+        await client.aclose()
+
+        assert provisioned['sid'] == resource['sid']
+        assert len(listed) == 2
+        assert released is True
+
+    @pytest.mark.asyncio
+    async def test_provision_many_runs_in_layers(self):
+        """Test batch provisioning purchases concurrently then configures by SID."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append((request.method, request.url.path))
+            if request.url.path.endswith('/IncomingPhoneNumbers.json'):
+                if b'%2B14155550199' in request.content:
+                    return httpx.Response(400, json={'message': 'not available'})
+                number = request.content.split(b'PhoneNumber=%2B')[1][:11].decode()
+                return httpx.Response(201, json={'sid': f'PN{number}', 'phone_number': f'+{number}'})
+            sid = request.url.path.rsplit('/', 1)[1][:-len('.json')]
+            return httpx.Response(200, json={'sid': sid, 'status': 'configured'})
+
+        client = make_real_client(handler)
+        results = await client.provision_many([
+            {'phone_number': '+14155550100', 'configure': {'StatusCallback': 'https://example.com/status'}},
+            {'phone_number': '+14155550199'},
+            {'phone_number': ''},
+            {'phone_number': '+14155550101'}
+        ])
+        await client.aclose()
+
+        assert results[0]['status'] == 'configured'
+        assert 'error' in results[1]
+        assert 'error' in results[2]
+        assert results[3]['sid'] == 'PN14155550101'
+        # Only the spec with extra configuration gets a follow-up update
+        assert calls[-1] == ('POST', f'/2010-04-01/Accounts/{REAL_SID}/IncomingPhoneNumbers/PN14155550100.json')
+        assert len(calls) == 4
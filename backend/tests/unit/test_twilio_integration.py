@@ -2,8 +2,9 @@
 Test suite for Twilio phone integration service.
 TDD approach: Tests written for phone call handling and VoiceAgent integration.
 """
+import asyncio
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import json
 from datetime import datetime
 import uuid
@@ -15,6 +16,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../'))
 from src.services.twilio.twilio_client import TwilioClient
 from src.services.twilio.phone_service import PhoneService
 from src.services.twilio.call_handler import CallHandler
+from src.services.twilio.call_columns import CallSessionColumns
+from src.services.twilio.intent_classifier import classify_intent
 
 
 class TestTwilioClient:
@@ -43,6 +46,18 @@ class TestTwilioClient:
             assert client.auth_token == mock_credentials['auth_token']
             assert client.phone_number == mock_credentials['phone_number']
     
+    def test_sdk_client_shared_per_credentials(self):
+        """Test TwilioClient instances reuse one SDK client per credential pair."""
+        with patch('src.services.twilio.twilio_client.Client') as mock_twilio:
+            mock_twilio.side_effect = lambda sid, token: Mock()
+            first = TwilioClient('AC_one', 'token_one')
+            second = TwilioClient('AC_one', 'token_one')
+            other = TwilioClient('AC_two', 'token_two')
+            
+            assert first.client is second.client
+            assert other.client is not first.client
+            assert mock_twilio.call_count == 2
+    
     def test_client_initialization_without_credentials(self):
         """Test client raises error without proper credentials."""
         with pytest.raises(ValueError, match="Account SID and Auth Token are required"):
@@ -165,6 +180,97 @@ class TestTwilioClient:
         assert 'action="https://example.com/handle-recording"' in twiml
         assert 'Please leave a message after the beep' in twiml
     
+    def test_twiml_templates_match_sdk_output(self, client):
+        """Test templated TwiML is identical to the VoiceResponse serialization."""
+        message = 'Hi <caller> & "friend"\nwelcome'
+        action_url = 'https://example.com/gather?session=1&step="2"'
+        
+        assert client.create_voice_response(message) == client.create_voice_response(message, strict=True)
+        assert client.create_voice_response() == client.create_voice_response(strict=True)
+        assert (client.create_gather_response(message, action_url, num_digits=4, timeout=10, voice='Polly.Joanna')
+                == client.create_gather_response(message, action_url, num_digits=4, timeout=10,
+                                                 voice='Polly.Joanna', strict=True))
+        assert (client.create_record_response(message, action_url, max_length=60)
+                == client.create_record_response(message, action_url, max_length=60, strict=True))
+    
+    def test_twiml_reused_across_calls(self, client):
+        """Test repeated prompts reuse cached TwiML while the action URL varies per call."""
+        from src.services.twilio.twilio_client import _gather_segments
+        
+        _gather_segments.cache_clear()
+        first = client.create_gather_response("How can I help?", "https://example.com/gather/call-1")
+        second = client.create_gather_response("How can I help?", "https://example.com/gather/call-2")
+        
+        assert 'action="https://example.com/gather/call-1"' in first
+        assert 'action="https://example.com/gather/call-2"' in second
+        assert _gather_segments.cache_info().hits == 1
+    
+    def test_warm_up_fetches_account(self, client):
+        """Test warm-up opens a connection by fetching the account."""
+        assert client.warm_up() is True
+        client.client.api.accounts.assert_called_once_with('test_account_sid')
+
+        client.client.api.accounts.return_value.fetch.side_effect = Exception("Network down")
+        assert client.warm_up() is False
+
+    def test_account_usage_per_category(self, client):
+        """Test usage totals read the aggregated this-month record for each category."""
+        call_record = Mock(count='3', usage='120', price='0.45')
+        sms_record = Mock(count='5', usage='5', price='0.0375')
+        client.client.usage.records.this_month.list.side_effect = (
+            lambda category, **kwargs: {'calls': [call_record], 'sms-outbound': [sms_record]}[category]
+        )
+        
+        usage = client.get_account_usage()
+        
+        assert usage['calls'] == 3
+        assert usage['call_duration'] == 120
+        assert usage['sms_sent'] == 5
+        assert usage['total_cost'] == pytest.approx(0.4875)
+    
+    @pytest.mark.asyncio
+    async def test_async_rest_calls(self, client):
+        """Test async call, SMS and lookup methods hit the REST API directly."""
+        import httpx
+        
+        def handler(request):
+            path = request.url.path
+            if path.endswith('/Calls.json'):
+                assert b'To=%2B15559876543' in request.content
+                return httpx.Response(201, json={
+                    'sid': 'CA123', 'status': 'queued',
+                    'date_created': 'Tue, 31 Aug 2010 20:36:28 +0000', 'duration': None
+                })
+            if path.endswith('/Messages.json'):
+                return httpx.Response(201, json={'sid': 'SM123', 'status': 'queued', 'date_created': None})
+            if path.endswith('/Recordings.json'):
+                assert request.url.params['CallSid'] == 'CA123'
+                return httpx.Response(200, json={'recordings': [{'sid': 'RE123', 'call_sid': 'CA123'}]})
+            if request.method == 'POST':
+                return httpx.Response(200, json={'sid': 'CA123', 'status': 'completed'})
+            return httpx.Response(200, json={'sid': 'CA123', 'from': '+15551234567', 'status': 'in-progress'})
+        
+        client._http = httpx.AsyncClient(base_url='https://api.twilio.com', transport=httpx.MockTransport(handler))
+        
+        call = await client.make_call_async('+15559876543', 'https://example.com/twiml')
+        assert call['call_sid'] == 'CA123'
+        assert call['date_created'] == '2010-08-31T20:36:28+00:00'
+        
+        sms = await client.send_sms_async('+15559876543', 'Hello')
+        assert sms['message_sid'] == 'SM123'
+        
+        details = await client.get_call_details_async('CA123')
+        assert details['from'] == '+15551234567'
+        
+        recordings = await client.get_call_recordings_async('CA123')
+        assert recordings[0]['recording_sid'] == 'RE123'
+        
+        updated = await client.update_call_async('CA123', 'completed')
+        assert updated['status'] == 'completed'
+        
+        await client.aclose()
+        assert client._http is None
+    
     @patch('src.services.twilio.twilio_client.Client')
     def test_validate_phone_number_success(self, mock_twilio_class, client):
         """Test successful phone number validation."""
@@ -193,6 +299,53 @@ class TestTwilioClient:
         assert result['valid'] is False
         assert 'error' in result
 
+    @pytest.mark.asyncio
+    async def test_fetch_recording_streams_over_pooled_client(self, client):
+        """Test recordings stream chunk by chunk through the shared REST client."""
+        import httpx
+        audio = b'RIFF' + b'\x00' * 300
+        requested = []
+
+        def respond(request):
+            requested.append(request.url)
+            return httpx.Response(200, content=audio)
+
+        client._http = httpx.AsyncClient(
+            base_url='https://api.twilio.com/2010-04-01/Accounts/AC123',
+            transport=httpx.MockTransport(respond)
+        )
+        http = client._http
+        chunks = []
+
+        async def sink(chunk):
+            chunks.append(chunk)
+
+        size = await client.fetch_recording('RE0123456789abcdef0123456789abcdef', sink, chunk_size=100)
+
+        assert size == len(audio)
+        assert str(requested[0]) == 'https://api.twilio.com/2010-04-01/Accounts/AC123/Recordings/RE0123456789abcdef0123456789abcdef.wav'
+        assert b''.join(chunks) == audio
+        assert len(chunks) > 1
+        assert client._http is http
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fetch_recording_rejects_untrusted_identifier(self, client):
+        """Test a webhook-supplied URL or path is never fetched with the account credentials."""
+        import httpx
+        requested = []
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: requested.append(request)))
+
+        async def sink(chunk):
+            pass
+
+        for recording_sid in ('https://attacker.example/RE123', '../Calls', None):
+            with pytest.raises(ValueError):
+                await client.fetch_recording(recording_sid, sink)
+
+        assert requested == []
+        await client.aclose()
+
 
 class TestPhoneService:
     """Test phone service integration with VoiceAgent models."""
@@ -260,6 +413,8 @@ class TestPhoneService:
         call_session = phone_service.active_calls[call_session_id]
         assert call_session['voice_agent_id'] == 'agent_123'
         assert call_session['tenant_id'] == 'tenant_456'
+        assert call_session['call_sid'] == 'CA123456789'
+        assert call_session['direction'] == 'outbound'
     
     @patch('src.services.twilio.phone_service.VoiceAgent')
     def test_initiate_outbound_call_invalid_agent(self, mock_voice_agent_class, phone_service):
@@ -287,6 +442,28 @@ class TestPhoneService:
                 tenant_id='tenant_456'
             )
     
+    @pytest.mark.asyncio
+    @patch('src.services.twilio.phone_service.VoiceAgent')
+    async def test_submit_outbound_calls_batched(self, mock_voice_agent_class, phone_service, mock_twilio_client, mock_voice_agent):
+        """Test concurrent outbound submissions are placed and resolved individually."""
+        mock_voice_agent_class.get_by_id.return_value = mock_voice_agent
+        mock_twilio_client.validate_phone_number.side_effect = (
+            lambda number: {'valid': number != 'invalid-number'}
+        )
+        mock_twilio_client.make_call.return_value = {'call_sid': 'CA123456789'}
+
+        results = await asyncio.gather(
+            phone_service.submit_outbound_call('agent_123', '+15559876543', 'tenant_456'),
+            phone_service.submit_outbound_call('agent_123', '+15559876544', 'tenant_456'),
+            phone_service.submit_outbound_call('agent_123', 'invalid-number', 'tenant_456'),
+            return_exceptions=True
+        )
+
+        assert results[0]['to_number'] == '+15559876543'
+        assert results[1]['to_number'] == '+15559876544'
+        assert isinstance(results[2], ValueError)
+        assert mock_twilio_client.make_call.call_count == 2
+
     @patch('src.services.twilio.phone_service.VoiceAgent')
     def test_handle_inbound_call_success(self, mock_voice_agent_class, phone_service, mock_twilio_client, mock_voice_agent):
         """Test successful inbound call handling."""
@@ -318,6 +495,56 @@ class TestPhoneService:
         assert 'No agents available' in result or 'busy' in result.lower()
         mock_twilio_client.create_voice_response.assert_called_once()
     
+    @patch('src.services.twilio.phone_service.VoiceAgent')
+    def test_inbound_agent_route_cached_until_invalidated(self, mock_voice_agent_class, phone_service, mock_voice_agent):
+        """Test tenant routes cache agent keys and re-read the agent by primary key."""
+        mock_voice_agent_class.list_by_tenant.return_value = [mock_voice_agent]
+        mock_voice_agent_class.get_by_id.return_value = mock_voice_agent
+
+        assert phone_service._find_agent_for_inbound_call('+15559876543', 'tenant_456') is mock_voice_agent
+        assert phone_service._find_agent_for_inbound_call('+15559876543', 'tenant_456') is mock_voice_agent
+        assert mock_voice_agent_class.list_by_tenant.call_count == 1
+        mock_voice_agent_class.get_by_id.assert_called_once_with(mock_voice_agent.id, mock_voice_agent.tenant_id)
+        assert phone_service._agent_routes['tenant_456'][:2] == (mock_voice_agent.id, mock_voice_agent.tenant_id)
+
+        phone_service.invalidate_agent_route('tenant_456')
+        phone_service._find_agent_for_inbound_call('+15559876543', 'tenant_456')
+        assert mock_voice_agent_class.list_by_tenant.call_count == 2
+
+    @patch('src.services.twilio.phone_service.VoiceAgent')
+    def test_inbound_agent_route_dropped_when_stale(self, mock_voice_agent_class, phone_service, mock_voice_agent):
+        """Test deactivated agents and expired routes fall back to a fresh tenant lookup."""
+        replacement = Mock(id='agent_new', tenant_id='tenant_456', is_active=True)
+        mock_voice_agent_class.list_by_tenant.side_effect = [[mock_voice_agent], [replacement], [replacement]]
+        mock_voice_agent_class.get_by_id.return_value = Mock(is_active=False)
+
+        phone_service._find_agent_for_inbound_call('+15559876543', 'tenant_456')
+        assert phone_service._find_agent_for_inbound_call('+15559876543', 'tenant_456') is replacement
+
+        with patch('src.services.twilio.phone_service.time.monotonic', return_value=float('inf')):
+            assert phone_service._find_agent_for_inbound_call('+15559876543', 'tenant_456') is replacement
+        assert mock_voice_agent_class.list_by_tenant.call_count == 3
+
+    @patch('src.services.twilio.phone_service.VoiceAgent')
+    def test_inbound_agent_lookup_db_error(self, mock_voice_agent_class, phone_service):
+        """Test database errors during agent lookup fall back to no agent."""
+        from sqlalchemy.exc import OperationalError
+        mock_voice_agent_class.list_by_tenant.side_effect = OperationalError('SELECT', {}, Exception('down'))
+
+        assert phone_service._find_agent_for_inbound_call('+15559876543', 'tenant_456') is None
+
+    @pytest.mark.asyncio
+    async def test_connection_keepalive_lifecycle(self, phone_service, mock_twilio_client):
+        """Test keep-alive warms connections on start and stops cleanly."""
+        mock_twilio_client.warm_up.return_value = True
+
+        await phone_service.start_connection_keepalive(interval=0.01)
+        await asyncio.sleep(0.05)
+        await phone_service.stop_connection_keepalive()
+
+        assert mock_twilio_client.warm_up.call_count >= 2
+        assert phone_service._keepalive_task is None
+
     def test_handle_user_input_business_hours(self, phone_service, mock_voice_agent, mock_twilio_client):
         """Test user input handling for business hours inquiry."""
         # Setup call session
@@ -383,6 +610,40 @@ class TestPhoneService:
         assert '<Response>' in result
         # Should handle call completion
     
+    def test_user_input_not_stored_in_call_context(self, phone_service, mock_voice_agent):
+        """Test mixed-case input is classified without caching the utterance on the call."""
+        call_context = {'status': 'active'}
+
+        response = phone_service._process_user_input_with_agent(
+            mock_voice_agent, 'GOODBYE for now', 'speech', call_context
+        )
+
+        assert response['call_complete'] is True
+        assert call_context == {'status': 'active'}
+
+    def test_digit_input_skips_lowercasing(self, phone_service, mock_voice_agent):
+        """Test DTMF input is classified as-is without a lowercased copy."""
+        digits = Mock(spec=str)
+        digits.lower.side_effect = AssertionError('digits must not be lowercased')
+
+        with patch('src.services.twilio.phone_service.classify_intent', return_value='unknown') as classify:
+            phone_service._process_user_input_with_agent(mock_voice_agent, digits, 'digits', {})
+
+        classify.assert_called_once_with(digits)
+
+    def test_process_user_input_intent_responses(self, phone_service, mock_voice_agent):
+        """Test each intent resolves knowledge base content and response flags."""
+        hours = phone_service._process_user_input_with_agent(mock_voice_agent, 'When are you open?', 'speech', {})
+        assert hours == {'message': 'We are open Monday to Friday, 9 AM to 5 PM.', 'requires_followup': True}
+
+        pricing = phone_service._process_user_input_with_agent(mock_voice_agent, 'What does it cost?', 'speech', {})
+        assert pricing['requires_transfer'] is True
+        assert pricing['transfer_type'] == 'sales'
+        assert 'sales team' in pricing['message']
+
+        unknown = phone_service._process_user_input_with_agent(mock_voice_agent, '7', 'digits', {})
+        assert unknown['transfer_type'] == 'general'
+
     def test_handle_user_input_invalid_session(self, phone_service, mock_twilio_client):
         """Test user input with invalid session ID."""
         mock_twilio_client.create_voice_response.return_value = '<Response>Session expired</Response>'
@@ -415,11 +676,69 @@ class TestPhoneService:
         assert isinstance(result, str)
         assert '<Response>' in result
         
-        # Verify recording info was stored
-        call_session = phone_service.active_calls[call_session_id]
-        assert call_session['recording_url'] == 'https://api.twilio.com/recordings/RE123.wav'
-        assert call_session['transcription'] == 'This is a test recording'
+        # Verify recording info was logged without touching the call context
+        events = phone_service.drain_recording_events()
+        assert len(events) == 1
+        assert events[0].call_session_id == call_session_id
+        assert events[0].recording_url == 'https://api.twilio.com/recordings/RE123.wav'
+        assert events[0].transcription == 'This is a test recording'
+        assert 'recording_url' not in phone_service.active_calls[call_session_id]
+        assert phone_service.drain_recording_events() == []
     
+    @pytest.mark.asyncio
+    async def test_recording_events_flushed_to_sink(self, mock_twilio_client, mock_voice_agent):
+        """Test the background drainer persists recording events and retries failed writes."""
+        persisted = []
+        failures = [RuntimeError('database unavailable')]
+
+        async def sink(events):
+            if failures:
+                raise failures.pop()
+            persisted.extend(events)
+
+        phone_service = PhoneService(mock_twilio_client, recording_event_sink=sink)
+        mock_twilio_client.create_voice_response.return_value = '<Response />'
+        for call_session_id in ('first', 'second'):
+            phone_service.active_calls[call_session_id] = {'voice_agent': mock_voice_agent, 'status': 'active'}
+
+        with patch('src.services.twilio.phone_service.RECORDING_EVENT_FLUSH_DELAY', 0):
+            phone_service.handle_recording_complete('first', 'https://api.twilio.com/recordings/RE1.wav')
+            phone_service.handle_recording_complete('second', 'https://api.twilio.com/recordings/RE2.wav')
+            await asyncio.wait_for(phone_service._recording_persister, timeout=1)
+
+        assert [event.call_session_id for event in persisted] == ['first', 'second']
+        assert len(phone_service.recording_events) == 0
+    
+    @pytest.mark.asyncio
+    async def test_fetch_recording_streams_to_handler(self, mock_twilio_client):
+        """Test recordings are streamed to the handler and not retained by the service."""
+        received = []
+
+        async def handler(call_session_id, chunk):
+            received.append((call_session_id, chunk))
+
+        async def stream(recording_sid, sink):
+            for chunk in (b'RI', b'FF'):
+                await sink(chunk)
+            return 4
+
+        mock_twilio_client.fetch_recording = AsyncMock(side_effect=stream)
+        phone_service = PhoneService(mock_twilio_client, recording_handler=handler)
+
+        await phone_service.fetch_recording('session_1', 'RE0123456789abcdef0123456789abcdef')
+
+        assert received == [('session_1', b'RI'), ('session_1', b'FF'), ('session_1', b'')]
+        assert not hasattr(phone_service, 'recording_queue')
+
+    @pytest.mark.asyncio
+    async def test_fetch_recording_skipped_without_handler(self, phone_service, mock_twilio_client):
+        """Test nothing is downloaded when no recording consumer is configured."""
+        mock_twilio_client.fetch_recording = AsyncMock()
+
+        await phone_service.fetch_recording('session_1', 'RE0123456789abcdef0123456789abcdef')
+
+        mock_twilio_client.fetch_recording.assert_not_awaited()
+
     def test_end_call_session(self, phone_service, mock_voice_agent):
         """Test call session cleanup."""
         call_session_id = str(uuid.uuid4())
@@ -436,6 +755,79 @@ class TestPhoneService:
         assert 'ended_at' in call_session
 
 
+    def test_new_session_ids_unique(self, phone_service):
+        """Test batched session IDs are unique and URL-safe."""
+        ids = {phone_service._new_session_id() for _ in range(2500)}
+
+        assert len(ids) == 2500
+        assert all(len(session_id) == 22 for session_id in ids)
+        assert all('/' not in session_id and '+' not in session_id for session_id in ids)
+
+    def test_release_call_session_leaves_held_context_intact(self, phone_service, mock_voice_agent):
+        """Test released sessions free their slot without touching contexts callers still hold."""
+        call_session_id = str(uuid.uuid4())
+        phone_service._register_call(call_session_id, voice_agent=mock_voice_agent, status='active')
+        held = phone_service.get_call_session(call_session_id)
+
+        assert '_slot' not in held
+        assert phone_service.release_call_session(call_session_id) is True
+        assert call_session_id not in phone_service.active_calls
+        assert call_session_id not in phone_service._call_slots
+        assert phone_service.release_call_session(call_session_id) is False
+        assert held == {'voice_agent': mock_voice_agent, 'status': 'active'}
+
+    @pytest.mark.asyncio
+    async def test_ended_call_released_after_delay(self, phone_service, mock_voice_agent):
+        """Test ending a call inside the event loop schedules its release."""
+        phone_service._register_call('ended', voice_agent=mock_voice_agent, status='active')
+
+        with patch.object(phone_service, '_schedule_call_release') as schedule_release:
+            phone_service.end_call_session('ended')
+        schedule_release.assert_called_once_with('ended')
+        assert 'ended' in phone_service.active_calls
+
+        phone_service._schedule_call_release('ended', delay=0)
+        await asyncio.sleep(0.01)
+        assert 'ended' not in phone_service.active_calls
+        assert phone_service.get_call_statistics()['active_calls'] == 0
+
+    def test_call_statistics_track_session_lifecycle(self, phone_service, mock_voice_agent):
+        """Test call statistics follow sessions from start to release."""
+        phone_service._register_call('first', tenant_id='tenant_456', voice_agent=mock_voice_agent)
+        phone_service._register_call('second', tenant_id='tenant_789', direction='inbound')
+
+        stats = phone_service.get_call_statistics()
+        assert stats['active_calls'] == 2
+        assert stats['active_calls_by_tenant'] == {'tenant_456': 1, 'tenant_789': 1}
+
+        phone_service.end_call_session('first')
+        phone_service.release_call_session('second')
+
+        stats = phone_service.get_call_statistics()
+        assert stats['active_calls'] == 0
+        assert stats['active_calls_by_tenant'] == {}
+        assert stats['mean_call_duration_seconds'] >= 0.0
+
+    def test_calls_registered_from_worker_threads(self, phone_service):
+        """Test concurrent registrations from worker threads get distinct slots and counts."""
+        from concurrent.futures import ThreadPoolExecutor
+        phone_service.call_columns = CallSessionColumns(capacity=1)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: phone_service._register_call(f'call_{i}', tenant_id='tenant_456'), range(400)))
+
+        assert len(set(phone_service._call_slots.values())) == 400
+        assert phone_service.get_call_statistics()['active_calls_by_tenant'] == {'tenant_456': 400}
+
+    def test_classify_intent_first_match_wins(self):
+        """Test keyword intents are matched in priority order."""
+        assert classify_intent('are you open on sunday') == 'hours'
+        assert classify_intent('what does it cost') == 'pricing'
+        assert classify_intent('hours and prices please') == 'hours'
+        assert classify_intent('thank you, bye') == 'goodbye'
+        assert classify_intent('1') == 'unknown'
+
+
 class TestCallHandler:
     """Test call handler webhook functionality."""
     
@@ -555,6 +947,7 @@ class TestCallHandler:
         
         webhook_data = {
             'RecordingUrl': 'https://api.twilio.com/recordings/RE123.wav',
+            'RecordingSid': 'RE123',
             'RecordingDuration': '30',
             'TranscriptionText': 'This is a test message',
             'CallSid': 'CA123456789'
@@ -564,6 +957,7 @@ class TestCallHandler:
         
         assert result == '<Response>Recording processed</Response>'
         mock_phone_service.handle_recording_complete.assert_called_once()
+        assert mock_phone_service.handle_recording_complete.call_args.kwargs['recording_sid'] == 'RE123'
     
     def test_handle_status_webhook(self, call_handler, mock_phone_service):
         """Test status webhook handling."""
@@ -421,10 +421,12 @@ class TestPhoneService:
         assert isinstance(result, str)
         assert '<Response>' in result
         
-        # Verify recording info was stored
-        call_session = phone_service.active_calls[call_session_id]
-        assert call_session['recording_url'] == 'https://api.twilio.com/recordings/RE123.wav'
-        assert call_session['transcription'] == 'This is a test recording'
+        # Verify recording info was logged without touching the call context
+        events = phone_service.drain_recording_events()
+        assert len(events) == 1
+        assert events[0].recording_url == 'https://api.twilio.com/recordings/RE123.wav'
+        assert events[0].transcription == 'This is a test recording'
+        assert 'recording_url' not in phone_service.active_calls[call_session_id]
     
     def test_end_call_session(self, phone_service, mock_voice_agent):
         """Test call session cleanup."""
@@ -0,0 +1,230 @@
+"""
+Tests for VoiceAgentService against the in-memory Firestore client.
+Covers tenant listing, pagination and the mutation paths.
+"""
+import pytest
+from unittest.mock import patch
+
+from src.services.voice_agent_service import (
+    AsyncVoiceAgentService,
+    VoiceAgentService,
+    MockAsyncFirestoreClient,
+    MockFirestoreClient,
+    VoiceAgentError,
+    AGENT_SUMMARY_FIELDS
+)
+
+
+TENANT_ID = 'tenant-1'
+
+
+@pytest.fixture
+def service():
+    """Service backed by an empty in-memory Firestore."""
+    return VoiceAgentService(firestore_client=MockFirestoreClient())
+
+
+def create_agents(service, count, tenant_id=TENANT_ID):
+    """Create ``count`` agents and return them in creation order."""
+    return [
+        service.create_agent(tenant_id, {'name': f'Agent {i}'})
+        for i in range(count)
+    ]
+
+
+class TestServiceConstruction:
+    """Test how services obtain their Firestore client."""
+
+    def test_services_share_one_default_client(self):
+        """Test services built without a client reuse a single Firestore client."""
+        from src.services import voice_agent_service
+
+        voice_agent_service._shared_firestore_client.cache_clear()
+        with patch.object(voice_agent_service, 'get_firestore_client', side_effect=MockFirestoreClient) as factory:
+            first, second = VoiceAgentService(), VoiceAgentService()
+        voice_agent_service._shared_firestore_client.cache_clear()
+
+        assert first.db is second.db
+        factory.assert_called_once()
+
+
+class TestAgentListing:
+    """Test tenant agent listing and pagination."""
+
+    def test_listing_projects_summary_fields(self, service):
+        """Test listings can skip the knowledge base."""
+        create_agents(service, 2)
+
+        full = service.get_agents_for_tenant(TENANT_ID)
+        summary = service.get_agents_for_tenant(TENANT_ID, fields=AGENT_SUMMARY_FIELDS)
+
+        assert 'knowledge_base' in full[0]
+        assert set(summary[0]) == set(AGENT_SUMMARY_FIELDS)
+
+    def test_pages_follow_cursor(self, service):
+        """Test pages resume after the cursor and the last page has no cursor."""
+        created = create_agents(service, 5)
+        create_agents(service, 1, tenant_id='tenant-2')
+
+        first, cursor = service.get_agents_page(TENANT_ID, page_size=2)
+        second, cursor = service.get_agents_page(TENANT_ID, page_size=2, cursor=cursor)
+        third, cursor = service.get_agents_page(TENANT_ID, page_size=2, cursor=cursor)
+
+        seen = [agent['id'] for agent in first + second + third]
+        assert seen == [agent['id'] for agent in created]
+        assert len(third) == 1
+        assert cursor is None
+        assert 'knowledge_base' not in first[0]
+
+    def test_listing_query_has_composite_index(self):
+        """Test the shipped index covers the tenant listing filters and ordering."""
+        import json
+        import os
+        index_path = os.path.join(os.path.dirname(__file__), '../../firestore.indexes.json')
+        with open(index_path) as f:
+            indexes = json.load(f)['indexes']
+
+        fields = [
+            (field['fieldPath'], field['order'])
+            for index in indexes if index['collectionGroup'] == 'voice_agents'
+            for field in index['fields']
+        ]
+        assert fields == [('tenant_id', 'ASCENDING'), ('is_active', 'ASCENDING'), ('created_at', 'DESCENDING')]
+
+    def test_batch_get_filters_and_keeps_order(self, service):
+        """Test batched reads keep request order and drop foreign, deleted and missing agents."""
+        first, second, deleted = create_agents(service, 3)
+        foreign = create_agents(service, 1, tenant_id='tenant-2')[0]
+        service.delete_agent(deleted['id'], TENANT_ID)
+
+        with patch.object(service.db, 'get_all', wraps=service.db.get_all) as get_all:
+            agents = service.get_agents_by_ids(
+                [second['id'], 'missing', foreign['id'], deleted['id'], first['id'], second['id']],
+                TENANT_ID
+            )
+
+        assert [agent['id'] for agent in agents] == [second['id'], first['id']]
+        get_all.assert_called_once()
+
+
+class TestAsyncAgentListing:
+    """Test tenant agent listing on the async client."""
+
+    @pytest.mark.asyncio
+    async def test_async_listing_matches_sync(self, service):
+        """Test async listings and pages return what the sync service stored."""
+        created = create_agents(service, 3)
+        async_service = AsyncVoiceAgentService(firestore_client=MockAsyncFirestoreClient(service.db))
+
+        agents = await async_service.get_agents_for_tenant(TENANT_ID, fields=AGENT_SUMMARY_FIELDS)
+        first, cursor = await async_service.get_agents_page(TENANT_ID, page_size=2)
+        second, cursor = await async_service.get_agents_page(TENANT_ID, page_size=2, cursor=cursor)
+
+        assert [agent['id'] for agent in agents] == [agent['id'] for agent in created]
+        assert set(agents[0]) == set(AGENT_SUMMARY_FIELDS)
+        assert [agent['id'] for agent in first + second] == [agent['id'] for agent in created]
+        assert cursor is None
+
+
+class TestAgentMutations:
+    """Test tenant-checked updates, status changes and soft deletes."""
+
+    def test_mutations_require_ownership(self, service):
+        """Test other tenants cannot update, activate or delete an agent."""
+        agent = create_agents(service, 1)[0]
+
+        assert service.update_agent(agent['id'], 'tenant-2', {'name': 'Hijacked'}) is None
+        assert service.activate_agent(agent['id'], 'tenant-2') is None
+        assert service.delete_agent(agent['id'], 'tenant-2') is False
+        assert service.get_agent_by_id(agent['id'], TENANT_ID)['name'] == 'Agent 0'
+
+    def test_status_and_delete_use_conditional_writes(self, service):
+        """Test each mutation is one read plus one write guarded by the read's update time."""
+        agent = create_agents(service, 1)[0]
+
+        with patch.object(service.db, 'write_option', wraps=service.db.write_option) as write_option:
+            activated = service.activate_agent(agent['id'], TENANT_ID)
+            assert activated['status'] == 'active'
+            assert service.deactivate_agent(agent['id'], TENANT_ID)['status'] == 'inactive'
+            assert service.delete_agent(agent['id'], TENANT_ID) is True
+
+        assert write_option.call_count == 3
+        write_option.assert_called_with(last_update_time=None)
+        assert service.get_agent_by_id(agent['id'], TENANT_ID) is None
+        assert service.delete_agent(agent['id'], TENANT_ID) is False
+
+
+    def test_unchanged_values_skip_the_write(self, service):
+        """Test no-op updates and repeated status changes do not write."""
+        agent = create_agents(service, 1)[0]
+
+        with patch.object(service, '_update_if_unchanged') as update:
+            unchanged = service.update_agent(agent['id'], TENANT_ID, {'name': 'Agent 0', 'description': ''})
+            deactivated = service.deactivate_agent(agent['id'], TENANT_ID)
+            renamed = service.update_agent(agent['id'], TENANT_ID, {'name': 'Renamed', 'description': ''})
+
+        assert unchanged['updated_at'] == agent['updated_at']
+        assert deactivated['status'] == 'inactive'
+        assert renamed['name'] == 'Renamed'
+        update.assert_called_once()
+        assert set(update.call_args.args[2]) == {'name', 'updated_at'}
+
+    def test_soft_delete_stamps_server_time(self, service):
+        """Test soft deletes send the server timestamp sentinel instead of a client time."""
+        from datetime import datetime
+        from src.services.voice_agent_service import SERVER_TIMESTAMP
+        agent = create_agents(service, 1)[0]
+        assert agent['created_at'] == agent['updated_at']
+
+        with patch.object(service, '_update_if_unchanged', wraps=service._update_if_unchanged) as update:
+            service.delete_agent(agent['id'], TENANT_ID)
+
+        assert update.call_args.args[2]['updated_at'] is SERVER_TIMESTAMP
+        stored = service.db.collection('voice_agents').document(agent['id']).get().to_dict()
+        assert isinstance(stored['updated_at'], datetime)
+
+
+    def test_errors_chain_cause_and_pass_firestore_errors_through(self, service):
+        """Test failures keep their cause while Firestore API errors are not wrapped."""
+        from google.api_core.exceptions import ServiceUnavailable
+        agent = create_agents(service, 1)[0]
+
+        with patch.object(service, '_get_owned_snapshot', side_effect=KeyError('boom')):
+            with pytest.raises(VoiceAgentError, match="Failed to update voice agent") as exc_info:
+                service.update_agent(agent['id'], TENANT_ID, {'name': 'Renamed'})
+        assert isinstance(exc_info.value, ValueError)
+        assert isinstance(exc_info.value.__cause__, KeyError)
+
+        with patch.object(service, '_get_owned_snapshot', side_effect=ServiceUnavailable('retry me')):
+            with pytest.raises(ServiceUnavailable):
+                service.delete_agent(agent['id'], TENANT_ID)
+
+
+class TestAgentCreation:
+    """Test knowledge base preparation when creating agents."""
+
+    def test_empty_knowledge_base_has_every_category(self, service):
+        """Test agents without knowledge get their own empty knowledge base."""
+        from src.schemas.knowledge_categories import EMPTY_KNOWLEDGE_BASE, KNOWLEDGE_CATEGORIES
+
+        first, second = create_agents(service, 2)
+
+        assert list(first['knowledge_base']) == KNOWLEDGE_CATEGORIES
+        first['knowledge_base']['company_overview'] = {'title': 'Changed'}
+        assert second['knowledge_base']['company_overview'] is None
+        assert EMPTY_KNOWLEDGE_BASE['company_overview'] is None
+
+    def test_knowledge_categories_validated(self, service):
+        """Test supplied categories are validated and unknown categories rejected."""
+        agent = service.create_agent(TENANT_ID, {
+            'name': 'Agent',
+            'knowledge_base': {
+                'company_overview': {'title': 'About', 'content': 'We build things', 'keywords': [' a ', '']},
+                'faq_support': None
+            }
+        })
+
+        assert agent['knowledge_base']['company_overview']['keywords'] == ['a']
+        assert agent['knowledge_base']['faq_support'] is None
+        with pytest.raises(ValueError, match="Invalid category"):
+            service.create_agent(TENANT_ID, {'name': 'Agent', 'knowledge_base': {'gossip': {'title': 't', 'content': 'c'}}})
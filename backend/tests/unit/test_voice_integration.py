@@ -3,7 +3,8 @@ Test suite for ElevenLabs voice integration service.
 TDD approach: Tests written first to define the expected behavior.
 """
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+import requests
+from unittest.mock import Mock, MagicMock, patch, AsyncMock
 import json
 from datetime import datetime
 
@@ -34,12 +35,26 @@ class TestElevenLabsClient:
         assert client.base_url == "https://api.elevenlabs.io/v1"
         assert client.timeout == 30
     
+    def test_session_shared_with_api_key_header(self, mock_api_key):
+        """Test requests share one keep-alive session carrying the API key."""
+        with ElevenLabsClient(api_key=mock_api_key) as client:
+            assert client._session.headers["xi-api-key"] == mock_api_key
+            assert client._session.headers["Content-Type"] == "application/json"
+            adapter = client._session.get_adapter(client.base_url)
+            assert adapter._pool_maxsize == 20
+            assert 429 in adapter.max_retries.status_forcelist
+            assert adapter.max_retries.respect_retry_after_header
+        
+        with patch.object(client._session, 'close') as mock_close:
+            client.close()
+            mock_close.assert_called_once()
+    
     def test_client_initialization_without_api_key(self):
         """Test client raises error without API key."""
         with pytest.raises(ValueError, match="API key is required"):
             ElevenLabsClient(api_key=None)
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_voices_success(self, mock_get, client):
         """Test successful retrieval of available voices."""
         mock_response = Mock()
@@ -58,11 +73,51 @@ class TestElevenLabsClient:
         assert voices[0]["name"] == "Alice"
         mock_get.assert_called_once_with(
             f"{client.base_url}/voices",
-            headers={"xi-api-key": client.api_key},
             timeout=client.timeout
         )
     
-    @patch('requests.get')
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
+    def test_voice_lookups_cached_until_invalidated(self, mock_get, mock_post, client):
+        """Test voice listings and settings are cached and dropped on writes."""
+        mock_get.return_value = Mock(status_code=200, json=Mock(return_value={"voices": [], "stability": 0.5}))
+        mock_post.return_value = Mock(status_code=200, json=Mock(return_value={"voice_id": "new"}))
+        
+        client.get_voices()
+        client.get_voices()
+        client.get_voice_settings("voice1")
+        client.get_voice_settings("voice1")
+        assert mock_get.call_count == 2
+        
+        client.clone_voice("Clone", [b"audio"])
+        client.update_voice_settings("voice1", {"stability": 0.9})
+        client.get_voices()
+        client.get_voice_settings("voice1")
+        assert mock_get.call_count == 4
+    
+    @patch('requests.Session.get')
+    def test_cached_voices_not_shared_with_callers(self, mock_get, client):
+        """Test editing a cached lookup result does not change later results."""
+        mock_get.return_value = Mock(status_code=200, json=Mock(return_value={"voices": [{"voice_id": "v1"}]}))
+        
+        voices = client.get_voices()
+        voices[0]["voice_id"] = "edited"
+        voices.append({"voice_id": "extra"})
+        
+        assert client.get_voices() == [{"voice_id": "v1"}]
+        assert mock_get.call_count == 1
+    
+    @patch('requests.Session.get')
+    def test_voice_cache_disabled_with_zero_ttl(self, mock_get, mock_api_key):
+        """Test cache_ttl=0 always hits the API."""
+        mock_get.return_value = Mock(status_code=200, json=Mock(return_value={"voices": []}))
+        client = ElevenLabsClient(api_key=mock_api_key, cache_ttl=0)
+        
+        client.get_voices()
+        client.get_voices()
+        assert mock_get.call_count == 2
+    
+    @patch('requests.Session.get')
     def test_get_voices_api_error(self, mock_get, client):
         """Test handling of API errors when getting voices."""
         mock_response = Mock()
@@ -73,7 +128,19 @@ class TestElevenLabsClient:
         with pytest.raises(Exception, match="API error.*401"):
             client.get_voices()
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
+    def test_api_error_raises_http_error(self, mock_post, client):
+        """Test every endpoint shares one error path carrying the response."""
+        mock_response = Mock(status_code=429, text="Too many requests")
+        mock_post.return_value = mock_response
+        
+        with pytest.raises(requests.HTTPError, match="API error 429: Too many requests") as exc_info:
+            client.update_voice_settings("voice1", {"stability": 0.5})
+        
+        assert exc_info.value.response is mock_response
+        mock_response.close.assert_called_once()
+    
+    @patch('requests.Session.post')
     def test_clone_voice_success(self, mock_post, client):
         """Test successful voice cloning from audio files."""
         mock_response = Mock()
@@ -90,7 +157,37 @@ class TestElevenLabsClient:
         mock_post.assert_called_once()
         assert mock_post.call_args[1]["files"] is not None
     
-    @patch('requests.post')
+    def test_clone_voice_sends_multipart_body(self, client):
+        """Test voice cloning overrides the session JSON content type."""
+        with patch.object(client._session, 'send') as mock_send:
+            mock_send.return_value = Mock(status_code=200, json=Mock(return_value={"voice_id": "v"}))
+            client.clone_voice("Clone", [b"audio"])
+        
+        prepared = mock_send.call_args[0][0]
+        assert prepared.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert prepared.headers["xi-api-key"] == client.api_key
+    
+    def test_clone_voice_never_retried(self, client):
+        """Test voice cloning uses an adapter without the retry policy."""
+        clone_adapter = client._session.get_adapter(f"{client.base_url}/voices/add")
+        
+        assert clone_adapter is not client._session.get_adapter(f"{client.base_url}/voices")
+        assert clone_adapter.max_retries.total == 0
+    
+    def test_clone_voice_streams_with_toolbelt(self, client):
+        """Test file samples are streamed through a multipart encoder when available."""
+        pytest.importorskip("requests_toolbelt")
+        import io
+        
+        with patch.object(client._session, 'send') as mock_send:
+            mock_send.return_value = Mock(status_code=200, json=Mock(return_value={"voice_id": "v"}))
+            client.clone_voice("Clone", [io.BytesIO(b"audio")])
+        
+        prepared = mock_send.call_args[0][0]
+        assert prepared.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert not isinstance(prepared.body, bytes)
+    
+    @patch('requests.Session.post')
     def test_synthesize_speech_success(self, mock_post, client):
         """Test successful speech synthesis."""
         mock_response = Mock()
@@ -104,24 +201,78 @@ class TestElevenLabsClient:
         audio_data = client.synthesize_speech(voice_id, text)
         
         assert audio_data == b"audio_data"
-        mock_post.assert_called_once_with(
-            f"{client.base_url}/text-to-speech/{voice_id}",
-            headers={
-                "xi-api-key": client.api_key,
-                "Content-Type": "application/json"
-            },
-            json={
-                "text": text,
-                "model_id": "eleven_multilingual_v2",
-                "voice_settings": {
-                    "stability": 0.75,
-                    "similarity_boost": 0.75,
-                    "style": 0.0,
-                    "use_speaker_boost": True
-                }
-            },
-            timeout=client.timeout
+        mock_post.assert_called_once()
+        args, kwargs = mock_post.call_args
+        assert args == (f"{client.base_url}/text-to-speech/{voice_id}",)
+        assert "headers" not in kwargs
+        assert kwargs["timeout"] == client.timeout
+        assert json.loads(kwargs["data"]) == {
+            "text": text,
+            "model_id": "eleven_multilingual_v2",
+            "voice_settings": {
+                "stability": 0.75,
+                "similarity_boost": 0.75,
+                "style": 0.0,
+                "use_speaker_boost": True
+            }
+        }
+    
+    @patch('requests.Session.post')
+    def test_synthesize_speech_stream(self, mock_post, client):
+        """Test streamed synthesis yields chunks from a streaming request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = iter([b"audio_", b"data"])
+        mock_response.__enter__.return_value = mock_response
+        mock_post.return_value = mock_response
+        
+        chunks = list(client.synthesize_speech_stream("voice123", "Hello"))
+        
+        assert b"".join(chunks) == b"audio_data"
+        assert mock_post.call_args[1]["stream"] is True
+        mock_response.iter_content.assert_called_once_with(chunk_size=4096)
+    
+    def test_json_body_encoding_matches_stdlib(self):
+        """Test request bodies decode to the same JSON with or without orjson."""
+        from src.services.voice import elevenlabs_client
+        payload = {"text": "Café ☕", "voice_settings": {"stability": 0.5, "use_speaker_boost": True}}
+        
+        assert json.loads(elevenlabs_client._dumps(payload)) == payload
+        with patch.object(elevenlabs_client, 'ORJSON_AVAILABLE', False):
+            assert json.loads(elevenlabs_client._dumps(payload)) == payload
+    
+    @pytest.mark.asyncio
+    async def test_async_client_calls(self, client):
+        """Test async variants share the TTL cache and report API errors."""
+        import httpx
+        requests_seen = []
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append((request.method, request.url.path))
+            assert request.headers["xi-api-key"] == client.api_key
+            if request.url.path.endswith("/voices"):
+                return httpx.Response(200, json={"voices": [{"voice_id": "voice1"}]})
+            if request.url.path.endswith("/bad"):
+                return httpx.Response(401, text="Unauthorized")
+            assert json.loads(request.content)["text"] == "Hello"
+            return httpx.Response(200, content=b"audio_data")
+        
+        client._aclient = httpx.AsyncClient(
+            base_url=client.base_url,
+            headers={"xi-api-key": client.api_key},
+            transport=httpx.MockTransport(handler)
         )
+        async with client:
+            assert await client.get_voices_async() == [{"voice_id": "voice1"}]
+            assert await client.get_voices_async() == [{"voice_id": "voice1"}]
+            assert await client.synthesize_speech_async("voice1", "Hello") == b"audio_data"
+            chunks = [chunk async for chunk in client.synthesize_speech_stream_async("voice1", "Hello", chunk_size=5)]
+            assert b"".join(chunks) == b"audio_data"
+            with pytest.raises(httpx.HTTPStatusError, match="API error 401"):
+                await client.synthesize_speech_async("bad", "Hello")
+        
+        assert requests_seen.count(("GET", "/v1/voices")) == 1
+        assert client._aclient is None
     
     def test_synthesize_speech_empty_text(self, client):
         """Test error handling for empty text input."""
@@ -175,6 +326,16 @@ class TestVoiceModel:
         assert isinstance(characteristics["pitch"], str)
         assert characteristics["pitch"] in ["low", "medium", "high"]
     
+    def test_voice_characteristics_shared_and_read_only(self, sample_business_data):
+        """Test tones map to shared read-only characteristics with a steady default."""
+        model = VoiceModel(sample_business_data)
+        unknown = VoiceModel({**sample_business_data, "tone": "whimsical"})
+        
+        assert model.get_voice_characteristics() is unknown.get_voice_characteristics()
+        assert VoiceModel({**sample_business_data, "tone": "casual"}).get_voice_characteristics()["pace"] == "quick"
+        with pytest.raises(TypeError):
+            model.get_voice_characteristics()["pitch"] = "low"
+    
     def test_generate_sample_scripts(self, sample_business_data):
         """Test generation of sample scripts for voice training."""
         model = VoiceModel(sample_business_data)
@@ -187,12 +348,54 @@ class TestVoiceModel:
             assert len(script) > 20  # Reasonable length for training
             assert "TechCorp" in script  # Company name should be included
     
+    def test_sample_scripts_fill_every_placeholder(self, sample_business_data):
+        """Test templated scripts substitute the business data, including braces in values."""
+        model = VoiceModel({**sample_business_data, "company_name": "{Tech}Corp"})
+        
+        scripts = model.generate_sample_scripts()
+        
+        assert scripts[0].startswith("Hello, welcome to {Tech}Corp. We're leaders in the Technology industry")
+        assert "We're innovative and trustworthy and approachable," in scripts[2]
+        assert scripts[3].endswith("business professionals with professional service.")
+    
     def test_voice_model_missing_required_fields(self):
         """Test error handling for missing required business data."""
         incomplete_data = {"company_name": "TechCorp"}
         
         with pytest.raises(ValueError, match="Missing required fields"):
             VoiceModel(incomplete_data)
+        with pytest.raises(ValueError, match=r"\['industry', 'tone', 'target_audience', 'brand_personality'\]"):
+            VoiceModel(incomplete_data)
+    
+    def test_to_dict_serializes_enum_values(self, sample_business_data):
+        """Test provider and voice type serialize to plain values whether given as enums or strings."""
+        from src.services.voice.voice_model import VoiceType
+        
+        default = VoiceModel(sample_business_data).to_dict()
+        explicit = VoiceModel({**sample_business_data, "provider": "azure", "voice_type": VoiceType.CLONED}).to_dict()
+        
+        assert (default["provider"], default["voice_type"]) == ("elevenlabs", "generated")
+        assert (explicit["provider"], explicit["voice_type"]) == ("azure", "cloned")
+    
+    def test_voice_id_defaults_from_company_name(self, sample_business_data):
+        """Test the voice id is derived only when none is supplied."""
+        assert VoiceModel(sample_business_data).voice_id == "voice_techcorp"
+        assert VoiceModel({**sample_business_data, "voice_id": "v1"}).voice_id == "v1"
+    
+    def test_voice_configuration_round_trip(self):
+        """Test voice configurations serialize every field and load back, defaulting settings."""
+        from dataclasses import fields
+        from src.services.voice.voice_model import VoiceConfiguration, VoiceProvider, VoiceType
+        
+        config = VoiceConfiguration("v1", "Narrator", VoiceProvider.AZURE, VoiceType.CLONED, gender="female")
+        data = config.to_dict()
+        
+        assert list(data) == [field.name for field in fields(VoiceConfiguration)]
+        assert VoiceConfiguration.from_dict(data) == config
+        
+        minimal = VoiceConfiguration.from_dict({"voice_id": "v2", "name": "n", "provider": "google", "voice_type": "premade"})
+        assert minimal.settings == {}
+        assert minimal.settings is not VoiceConfiguration.from_dict(data).settings
 
 
 class TestVoiceConfig:
@@ -274,6 +477,66 @@ class TestVoiceConfig:
         assert config.style >= 0.5      # High expressiveness
         assert config.use_speaker_boost is True
     
+    def test_from_personality_presets_shared_and_immutable(self):
+        """Test personality presets are shared instances that cannot be modified."""
+        config = VoiceConfig.from_personality("calm")
+        
+        assert VoiceConfig.from_personality("calm") is config
+        with pytest.raises(AttributeError):
+            config.stability = 0.1
+        assert config.stability == 0.9
+    
+    def test_from_business_context_adjustments(self):
+        """Test industry, tone, audience and brand traits each adjust the config."""
+        config = VoiceConfig.from_business_context(
+            industry="Retail and Finance",
+            tone="Friendly but Formal",
+            target_audience="Seniors",
+            brand_personality=["Calm"]
+        )
+        
+        # Table order decides ties: finance before retail, formal before friendly
+        assert config.stability == pytest.approx(1.0)
+        assert config.style == pytest.approx(0.0)
+        assert config.use_speaker_boost is False
+        
+        adjusted = config.adjust_for_content_type("conversation")
+        assert adjusted.stability == 0.65
+        assert config.adjust_for_content_type("unknown") is config
+    
+    def test_business_context_keyword_priority(self):
+        """Test keyword matches follow table order, not position in the text."""
+        assert VoiceConfig.from_business_context(
+            industry="Legal services for finance teams", tone="", target_audience=""
+        ).stability == 0.85
+        assert VoiceConfig.from_business_context(
+            industry="", tone="", target_audience="Young leadership\nprogram"
+        ).style == pytest.approx(0.2)
+        assert VoiceConfig.from_business_context(
+            industry="Aerospace", tone="Neutral", target_audience="Everyone"
+        ).to_dict() == VoiceConfig(style=0.3).to_dict()
+    
+    def test_derived_configs_match_validated_construction(self):
+        """Test configs built without re-validation match public construction."""
+        config = VoiceConfig.from_business_context(
+            industry="Technology", tone="Casual", target_audience="Young professionals"
+        )
+        expected = VoiceConfig(stability=0.6, similarity_boost=0.75, style=0.5)
+        
+        assert config.to_dict() == expected.to_dict()
+        assert str(config) == str(expected)
+        with pytest.raises(AttributeError):
+            config.style = 0.9
+    
+    def test_string_representation(self):
+        """Test str and repr describe every setting."""
+        config = VoiceConfig(stability=0.5, similarity_boost=0.8, style=0.2, use_speaker_boost=False)
+        expected = ("VoiceConfig(stability=0.5, similarity_boost=0.8, style=0.2, "
+                    "use_speaker_boost=False, model=eleven_multilingual_v2)")
+        
+        assert str(config) == expected
+        assert repr(config) == expected
+    
     def test_from_personality_unknown(self):
         """Test error handling for unknown personality."""
         with pytest.raises(ValueError, match="Unknown personality type"):
@@ -345,7 +608,7 @@ class TestErrorHandlingAndEdgeCases:
     
     def test_network_timeout_handling(self):
         """Test handling of network timeouts."""
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = Exception("Connection timeout")
             
             client = ElevenLabsClient("test-key")
@@ -357,7 +620,7 @@ class TestErrorHandlingAndEdgeCases:
         client = ElevenLabsClient("test-key")
         
         invalid_audio = [b"not_audio_data"]
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_response = Mock()
             mock_response.status_code = 400
             mock_response.text = "Invalid audio format"
@@ -373,7 +636,7 @@ class TestErrorHandlingAndEdgeCases:
         # Text longer than typical API limits
         very_long_text = "This is a test. " * 1000
         
-        with patch('requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_response = Mock()
             mock_response.status_code = 413
             mock_response.text = "Request entity too large"
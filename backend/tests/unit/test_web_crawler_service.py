@@ -5,7 +5,7 @@ Only mock external paid APIs if needed
 """
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from datetime import datetime
 from typing import Dict, Any, List
 
@@ -43,6 +43,20 @@ class TestWebCrawlerServiceCore:
         # Should have user agent configured
         assert hasattr(service, 'user_agent')
         assert len(service.user_agent) > 0
+    
+    @pytest.mark.asyncio
+    async def test_session_reused_with_pooled_connector(self):
+        """Test one pooled session is shared by every request the service makes"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        
+        session = await service._get_session()
+        try:
+            assert await service._get_session() is session
+            assert session.connector.limit_per_host == service.max_concurrent_requests
+            assert session.connector.limit >= service.max_concurrent_requests
+        finally:
+            await service.cleanup()
 
 
 class TestHTMLParsingReal:
@@ -77,6 +91,77 @@ class TestHTMLParsingReal:
         assert 'text_content' in result
         assert 'test content' in result['text_content'].lower()
     
+    def test_links_and_paragraphs_limited_in_document_order(self):
+        """Test only the first 50 links are collected and empty paragraphs are dropped"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        
+        links = ''.join(f'<a href="/page-{i}">Page {i}</a>' for i in range(80))
+        html_content = f"<html><body><p>  </p><p> First </p>{links}</body></html>"
+        
+        result = service.parse_html_content(html_content)
+        
+        assert len(result['links']) == 50
+        assert result['links'][0] == {'text': 'Page 0', 'href': '/page-0'}
+        assert result['links'][-1]['href'] == '/page-49'
+        assert result['paragraphs'] == ['First']
+    
+    def test_structured_data_parsed_with_fast_parser(self):
+        """Test lxml is preferred for parsing and JSON-LD organizations are extracted"""
+        from src.services import web_crawler_service
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        
+        html_content = """
+        <html><head>
+            <script type="application/ld+json">{"@type": "Organization", "name": "Acme", "telephone": "555-0100"}</script>
+        </head><body><p>Hi</p></body></html>
+        """
+        
+        if web_crawler_service.LXML_AVAILABLE:
+            assert web_crawler_service.HTML_PARSER == 'lxml'
+        organization = service.extract_structured_data(html_content)['organization']
+        assert organization['name'] == 'Acme'
+        assert organization['phone'] == '555-0100'
+    
+    def test_repeated_jsonld_parsed_once(self):
+        """Test identical JSON-LD blocks across pages are parsed once and not shared"""
+        from src.services.web_crawler_service import WebCrawlerService, _parse_jsonld_organization
+        service = WebCrawlerService()
+        _parse_jsonld_organization.cache_clear()
+        
+        html_content = """
+        <html><head>
+            <script type="application/ld+json">{"@type": "Organization", "name": "Repeat Co",
+                "address": {"@type": "PostalAddress", "addressLocality": "Springfield"}}</script>
+        </head><body><p>Page</p></body></html>
+        """
+        
+        first = service.extract_structured_data(html_content)['organization']
+        first['name'] = 'Mutated'
+        first['address']['addressLocality'] = 'Mutated'
+        second = service.extract_structured_data(html_content)['organization']
+        
+        assert second['name'] == 'Repeat Co'
+        assert second['address']['addressLocality'] == 'Springfield'
+        cache_info = _parse_jsonld_organization.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+    
+    def test_malformed_jsonld_skipped(self):
+        """Test broken JSON-LD blocks are skipped whichever JSON decoder is in use"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        
+        html_content = """
+        <html><head>
+            <script type="application/ld+json">{"@type": "Organization", "name": </script>
+            <script type="application/ld+json">{"@type": "Organization", "name": "Valid Co"}</script>
+        </head><body></body></html>
+        """
+        
+        assert service.extract_structured_data(html_content)['organization']['name'] == 'Valid Co'
+    
     def test_extract_contact_information_from_html(self):
         """Test extraction of contact info from HTML using real parsing"""
         from src.services.web_crawler_service import WebCrawlerService
@@ -255,6 +340,24 @@ class TestKnowledgeCategoryExtraction:
         starter_found = any('29' in pkg.get('price', '') for pkg in packages)
         professional_found = any('99' in pkg.get('price', '') for pkg in packages)
         assert starter_found and professional_found
+    
+    def test_validation_problems_logged_not_printed(self, caplog, capsys):
+        """Test invalid and unknown categories are reported through logging"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        
+        with caplog.at_level('WARNING', logger='src.services.web_crawler_service'):
+            validated = service.validate_crawled_content({
+                'company_overview': {'title': ''},
+                'made_up': {'title': 'A'},
+                'also_made_up': {'title': 'B'}
+            })
+        
+        assert validated == {}
+        assert capsys.readouterr().out == ''
+        messages = [record.getMessage() for record in caplog.records]
+        assert any(message.startswith('Validation error for company_overview') for message in messages)
+        assert 'Unknown categories: made_up, also_made_up' in messages
 
 
 class TestSitemapParsing:
@@ -293,6 +396,51 @@ class TestSitemapParsing:
         assert 'https://example.com/about' in urls
         assert 'https://example.com/products' in urls
     
+    @pytest.mark.asyncio
+    async def test_sitemap_streamed_in_chunks(self):
+        """Test sitemap.xml is parsed incrementally as chunks arrive"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        service.delay_between_requests = 0
+        
+        sitemap_xml = (
+            b'<?xml version="1.0" encoding="UTF-8"?>'
+            b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            + b''.join(b'<url><loc>https://example.com/page-%d</loc></url>' % i for i in range(50))
+            + b'</urlset>'
+        )
+        
+        async def iter_chunked(size):
+            for start in range(0, len(sitemap_xml), 37):
+                yield sitemap_xml[start:start + 37]
+        
+        response = MagicMock(status=200)
+        response.content.iter_chunked = iter_chunked
+        session = MagicMock()
+        session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+        session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+        
+        with patch.object(service, '_get_session', AsyncMock(return_value=session)):
+            urls = await service._fetch_sitemap_urls('https://example.com/sitemap.xml')
+        
+        assert urls == [f'https://example.com/page-{i}' for i in range(50)]
+        assert service.parse_sitemap_xml('<urlset><url>') == []
+    
+    def test_duplicate_sitemap_entries_dropped(self):
+        """Test URLs listed several times in a sitemap are returned once, in first-seen order"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        
+        sitemap_xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+            <url><loc>https://example.com/about</loc></url>
+            <url><loc>https://example.com/</loc></url>
+            <url><loc> https://example.com/about </loc></url>
+            <url><loc>https://example.com/</loc></url>
+        </urlset>"""
+        
+        assert service.parse_sitemap_xml(sitemap_xml) == ['https://example.com/about', 'https://example.com/']
+    
     def test_prioritize_urls_for_crawling(self):
         """Test URL prioritization based on sitemap priority and content type"""
         from src.services.web_crawler_service import WebCrawlerService
@@ -372,6 +520,59 @@ class TestCrawlingLimitsAndRespect:
             
             assert 'status_code' in result
             assert result['status_code'] == 404
+    
+    @pytest.mark.asyncio
+    async def test_oversized_page_truncated_while_streaming(self):
+        """Test page bodies are read in chunks and cut off at max_page_bytes"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        service.delay_between_requests = 0
+        service.max_page_bytes = 100
+        chunks_read = []
+        
+        async def iter_chunked(size):
+            for _ in range(10):
+                chunks_read.append(size)
+                yield b'<p>' + b'x' * 60 + b'</p>'
+        
+        response = MagicMock(status=200, charset=None, headers={}, url='https://example.com/big')
+        response.content.iter_chunked = iter_chunked
+        
+        with patch('aiohttp.ClientSession.get') as mock_get:
+            mock_get.return_value.__aenter__.return_value = response
+            result = await service.fetch_url_content('https://example.com/big')
+        
+        assert result['status_code'] == 200
+        assert len(result['content']) == 100
+        assert result['content'].startswith('<p>xxx')
+        assert len(chunks_read) == 2
+    
+    @pytest.mark.asyncio
+    async def test_page_charset_falls_back_to_meta_and_utf8(self):
+        """Test unknown header charsets are skipped and <meta charset> is honoured"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        service.delay_between_requests = 0
+        
+        def page_response(charset, body):
+            async def iter_chunked(size):
+                yield body
+            response = MagicMock(status=200, charset=charset, headers={}, url='https://example.com/')
+            response.content.iter_chunked = iter_chunked
+            return response
+        
+        latin1_page = '<meta charset="iso-8859-1"><p>Caf\u00e9</p>'.encode('iso-8859-1')
+        utf8_page = '<p>Caf\u00e9</p>'.encode('utf-8')
+        
+        with patch('aiohttp.ClientSession.get') as mock_get:
+            mock_get.return_value.__aenter__.return_value = page_response(None, latin1_page)
+            meta_result = await service.fetch_url_content('https://example.com/')
+            mock_get.return_value.__aenter__.return_value = page_response('x-unknown', utf8_page)
+            unknown_result = await service.fetch_url_content('https://example.com/')
+        
+        assert 'Caf\u00e9' in meta_result['content']
+        assert unknown_result['status_code'] == 200
+        assert unknown_result['content'] == '<p>Caf\u00e9</p>'
 
 
 class TestDatabaseIntegrationReal:
@@ -463,6 +664,198 @@ class TestFullCrawlingWorkflow:
         # Should have at least company or contact information
         assert len(result['knowledge_categories']) > 0
     
+    @pytest.mark.asyncio
+    async def test_sitemap_pages_fetched_concurrently(self):
+        """Test pages are fetched concurrently within the limit and categories merged across pages"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        service.max_concurrent_requests = 2
+        in_flight = []
+        peak = []
+        pages = {
+            'https://example.com/about': "<div id='about'><h2>About</h2><p>We are a company building innovative tools for small businesses.</p></div>",
+            'https://example.com/contact': "<div class='contact'><p>Phone: (555) 123-4567</p></div>"
+        }
+        
+        async def fetch(url):
+            in_flight.append(url)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(url)
+            return {'content': pages.get(url, '<p>Nothing here</p>'), 'status_code': 200}
+        
+        sitemap = ['https://example.com/about', 'https://example.com/contact', 'https://example.com/blog', 'https://example.com/team']
+        with patch.object(service, 'fetch_url_content', side_effect=fetch), \
+             patch.object(service, 'get_sitemap_urls', AsyncMock(return_value=sitemap)), \
+             patch.object(service, 'can_crawl_url', AsyncMock(return_value=True)):
+            result = await service.crawl_website_complete('https://example.com', max_pages=4)
+        
+        assert result['urls_crawled'] == 4
+        assert set(result['knowledge_categories']) == {'company_overview', 'contact_information'}
+        assert max(peak) == 2
+    
+    @pytest.mark.asyncio
+    async def test_sitemap_urls_restricted_to_site_and_robots(self):
+        """Test off-site sitemap URLs are dropped and robots.txt gates every sitemap page"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        fetched = []
+        
+        async def fetch(url):
+            fetched.append(url)
+            return {'content': '<p>Hello</p>', 'status_code': 200}
+        
+        async def can_crawl(url):
+            return not url.endswith('/private')
+        
+        sitemap = [
+            'http://169.254.169.254/latest/meta-data/',
+            'https://internal.example.net/admin',
+            'http://example.com/plain-http',
+            'https://EXAMPLE.com/about',
+            'https://example.com/private'
+        ]
+        with patch.object(service, 'fetch_url_content', side_effect=fetch), \
+             patch.object(service, 'get_sitemap_urls', AsyncMock(return_value=sitemap)), \
+             patch.object(service, 'can_crawl_url', side_effect=can_crawl):
+            result = await service.crawl_website_complete('https://example.com', max_pages=10)
+        
+        assert sorted(fetched) == ['https://EXAMPLE.com/about', 'https://example.com']
+        assert result['urls_crawled'] == 2
+    
+    @pytest.mark.asyncio
+    async def test_robots_txt_fetched_once_per_site(self):
+        """Test robots.txt is cached so each sitemap page does not refetch it"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        response = MagicMock(status=200)
+        response.text = AsyncMock(return_value="User-agent: *\nDisallow: /private")
+        
+        with patch('aiohttp.ClientSession.get') as mock_get:
+            mock_get.return_value.__aenter__.return_value = response
+            assert await service.can_crawl_url('https://example.com/about') is True
+            assert await service.can_crawl_url('https://example.com/private') is False
+        
+        assert mock_get.call_count == 1
+        await service.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_crawl_depth_converted_to_page_budget(self):
+        """Test crawl_website_async turns max_depth into a page budget, not a page count"""
+        from src.services.web_crawler_service import WebCrawlerService, PAGES_PER_DEPTH
+        service = WebCrawlerService()
+        
+        with patch.object(service, 'crawl_website_complete', AsyncMock(return_value={})) as complete:
+            await service.crawl_website_async('https://example.com', max_depth=3)
+        
+        complete.assert_awaited_once_with('https://example.com', 3 * PAGES_PER_DEPTH)
+    
+    @pytest.mark.asyncio
+    async def test_pages_parsed_off_the_event_loop(self):
+        """Test page parsing runs in worker threads while the loop keeps fetching"""
+        import threading
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        parse_threads = []
+        extract_page = service._extract_page
+        
+        def record_thread(result):
+            parse_threads.append(threading.current_thread())
+            return extract_page(result)
+        
+        fetch = AsyncMock(return_value={'content': '<p>Hello</p>', 'status_code': 200})
+        with patch.object(service, 'fetch_url_content', fetch), \
+             patch.object(service, '_extract_page', side_effect=record_thread), \
+             patch.object(service, 'get_sitemap_urls', AsyncMock(return_value=['https://example.com/a'])), \
+             patch.object(service, 'can_crawl_url', AsyncMock(return_value=True)):
+            result = await service.crawl_website_complete('https://example.com', max_pages=2)
+        
+        assert result['urls_crawled'] == 2
+        assert len(parse_threads) == 2
+        assert threading.main_thread() not in parse_threads
+    
+    @pytest.mark.asyncio
+    async def test_pages_parsed_in_process_pool(self):
+        """Test parse_processes moves page parsing into the shared process pool"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        service.parse_processes = 2
+        pages = {
+            'https://example.com': "<div id='about'><h2>About</h2><p>We are a company building innovative tools for small businesses.</p></div>",
+            'https://example.com/contact': "<div class='contact'><p>Phone: (555) 123-4567</p></div>"
+        }
+        
+        async def fetch(url):
+            return {'content': pages[url], 'status_code': 200}
+        
+        with patch.object(service, 'fetch_url_content', side_effect=fetch), \
+             patch.object(service, 'get_sitemap_urls', AsyncMock(return_value=['https://example.com/contact'])), \
+             patch.object(service, 'can_crawl_url', AsyncMock(return_value=True)):
+            result = await service.crawl_website_complete('https://example.com', max_pages=2)
+        
+        assert result['urls_crawled'] == 2
+        assert set(result['knowledge_categories']) == {'company_overview', 'contact_information'}
+        assert result['knowledge_categories']['contact_information']['title']
+        await service.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_shuts_down_process_pool(self):
+        """Test cleanup shuts the parse pool down and the next parse gets a fresh one"""
+        from src.services import web_crawler_service
+        service = web_crawler_service.WebCrawlerService()
+        service.parse_processes = 2
+        pool = web_crawler_service._shared_parse_pool(2)
+        
+        await service.cleanup()
+        
+        with pytest.raises(RuntimeError):
+            pool.submit(len, 'x')
+        fresh_pool = web_crawler_service._shared_parse_pool(2)
+        assert fresh_pool is not pool
+        await service.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_pages_reused_on_recrawl(self):
+        """Test a 304 on re-crawl reuses the earlier extraction instead of re-parsing"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        about = "<div id='about'><h2>About</h2><p>We are a company building innovative tools for small businesses.</p></div>"
+        responses = [
+            {'content': about, 'status_code': 200, 'headers': {'ETag': '"v1"'}},
+            {'content': '', 'status_code': 304, 'headers': {}}
+        ]
+        
+        with patch.object(service, 'fetch_url_content', AsyncMock(side_effect=responses)):
+            first = await service.crawl_website_complete('https://example.com', max_pages=1)
+            assert service._conditional_headers('https://example.com') == {'If-None-Match': '"v1"'}
+            first['knowledge_categories']['company_overview']['title'] = 'Changed by caller'
+            
+            with patch.object(service, '_extract_page') as extract_page:
+                second = await service.crawl_website_complete('https://example.com', max_pages=1)
+        
+        extract_page.assert_not_called()
+        assert second['urls_crawled'] == 1
+        assert second['knowledge_categories']['company_overview']['title'] != 'Changed by caller'
+        assert set(second['knowledge_categories']) == set(first['knowledge_categories'])
+    
+    @pytest.mark.asyncio
+    async def test_validator_headers_matched_case_insensitively(self):
+        """Test lowercase and Go-style validator header names are still remembered"""
+        from src.services.web_crawler_service import WebCrawlerService
+        service = WebCrawlerService()
+        about = "<div id='about'><h2>About</h2><p>We are a company building innovative tools for small businesses.</p></div>"
+        
+        page = await service._page_from_result('https://example.com/a', {
+            'content': about, 'status_code': 200,
+            'headers': {'etag': '"v2"', 'Last-modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        })
+        
+        assert page is not None
+        assert service._conditional_headers('https://example.com/a') == {
+            'If-None-Match': '"v2"',
+            'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'
+        }
+    
     def test_batch_crawling_multiple_urls(self):
         """Test batch crawling of multiple URLs"""
         from src.services.web_crawler_service import WebCrawlerService